@@ -0,0 +1,56 @@
+"""Measures the memory used per :class:`nextcore.http.Bucket`.
+
+The current bucket is compared to one that allocates its waiter queue, event and reserved list up front without
+``__slots__``, which is how buckets were created before.
+
+Run with ``python benchmarks/bucket_memory.py [bucket count]`` with nextcore installed.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from asyncio import Event, PriorityQueue
+
+from nextcore.http import Bucket, BucketMetadata
+
+
+class EagerBucket:
+    # The state Bucket.__init__ used to allocate for every bucket.
+    def __init__(self, metadata: BucketMetadata) -> None:
+        self.metadata = metadata
+        self._remaining = None
+        self._pending = PriorityQueue()
+        self._reserved = []
+        self._resetting = False
+        self._reset_handle = None
+        self._can_do_blind_request = Event()
+        self._merged_into = None
+
+        self._can_do_blind_request.set()
+
+
+def bytes_per_bucket(bucket_type: type, count: int) -> float:
+    metadata = BucketMetadata(5)
+
+    tracemalloc.start()
+    buckets = [bucket_type(metadata) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del buckets
+    return size / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    eager = bytes_per_bucket(EagerBucket, count)
+    compact = bytes_per_bucket(Bucket, count)
+    print(f"{count} buckets")
+    print(f"eager:   {eager:7.1f} bytes per bucket")
+    print(f"compact: {compact:7.1f} bytes per bucket ({eager / compact:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
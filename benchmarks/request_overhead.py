@@ -0,0 +1,89 @@
+"""Measures the per request overhead of :meth:`nextcore.http.HTTPClient._request` without any network.
+
+The in-memory :class:`nextcore.http.RateLimitStorage` is compared to the same storage forced onto the async path,
+which is what every request paid for before ``RateLimitStorage.supports_nowait`` existed.
+
+Run with ``python benchmarks/request_overhead.py`` with nextcore installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from multidict import CIMultiDict
+
+from nextcore.http import (
+    HTTPClient,
+    RateLimitStorage,
+    Route,
+    UnlimitedGlobalRateLimiter,
+)
+
+REQUESTS = 50_000
+
+
+class AsyncOnlyRateLimitStorage(RateLimitStorage):
+    __slots__ = ()
+
+    supports_nowait = False
+
+
+class FakeResponse:
+    __slots__ = ("status", "headers")
+
+    def __init__(self) -> None:
+        self.status = 200
+        self.headers = CIMultiDict(
+            {
+                "X-RateLimit-Remaining": "4",
+                "X-RateLimit-Limit": "5",
+                "X-RateLimit-Reset-After": "1",
+                "X-RateLimit-Reset": "0",
+                "X-RateLimit-Bucket": "abcd",
+            }
+        )
+
+
+class FakeSession:
+    __slots__ = ("closed", "response")
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.response = FakeResponse()
+
+    async def request(self, *args: object, **kwargs: object) -> FakeResponse:
+        return self.response
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def measure(storage_type: type[RateLimitStorage]) -> float:
+    http_client = HTTPClient(seed_bucket_metadata=False)
+    http_client._session = FakeSession()  # type: ignore [assignment]
+    storage = storage_type()
+    storage.global_rate_limiter = UnlimitedGlobalRateLimiter()
+    http_client.rate_limit_storages[None] = storage
+
+    route = Route("GET", "/channels/{channel_id}", channel_id=1)
+    await http_client._request(route, None)  # Create the bucket
+
+    started_at = perf_counter()
+    for _ in range(REQUESTS):
+        await http_client._request(route, None)
+    elapsed = perf_counter() - started_at
+
+    await http_client.close()
+    return elapsed / REQUESTS
+
+
+async def main() -> None:
+    before = min([await measure(AsyncOnlyRateLimitStorage) for _ in range(3)])
+    after = min([await measure(RateLimitStorage) for _ in range(3)])
+    print(f"async lookups:  {before * 1e6:6.2f}us per request")
+    print(f"nowait lookups: {after * 1e6:6.2f}us per request ({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Compares :class:`nextcore.http.Route` construction against the previous implementation.
+
+Run with ``python benchmarks/route_construction.py`` with nextcore installed.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from timeit import repeat
+
+from nextcore.http import Route
+
+ITERATIONS = 200_000
+
+
+class OldRoute:
+    # The Route implementation before paths were compiled and bucket keys became tuples.
+    __slots__ = ("method", "route", "path", "ignore_global", "bucket")
+
+    def __init__(
+        self,
+        method,
+        path,
+        *,
+        ignore_global=False,
+        guild_id=None,
+        channel_id=None,
+        webhook_id=None,
+        webhook_token=None,
+        **parameters,
+    ):
+        self.method = method
+        self.route = path
+        self.path = path.format(
+            guild_id=guild_id, channel_id=channel_id, webhook_id=webhook_id, webhook_token=webhook_token, **parameters
+        )
+        self.ignore_global = ignore_global
+
+        self.bucket = f"{guild_id}{channel_id}{webhook_id}{webhook_token}{method}{path}"
+
+
+CASES = {
+    "channel message": lambda cls: cls(
+        "GET",
+        "/channels/{channel_id}/messages/{message_id}",
+        channel_id=881238372117307402,
+        message_id=1028683012397813801,
+    ),
+    "execute webhook": lambda cls: cls(
+        "POST",
+        "/webhooks/{webhook_id}/{webhook_token}",
+        webhook_id=1028683012397813801,
+        webhook_token="x" * 68,
+        ignore_global=True,
+    ),
+}
+
+
+def bucket_memory(cls: type, create) -> int:
+    # The size of 1000 distinct bucket keys, as they would be kept alive by a RateLimitStorage.
+    tracemalloc.start()
+    keys = [create(cls, index).bucket for index in range(1000)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keys
+    return size
+
+
+def main() -> None:
+    print(f"Python {sys.version.split()[0]}, {ITERATIONS} iterations, best of 5")
+    for name, case in CASES.items():
+        old = min(repeat(lambda: case(OldRoute), number=ITERATIONS, repeat=5))
+        new = min(repeat(lambda: case(Route), number=ITERATIONS, repeat=5))
+        print(
+            f"{name:>16}: old {old / ITERATIONS * 1e9:6.0f}ns  new {new / ITERATIONS * 1e9:6.0f}ns  ({old / new:.2f}x)"
+        )
+
+    def distinct_webhook(cls: type, index: int):
+        return cls("POST", "/webhooks/{webhook_id}/{webhook_token}", webhook_id=index, webhook_token="x" * 68)
+
+    old_memory = bucket_memory(OldRoute, distinct_webhook)
+    new_memory = bucket_memory(Route, distinct_webhook)
+    print(f"{'1000 bucket keys':>16}: old {old_memory / 1024:6.1f}KiB new {new_memory / 1024:6.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures :class:`nextcore.common.TimesPer` acquire and release throughput for each algorithm.
+
+``uncontended`` never has to wait. ``contended`` has 1000 tasks waiting on a limiter allowing 100 uses per 10ms,
+so at most 10000 uses/s can be reached. Pacing lets one use through per wake up, so it is bound by the event loop
+timer resolution (1ms with epoll) at this rate.
+
+Run with ``python benchmarks/times_per_throughput.py`` with nextcore installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from nextcore.common import TimesPer
+
+ALGORITHMS = ("fixed_window", "sliding_log", "pacing")
+USES = 200_000
+
+
+async def uncontended(algorithm: str) -> float:
+    rate_limiter = TimesPer(10**9, 1, algorithm=algorithm)  # type: ignore [arg-type]
+
+    started_at = perf_counter()
+    for _ in range(USES):
+        async with rate_limiter.acquire():
+            ...
+    return USES / (perf_counter() - started_at)
+
+
+async def contended(algorithm: str) -> float:
+    rate_limiter = TimesPer(100, 0.01, algorithm=algorithm)  # type: ignore [arg-type]
+
+    async def use() -> None:
+        async with rate_limiter.acquire():
+            ...
+
+    started_at = perf_counter()
+    await asyncio.gather(*[use() for _ in range(1000)])
+    return 1000 / (perf_counter() - started_at)
+
+
+async def main() -> None:
+    for algorithm in ALGORITHMS:
+        print(
+            f"{algorithm:>12}: uncontended {await uncontended(algorithm):9.0f} uses/s"
+            f"  contended {await contended(algorithm):7.0f} uses/s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -28,10 +28,22 @@ from typing import TYPE_CHECKING
 from .dispatcher import Dispatcher
 from .json import *
 from .maybe_coro import *
+from .timer_wheel import *
 from .times_per import *
 from .undefined import *
+from .waiter_queue import *
 
 if TYPE_CHECKING:
     from typing import Final
 
-__all__: Final[tuple[str, ...]] = ("Dispatcher", "json_loads", "json_dumps", "maybe_coro", "UndefinedType", "UNDEFINED")
+__all__: Final[tuple[str, ...]] = (
+    "Dispatcher",
+    "json_loads",
+    "json_dumps",
+    "maybe_coro",
+    "TimerWheel",
+    "TimerWheelHandle",
+    "UndefinedType",
+    "UNDEFINED",
+    "WaiterQueue",
+)
@@ -0,0 +1,189 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from heapq import heappop, heappush
+from math import ceil, floor
+from typing import TYPE_CHECKING, cast
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, TimerHandle
+    from typing import Callable, Final
+
+__all__: Final[tuple[str, ...]] = ("TimerWheel", "TimerWheelHandle")
+
+_wheels: WeakKeyDictionary[AbstractEventLoop, TimerWheel] = WeakKeyDictionary()
+
+
+class TimerWheelHandle:
+    """A callback scheduled with :class:`TimerWheel`.
+
+    Attributes
+    ----------
+    cancelled:
+        Whether :meth:`TimerWheelHandle.cancel` was called.
+    """
+
+    __slots__ = ("_when", "_callback", "cancelled")
+
+    def __init__(self, when: float, callback: Callable[[], object]) -> None:
+        self._when: float = when
+        self._callback: Callable[[], object] | None = callback
+        self.cancelled: bool = False
+
+    def when(self) -> float:
+        """The loop time the callback was scheduled for.
+
+        The callback may run up to :attr:`TimerWheel.resolution` seconds after this, but never before.
+        """
+        return self._when
+
+    def cancel(self) -> None:
+        """Stop the callback from running."""
+        self.cancelled = True
+        self._callback = None  # Don't keep what the callback references alive until the tick
+
+
+class TimerWheel:
+    """Runs callbacks after a delay, batched into ticks.
+
+    Every callback due in the same tick runs in one batch, and only one :class:`asyncio.TimerHandle` is scheduled
+    on the event loop at a time. This is used for rate limit resets, where there can be tens of thousands pending.
+
+    .. note::
+        Callbacks are rounded up to the next tick, so they may run up to ``resolution`` seconds late but never early.
+
+    Parameters
+    ----------
+    resolution:
+        The length of a tick in seconds.
+
+    Attributes
+    ----------
+    resolution:
+        The length of a tick in seconds.
+    """
+
+    __slots__ = ("resolution", "_slots", "_ticks", "_handle", "_handle_tick")
+
+    def __init__(self, resolution: float = 0.01) -> None:
+        self.resolution: float = resolution
+        self._slots: dict[int, list[TimerWheelHandle]] = {}
+        self._ticks: list[int] = []  # A heap of the keys in _slots
+        self._handle: TimerHandle | None = None
+        self._handle_tick: int | None = None
+
+    @classmethod
+    def for_loop(cls, loop: AbstractEventLoop | None = None) -> TimerWheel:
+        """Get the timer wheel shared by everything on a event loop.
+
+        Parameters
+        ----------
+        loop:
+            The event loop. Defaults to the running loop.
+        """
+        if loop is None:
+            loop = get_running_loop()
+        try:
+            return _wheels[loop]
+        except KeyError:
+            wheel = _wheels[loop] = cls()
+            return wheel
+
+    def call_later(self, delay: float, callback: Callable[[], object]) -> TimerWheelHandle:
+        """Run a callback after ``delay`` seconds.
+
+        This has to be called from inside the event loop.
+
+        Parameters
+        ----------
+        delay:
+            How long to wait in seconds.
+        callback:
+            The function to call.
+        """
+        return self.call_at(get_running_loop().time() + delay, callback)
+
+    def call_at(self, when: float, callback: Callable[[], object]) -> TimerWheelHandle:
+        """Run a callback at a loop time.
+
+        This has to be called from inside the event loop.
+
+        Parameters
+        ----------
+        when:
+            The loop time to run the callback at. See :meth:`asyncio.loop.time`.
+        callback:
+            The function to call.
+        """
+        handle = TimerWheelHandle(when, callback)
+        tick = ceil(when / self.resolution)
+
+        slot = self._slots.get(tick)
+        if slot is None:
+            self._slots[tick] = [handle]
+            heappush(self._ticks, tick)
+
+            if self._handle_tick is None or tick < self._handle_tick:
+                self._schedule(tick)
+        else:
+            slot.append(handle)
+        return handle
+
+    def _schedule(self, tick: int) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_tick = tick
+        self._handle = get_running_loop().call_at(tick * self.resolution, self._run)
+
+    def _run(self) -> None:
+        # The loop may run the handle slightly before the tick time due to its clock resolution, so the scheduled tick
+        # is always run.
+        loop = get_running_loop()
+        current_tick = max(cast(int, self._handle_tick), floor(loop.time() / self.resolution))
+        self._handle = None
+        self._handle_tick = None
+
+        while self._ticks and self._ticks[0] <= current_tick:
+            tick = heappop(self._ticks)
+            handles = self._slots.pop(tick)
+            if len(handles) > 1:
+                # Callbacks added later can be due earlier in the same tick. This is almost sorted, so it is cheap.
+                handles.sort(key=TimerWheelHandle.when)
+            for handle in handles:
+                callback = handle._callback
+                if callback is None:
+                    continue  # Cancelled
+                handle._callback = None
+                try:
+                    callback()
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except BaseException as error:
+                    loop.call_exception_handler(
+                        {"message": f"Exception in timer wheel callback {callback!r}", "exception": error}
+                    )
+
+        if self._ticks:
+            self._schedule(self._ticks[0])
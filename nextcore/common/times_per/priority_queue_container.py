@@ -46,13 +46,22 @@ class PriorityQueueContainer:
         The request priority. This will be compared!
     future:
         The future for when the request is done
+    held_back:
+        The share of the limit the request can not use, as it is kept free for more important requests.
+    queued:
+        Whether this is currently in a :class:`~nextcore.common.WaiterQueue`.
+    started_at:
+        When the request was let through, in :func:`time.monotonic` time.
     """
 
-    __slots__: tuple[str, ...] = ("priority", "future")
+    __slots__: tuple[str, ...] = ("priority", "future", "held_back", "queued", "started_at")
 
-    def __init__(self, priority: int, future: Future[None]) -> None:
+    def __init__(self, priority: int, future: Future[None], held_back: float = 0) -> None:
         self.priority: int = priority
         self.future: Future[None] = future
+        self.held_back: float = held_back
+        self.queued: bool = False
+        self.started_at: float = 0
 
     def __gt__(self, other: PriorityQueueContainer):
         return self.priority > other.priority
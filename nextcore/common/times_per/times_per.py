@@ -19,19 +19,24 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+
 from __future__ import annotations
 
-from asyncio import Future, get_running_loop
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
 from contextlib import asynccontextmanager
 from logging import getLogger
-from queue import PriorityQueue
+from time import monotonic
 from typing import TYPE_CHECKING, AsyncIterator
 
 from ..errors import RateLimitedError
+from ..timer_wheel import TimerWheel
+from ..waiter_queue import WaiterQueue
 from .priority_queue_container import PriorityQueueContainer
 
 if TYPE_CHECKING:
-    from typing import Final
+    from asyncio import TimerHandle
+    from typing import Final, Literal
 
 __all__: Final[tuple[str, ...]] = ("TimesPer",)
 
@@ -47,20 +52,73 @@ class TimesPer:
         The amount of times the rate limiter can be used
     per:
         How often this resets in seconds
+    algorithm:
+        How uses are spread out over time.
+
+        - ``"fixed_window"``: ``limit`` uses per window. A window starts when the first use finishes.
+          This allows a burst of ``limit`` uses at the start of every window.
+        - ``"sliding_log"``: At most ``limit`` uses in any ``per`` seconds. This avoids double bursts at window borders.
+        - ``"pacing"``: One use every ``per / limit`` seconds. This trades bursts for an even spacing and flat latency.
+    lend_held_after:
+        The share of a window after which spots held back for more important uses are lent out, if they are still unused.
+
+        This is only used with the ``"fixed_window"`` algorithm, the other algorithms always keep the spots free.
+
+    Attributes
+    ----------
+    limit:
+        The amount of times the rate limiter can be used
+    per:
+        How often this resets in seconds
+    algorithm:
+        How uses are spread out over time.
+    remaining:
+        The uses left in the current window. This is only updated with the ``"fixed_window"`` algorithm.
+    lend_held_after:
+        The share of a window after which spots held back for more important uses are lent out, if they are still unused.
     """
 
-    __slots__ = ("limit", "per", "remaining", "_pending", "_in_progress", "_pending_reset")
+    __slots__ = (
+        "limit",
+        "per",
+        "algorithm",
+        "lend_held_after",
+        "remaining",
+        "_pending",
+        "_in_progress",
+        "_pending_reset",
+        "_reset_at",
+        "_log",
+        "_theoretical_arrival",
+        "_wake_handle",
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        per: float,
+        *,
+        algorithm: Literal["fixed_window", "sliding_log", "pacing"] = "fixed_window",
+        lend_held_after: float = 0.8,
+    ) -> None:
+        if algorithm not in ("fixed_window", "sliding_log", "pacing"):
+            raise ValueError(f"Unknown algorithm {algorithm!r}")
 
-    def __init__(self, limit: int, per: float) -> None:
         self.limit: int = limit
         self.per: float = per
+        self.algorithm: Literal["fixed_window", "sliding_log", "pacing"] = algorithm
+        self.lend_held_after: float = lend_held_after
         self.remaining: int = limit
-        self._pending: PriorityQueue[PriorityQueueContainer] = PriorityQueue()
+        self._pending: WaiterQueue[PriorityQueueContainer] = WaiterQueue()
         self._in_progress: int = 0
         self._pending_reset: bool = False
+        self._reset_at: float = 0  # When the pending reset is, for estimates
+        self._log: deque[float] = deque()  # When each use in the last per seconds started, for sliding_log
+        self._theoretical_arrival: float = 0  # When the next use is allowed, for pacing
+        self._wake_handle: TimerHandle | None = None
 
     @asynccontextmanager
-    async def acquire(self, *, priority: int = 0, wait: bool = True) -> AsyncIterator[None]:
+    async def acquire(self, *, priority: int = 0, wait: bool = True, held_back: float = 0) -> AsyncIterator[None]:
         """Use a spot in the rate-limit.
 
         Parameters
@@ -71,6 +129,10 @@ class TimesPer:
             Wait for a spot in the rate limit.
 
             If this is :data:`False`, this will raise :exc:`RateLimitedError` instead.
+        held_back:
+            The share of the limit this use can not use, as it is kept free for more important uses.
+
+            This is rounded down to whole uses.
 
         Raises
         ------
@@ -81,71 +143,182 @@ class TimesPer:
         :class:`typing.AsyncContextManager`
             A context manager that will wait in __aenter__ until a request should be made.
         """
-
-        calculated_remaining = self.remaining - self._in_progress
-        logger.debug("Calculated remaining: %s", calculated_remaining)
-        logger.debug("Reserved requests: %s", self._in_progress)
-
-        if calculated_remaining == 0:
+        now = monotonic()
+        held = self._held_spots(held_back, now)
+        if not self._pending and self._available(now, held):
+            started_at = self._take(now)
+        else:
             if not wait:
                 raise RateLimitedError()
 
             # Wait for a spot
-            future: Future[None] = Future()
-            item = PriorityQueueContainer(priority, future)
-
-            self._pending.put_nowait(item)
+            container = PriorityQueueContainer(priority, Future(), held_back)
+            self._pending.push(container)
+            if self._pending.peek() is container:
+                # The request that was first may have been waiting for spots kept free for more important requests.
+                self._release_pending()
+            else:
+                self._schedule_wake(now)
 
             logger.debug("Added request to queue with priority %s", priority)
-            await future
+            try:
+                await container.future
+            except CancelledError:
+                if not self._pending.remove(container):
+                    # Cancelled after being let through, give the spot to the next request instead.
+                    self._undo(container.started_at)
+                    self._release_pending()
+                raise
             logger.debug("Out of queue, doing request")
+            started_at = container.started_at
 
-        self._in_progress += 1
         try:
             yield None
         except:
             # A exception occured. This will not take from the rate-limit, and as so we have to re-allow a request to run
-            if self._pending.qsize() != 0:
-                container = self._pending.get_nowait()
-                future = container.future
-
-                # Mark it as completed, good practice (and saves a bit of memory due to a infinitly expanding int)
-                self._pending.task_done()
-
-                # Release it and allow further requests
-                future.set_result(None)
-
+            self._undo(started_at)
             raise  # Re-raise exception
+        else:
+            self._in_progress -= 1
+            if self.algorithm == "fixed_window":
+                self.remaining -= 1
         finally:
             # Start a reset task
-            if not self._pending_reset:
+            if self.algorithm == "fixed_window" and not self._pending_reset:
                 self._pending_reset = True
-                loop = get_running_loop()
-                loop.call_later(self.per, self._reset)
+                self._reset_at = monotonic() + self.per
+                TimerWheel.for_loop().call_later(self.per, self._reset)
 
-            self._in_progress -= 1
+            self._release_pending()
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Estimate how many seconds a new use would have to wait for a spot.
+
+        This is a lower bound, as uses in progress may not finish in time and uses with a lower priority number may come in.
+
+        Parameters
+        ----------
+        priority:
+            The priority the use would have.
+        """
+        now = monotonic()
+        if not self._pending and self._available(now):
+            return 0
+        ahead = self._pending.ahead_of(priority) if self._pending else 0
+
+        if self.algorithm == "fixed_window":
+            free = max(self.remaining - self._in_progress, 0)
+            if ahead < free:
+                return 0
+            # The current window has to end, and then a window for every limit uses still ahead.
+            first_reset = self._reset_at - now if self._pending_reset else self.per
+            return max(first_reset, 0) + (ahead - free) // self.limit * self.per
+        if self.algorithm == "sliding_log":
+            log = self._log
+            # The use at this index of the log has to expire before there is a spot for us.
+            index = len(log) + ahead - self.limit
+            if index < 0:
+                return 0
+            if index < len(log):
+                return max(log[index] + self.per - now, 0)
+            return index // self.limit * self.per
+        return max(self._theoretical_arrival - now, 0) + ahead * self.per / self.limit
+
+    def _available(self, now: float, held: int = 0) -> bool:
+        # held is how many spots have to stay free for more important uses
+        if self.algorithm == "fixed_window":
+            return self.remaining - self._in_progress > held
+        if self.algorithm == "sliding_log":
+            log = self._log
+            expired_before = now - self.per
+            while log and log[0] <= expired_before:
+                log.popleft()
+            return len(log) < self.limit - held
+        return self._theoretical_arrival + held * self.per / self.limit <= now
+
+    def _held(self, container: PriorityQueueContainer, now: float) -> int:
+        return self._held_spots(container.held_back, now)
+
+    def _held_spots(self, held_back: float, now: float) -> int:
+        if not held_back:
+            return 0
+        if self.algorithm == "fixed_window" and self._pending_reset and now >= self._lend_at():
+            return 0  # Late in the window, spots that are still free would go unused.
+        return int(held_back * self.limit)
+
+    def _lend_at(self) -> float:
+        return self._reset_at - self.per * (1 - self.lend_held_after)
+
+    def _take(self, now: float) -> float:
+        self._in_progress += 1
+        if self.algorithm == "sliding_log":
+            self._log.append(now)
+        elif self.algorithm == "pacing":
+            self._theoretical_arrival = max(self._theoretical_arrival, now) + self.per / self.limit
+        return now
+
+    def _undo(self, started_at: float) -> None:
+        self._in_progress -= 1
+        if self.algorithm == "sliding_log":
+            try:
+                self._log.remove(started_at)
+            except ValueError:
+                pass  # Already expired
+        elif self.algorithm == "pacing":
+            self._theoretical_arrival -= self.per / self.limit
+
+    def _release_pending(self) -> None:
+        if not self._pending:
+            return
+
+        now = monotonic()
+        released = 0
+        while self._pending and self._available(now, self._held(self._pending.peek(), now)):
+            container = self._pending.pop()
+            container.started_at = self._take(now)
 
-        # This only gets called if no exception got raised.
-        self.remaining -= 1
+            # Release it and allow further requests
+            container.future.set_result(None)
+            released += 1
+        logger.debug("Released %s requests", released)
+
+        self._schedule_wake(now)
+
+    def _schedule_wake(self, now: float) -> None:
+        if self._wake_handle is not None or not self._pending:
+            return
+
+        held = self._held(self._pending.peek(), now)
+        if self.algorithm == "fixed_window":
+            # Fixed windows release waiters on reset, or when the held back spots are lent out.
+            if not held or not self._pending_reset or self.remaining - self._in_progress <= 0:
+                return
+            delay = self._lend_at() - now
+        elif self.algorithm == "sliding_log":
+            if not self._log:
+                return  # Waiting for uses in progress to finish
+            # Enough uses have to expire to leave the held spots free
+            delay = self._log[max(len(self._log) - self.limit + held, 0)] + self.per - now
+        else:
+            delay = self._theoretical_arrival + held * self.per / self.limit - now
+        # There is only one of these per TimesPer, and pacing needs more precision than the timer wheel gives.
+        self._wake_handle = get_running_loop().call_later(max(delay, 0), self._wake)
+
+    def _wake(self) -> None:
+        self._wake_handle = None
+        self._release_pending()
 
     def _reset(self) -> None:
         self._pending_reset = False
+        if self._wake_handle is not None:
+            # Waiting to lend out the held back spots of the window that just ended.
+            self._wake_handle.cancel()
+            self._wake_handle = None
 
         self.remaining = self.limit
+        self._release_pending()
 
-        to_release = min(self._pending.qsize(), self.remaining - self._in_progress)
-        logger.debug("Releasing %s requests", to_release)
-        for _ in range(to_release):
-            container = self._pending.get_nowait()
-            future = container.future
-
-            # Mark it as completed, good practice (and saves a bit of memory due to a infinitly expanding int)
-            self._pending.task_done()
-
-            # Release it and allow further requests
-            future.set_result(None)
-        if self._pending.qsize():
+        if self._pending:
             self._pending_reset = True
-
-            loop = get_running_loop()
-            loop.call_later(self.per, self._reset)
+            self._reset_at = monotonic() + self.per
+            TimerWheel.for_loop().call_later(self.per, self._reset)
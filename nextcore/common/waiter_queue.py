@@ -0,0 +1,180 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from __future__ import annotations
+
+from heapq import heapify, heappop, heappush
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from typing import Final, Iterator
+
+    from typing_extensions import Protocol
+
+    class _Waiter(Protocol):
+        priority: int
+        queued: bool
+
+
+__all__: Final[tuple[str, ...]] = ("WaiterQueue",)
+
+WaiterT = TypeVar("WaiterT", bound="_Waiter")
+
+
+class WaiterQueue(Generic[WaiterT]):
+    """A priority queue of sessions waiting for a spot in a rate limit.
+
+    This is used with :class:`~nextcore.http.RequestSession` and :class:`~nextcore.common.times_per.PriorityQueueContainer`.
+    Sessions only need a ``priority`` and a ``queued`` attribute.
+
+    Sessions with the same priority are returned in the order they were added.
+    Sessions can be removed in ``O(log n)``, which is used when a waiting request is cancelled.
+
+    Parameters
+    ----------
+    priority_aging:
+        How many seconds a session has to wait for its priority to improve by 1.
+
+        This stops low priority requests from waiting forever while higher priority requests keep coming in.
+        If this is :data:`None`, priorities never change.
+
+    Attributes
+    ----------
+    priority_aging:
+        How many seconds a session has to wait for its priority to improve by 1.
+    """
+
+    __slots__ = ("priority_aging", "_heap", "_sequence", "_front_sequence", "_removed")
+
+    def __init__(self, *, priority_aging: float | None = None) -> None:
+        self.priority_aging: float | None = priority_aging
+        self._heap: list[tuple[float, int, WaiterT]] = []  # Sort key, sequence number and the session
+        self._sequence: Iterator[int] = count()
+        self._front_sequence: Iterator[int] = count(-1, -1)
+        self._removed: int = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._removed
+
+    def push(self, session: WaiterT, *, front: bool = False) -> None:
+        """Add a session to the queue.
+
+        Parameters
+        ----------
+        session:
+            The session to add.
+        front:
+            Put the session before every other session with the same priority instead of after.
+
+            This is used for requests that are retried after a rate limit, so they keep their place in line.
+            With ``priority_aging`` the session is aged as much as the oldest session with the same priority.
+        """
+        sort_key: float = session.priority
+        if self.priority_aging is not None:
+            # Priority improves by 1 every priority_aging seconds. As every session ages at the same speed,
+            # the order between two sessions never changes and the age can be included in the sort key up front.
+            sort_key += monotonic() / self.priority_aging
+            if front:
+                # Being aged from now would put it behind every session with the same priority that queued before it.
+                # This is O(n), but only done for retries.
+                sort_key = min(
+                    (key for key, _, waiter in self._heap if waiter.queued and waiter.priority == session.priority),
+                    default=sort_key,
+                )
+
+        session.queued = True
+        sequence = next(self._front_sequence) if front else next(self._sequence)
+        heappush(self._heap, (sort_key, sequence, session))
+
+    def ahead_of(self, priority: int) -> int:
+        """How many sessions would be let through before a new session with a priority.
+
+        This is ``O(n)``, so it is only meant for estimates.
+
+        Parameters
+        ----------
+        priority:
+            The priority of the new session.
+        """
+        sort_key: float = priority
+        if self.priority_aging is not None:
+            sort_key += monotonic() / self.priority_aging
+        return sum(1 for entry in self._heap if entry[0] <= sort_key and entry[2].queued)
+
+    def pop(self) -> WaiterT:
+        """Remove and return the session that should be let through next.
+
+        Raises
+        ------
+        IndexError
+            The queue is empty.
+        """
+        while True:
+            session = heappop(self._heap)[2]
+            if not session.queued:
+                # Removed
+                self._removed -= 1
+                continue
+            session.queued = False
+            return session
+
+    def peek(self) -> WaiterT:
+        """Return the session that should be let through next, without removing it.
+
+        Raises
+        ------
+        IndexError
+            The queue is empty.
+        """
+        heap = self._heap
+        while not heap[0][2].queued:
+            # Removed
+            heappop(heap)
+            self._removed -= 1
+        return heap[0][2]
+
+    def remove(self, session: WaiterT) -> bool:
+        """Remove a session from the queue.
+
+        Parameters
+        ----------
+        session:
+            The session to remove.
+
+        Returns
+        -------
+        bool
+            Whether the session was in the queue.
+        """
+        if not session.queued:
+            return False
+        # Removed sessions are skipped when popped, as removing from the middle of a heap would be O(n)
+        session.queued = False
+        self._removed += 1
+
+        if self._removed > len(self._heap) // 2:
+            # Mostly removed sessions, clean them up to free the memory.
+            self._heap = [entry for entry in self._heap if entry[2].queued]
+            heapify(self._heap)
+            self._removed = 0
+        return True
@@ -26,12 +26,23 @@ and gives you convinient methods around the API.
 """
 
 from .authentication import *
+from .batch import *
 from .bucket import *
 from .bucket_metadata import *
+from .bucket_metadata_snapshot import *
 from .client import *
 from .errors import *
 from .file import *
 from .global_rate_limiter import *
+from .invalid_request_guard import *
+from .negative_cache import *
+from .paginator import *
+from .qos import *
 from .rate_limit_storage import *
+from .remote_rate_limit_storage import *
+from .request_body import *
 from .request_session import *
+from .resource_backoff_registry import *
+from .retry_policy import *
 from .route import *
+from .shared_memory_rate_limit_storage import *
@@ -0,0 +1,269 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import FIRST_COMPLETED, create_task, gather, sleep
+from asyncio import wait as wait_for_first
+from collections import Counter, OrderedDict, deque
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import Any, AsyncIterable, AsyncIterator, Final, Hashable, Iterable
+
+    from aiohttp import ClientResponse
+
+    from .client import HTTPClient
+    from .route import Route
+
+__all__: Final[tuple[str, ...]] = ("BatchRequest", "BatchResult", "BatchExecutor")
+
+logger = getLogger(__name__)
+
+
+class BatchRequest:
+    """A request to do with a :class:`BatchExecutor`.
+
+    Parameters
+    ----------
+    route:
+        The route to request.
+    rate_limit_key:
+        A ID used for differentiating rate limits. See :meth:`HTTPClient._request`
+    kwargs:
+        Keyword arguments to pass to :meth:`HTTPClient._request`, like ``headers``, ``json`` or ``qos``.
+
+    Attributes
+    ----------
+    route:
+        The route to request.
+    rate_limit_key:
+        A ID used for differentiating rate limits.
+    kwargs:
+        Keyword arguments to pass to :meth:`HTTPClient._request`
+    """
+
+    __slots__ = ("route", "rate_limit_key", "kwargs")
+
+    def __init__(self, route: Route, rate_limit_key: str | None, **kwargs: Any) -> None:
+        self.route: Route = route
+        self.rate_limit_key: str | None = rate_limit_key
+        self.kwargs: dict[str, Any] = kwargs
+
+
+class BatchResult:
+    """The result of a :class:`BatchRequest`.
+
+    Parameters
+    ----------
+    request:
+        The request this is the result of.
+    response:
+        The response, if the request succeeded.
+    error:
+        The error the request raised, if it failed.
+
+    Attributes
+    ----------
+    request:
+        The request this is the result of.
+    response:
+        The response, if the request succeeded.
+    error:
+        The error the request raised, if it failed.
+    """
+
+    __slots__ = ("request", "response", "error")
+
+    def __init__(
+        self, request: BatchRequest, response: ClientResponse | None = None, error: Exception | None = None
+    ) -> None:
+        self.request: BatchRequest = request
+        self.response: ClientResponse | None = response
+        self.error: Exception | None = error
+
+
+class BatchExecutor:
+    """Do a lot of requests as fast as the rate limits allow, without creating them all up front.
+
+    Requests are read ahead from ``requests`` and grouped by bucket.
+    Requests for buckets that have a spot free right now are sent first,
+    so a bucket that is rate limited does not hold up requests for other buckets.
+
+    Results are returned in the order the requests finish.
+
+    .. code-block:: python3
+
+        requests = (BatchRequest(Route("DELETE", ...), authentication.rate_limit_key, headers=headers) for ... in ...)
+
+        async for result in http_client.batch(requests):
+            if result.error is not None:
+                ...
+
+    Parameters
+    ----------
+    http_client:
+        The client to do the requests with.
+    requests:
+        The requests to do. This can be a iterable or a async iterable, and is only read as far as needed.
+    max_in_flight:
+        How many requests can be sent or waiting in a bucket at once.
+    lookahead:
+        How many requests are read ahead of the ones being sent, to find requests for buckets with a spot free.
+
+    Raises
+    ------
+    ValueError
+        ``max_in_flight`` or ``lookahead`` was below ``1``.
+
+    Attributes
+    ----------
+    http_client:
+        The client to do the requests with.
+    max_in_flight:
+        How many requests can be sent or waiting in a bucket at once.
+    lookahead:
+        How many requests are read ahead of the ones being sent.
+    """
+
+    __slots__ = ("http_client", "max_in_flight", "lookahead", "_requests")
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        requests: Iterable[BatchRequest] | AsyncIterable[BatchRequest],
+        *,
+        max_in_flight: int = 50,
+        lookahead: int = 1000,
+    ) -> None:
+        if max_in_flight < 1 or lookahead < 1:
+            raise ValueError("max_in_flight and lookahead have to be at least 1")
+
+        self.http_client: HTTPClient = http_client
+        self.max_in_flight: int = max_in_flight
+        self.lookahead: int = lookahead
+        self._requests: Iterable[BatchRequest] | AsyncIterable[BatchRequest] = requests
+
+    async def __aiter__(self) -> AsyncIterator[BatchResult]:
+        requests = self._requests
+        if hasattr(requests, "__aiter__"):
+            async_iterator: AsyncIterator[BatchRequest] | None = requests.__aiter__()  # type: ignore [union-attr]
+            sync_iterator = None
+        else:
+            async_iterator = None
+            sync_iterator = iter(requests)  # type: ignore [arg-type]
+
+        queued: OrderedDict[Hashable, deque[BatchRequest]] = OrderedDict()  # Bucket -> requests read ahead
+        read_ahead = 0
+        exhausted = False
+        in_flight: dict[Task[ClientResponse], tuple[Hashable, BatchRequest]] = {}
+        in_flight_per_bucket: Counter[Hashable] = Counter()
+
+        try:
+            while True:
+                # Read ahead
+                while not exhausted and read_ahead < self.lookahead:
+                    try:
+                        if async_iterator is not None:
+                            request = await async_iterator.__anext__()
+                        else:
+                            request = next(sync_iterator)  # type: ignore [arg-type]
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    key = (request.rate_limit_key, request.route.bucket)
+                    if key not in queued:
+                        queued[key] = deque()
+                    queued[key].append(request)
+                    read_ahead += 1
+
+                if not queued and not in_flight:
+                    return
+
+                # Send requests for buckets with a spot free
+                next_free: float | None = None
+                for key in list(queued):
+                    if len(in_flight) >= self.max_in_flight:
+                        break
+                    bucket_requests = queued[key]
+                    free, estimated_wait = await self._free_spots(bucket_requests[0], in_flight_per_bucket[key])
+                    if estimated_wait > 0:
+                        # Rate limited, check again once it has a spot free
+                        next_free = estimated_wait if next_free is None else min(next_free, estimated_wait)
+                        continue
+
+                    for _ in range(min(free, self.max_in_flight - len(in_flight), len(bucket_requests))):
+                        request = bucket_requests.popleft()
+                        read_ahead -= 1
+                        task = create_task(
+                            self.http_client._request(request.route, request.rate_limit_key, **request.kwargs)
+                        )
+                        in_flight[task] = (key, request)
+                        in_flight_per_bucket[key] += 1
+                    if not bucket_requests:
+                        del queued[key]
+                    else:
+                        # Give other buckets a turn first next time
+                        queued.move_to_end(key)
+
+                if not in_flight:
+                    # Every bucket with requests is rate limited
+                    await sleep(next_free or 0)
+                    continue
+
+                done, _ = await wait_for_first(in_flight, timeout=next_free, return_when=FIRST_COMPLETED)
+                for task in done:
+                    key, request = in_flight.pop(task)
+                    in_flight_per_bucket[key] -= 1
+                    if not in_flight_per_bucket[key]:
+                        del in_flight_per_bucket[key]
+                    try:
+                        response = task.result()
+                    except Exception as error:
+                        yield BatchResult(request, error=error)
+                    else:
+                        yield BatchResult(request, response=response)
+        finally:
+            # Stopped early, the requests left are not needed anymore.
+            for task in in_flight:
+                task.cancel()
+            await gather(*in_flight, return_exceptions=True)
+
+    async def _free_spots(self, request: BatchRequest, in_flight: int) -> tuple[int, float]:
+        # How many requests can be sent to the bucket of the request now, and how many seconds until it has a spot free.
+        route = request.route
+        http_client = self.http_client
+        estimated_wait = await http_client.estimate_wait(route, request.rate_limit_key)
+        if estimated_wait > 0:
+            return 0, estimated_wait
+
+        storage = http_client.rate_limit_storages[request.rate_limit_key]
+        bucket = await storage.get_bucket_by_nextcore_id(route.bucket)
+        if bucket is not None and bucket.metadata.unlimited:
+            return self.max_in_flight, 0
+        if bucket is None or bucket.metadata.limit is None:
+            # The limit is found with the first request, do not send more than one until then.
+            return 0 if in_flight else 1, 0
+        # More than a window worth of requests at once would just wait in the bucket.
+        return max(bucket.metadata.limit - in_flight, 0), 0
@@ -21,18 +21,22 @@
 
 from __future__ import annotations
 
-from asyncio import Event, PriorityQueue, get_running_loop
+from asyncio import CancelledError, Event, get_running_loop
 from contextlib import asynccontextmanager
 from logging import getLogger
 from typing import TYPE_CHECKING, cast, overload
 
 from nextcore.common.errors import RateLimitedError
+from nextcore.common.timer_wheel import TimerWheel
+from nextcore.common.waiter_queue import WaiterQueue
 
 from .request_session import RequestSession
 
 if TYPE_CHECKING:
     from typing import AsyncIterator, Final, Literal
 
+    from nextcore.common.timer_wheel import TimerWheelHandle
+
     from .bucket_metadata import BucketMetadata
 
 logger = getLogger(__name__)
@@ -47,25 +51,81 @@ class Bucket:
     ----------
     metadata:
         The metadata for the bucket.
+    max_blind_requests:
+        How many requests can be made at once before the rate limit of the bucket is known,
+        if no limit has been seen for the route yet.
+    priority_aging:
+        How many seconds a request has to wait for its priority to improve by 1. See :attr:`~nextcore.common.WaiterQueue.priority_aging`
+    lend_held_after:
+        The share of a window after which spots held back for more important requests are lent out, if they are still unused.
 
     Attributes
     ----------
     metadata:
         The metadata for the bucket.
+    max_blind_requests:
+        How many requests can be made at once before the rate limit of the bucket is known,
+        if no limit has been seen for the route yet.
+
+        If a limit has been seen for the route, the first window of a new bucket uses :attr:`BucketMetadata.min_limit`
+        instead.
+    priority_aging:
+        How many seconds a request has to wait for its priority to improve by 1. See :attr:`~nextcore.common.WaiterQueue.priority_aging`
+    lend_held_after:
+        The share of a window after which spots held back for more important requests are lent out, if they are still unused.
+
+        See :class:`QoSClass`
+
+    .. note::
+        The queue and event used for waiting are only created once a request has to wait,
+        so buckets that are never contended stay small.
     """
 
-    def __init__(self, metadata: BucketMetadata):
+    __slots__ = (
+        "metadata",
+        "max_blind_requests",
+        "priority_aging",
+        "lend_held_after",
+        "_remaining",
+        "_reserved",
+        "_blind_requests",
+        "_updated",
+        "_pending",
+        "_can_do_blind_request",
+        "_reset_handle",
+        "_lend_at",
+        "_lend_handle",
+        "_merged_into",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        metadata: BucketMetadata,
+        *,
+        max_blind_requests: int = 1,
+        priority_aging: float | None = None,
+        lend_held_after: float = 0.8,
+    ) -> None:
         self.metadata: BucketMetadata = metadata
+        self.max_blind_requests: int = max_blind_requests
+        self.priority_aging: float | None = priority_aging
+        self.lend_held_after: float = lend_held_after
         self._remaining: int | None = None  # None signifies unlimited or not used yet (due to a optimization)
-        self._pending: PriorityQueue[RequestSession] = PriorityQueue()
-        self._reserved: list[RequestSession] = []
-        self._resetting: bool = False
-        self._can_do_blind_request: Event = Event()
-
-        self._can_do_blind_request.set()
+        self._reserved: int = 0  # Requests in progress
+        self._blind_requests: int = 0
+        self._updated: bool = False  # If a response has updated this bucket yet
+        self._pending: WaiterQueue[RequestSession] | None = None  # Created on first wait
+        self._can_do_blind_request: Event | None = None  # Created on first wait, set means a blind request finished
+        self._reset_handle: TimerWheelHandle | None = None
+        self._lend_at: float | None = None  # When held back spots of the current window are lent out
+        self._lend_handle: TimerWheelHandle | None = None  # Only created while requests wait for held back spots
+        self._merged_into: Bucket | None = None
 
     @asynccontextmanager
-    async def acquire(self, *, priority: int = 0, wait: bool = True) -> AsyncIterator[None]:
+    async def acquire(
+        self, *, priority: int = 0, wait: bool = True, retry: bool = False, held_back: float = 0
+    ) -> AsyncIterator[None]:
         """Use a spot in the rate limit.
 
         Parameters
@@ -76,12 +136,26 @@ class Bucket:
             Wait for a spot in the rate limit.
 
             If this is set to :data:`False`, this will raise :exc:`RateLimitedError` if no spot is available right now.
+        retry:
+            Whether this is a request being retried after a rate limit.
+
+            Retries are let through before other waiting requests with the same priority.
+        held_back:
+            The share of the limit this request can not use, as it is kept free for more important requests.
+
+            This is rounded down to whole requests. See :class:`QoSClass`
 
         Raises
         ------
         RateLimitedError
             You are rate limited and ``wait`` was set to :data:`False`
         """
+        if self._merged_into is not None:
+            # This bucket was merged into another one after the caller got it.
+            async with self._merged_into.acquire(priority=priority, wait=wait, retry=retry, held_back=held_back):
+                yield
+            return
+
         if self.metadata.unlimited:
             # Instantly return and avoid touching any of the state.
             yield
@@ -89,74 +163,90 @@ class Bucket:
 
         if self._remaining is None and self.metadata.limit is not None:
             # We have info from metadata! Use that
-            self._remaining = self.metadata.limit
+            self._remaining = self._starting_limit()
 
         if self._remaining is not None:
             # Already using this bucket
 
-            session = RequestSession(priority=priority)
+            # We assume every request is successful, and retry when that is not the case.
+            estimated_remaining = self._remaining - self._reserved
 
-            estimated_remaining = self._remaining - len(
-                self._reserved
-            )  # We assume every request is successful, and retry when that is not the case.
-
-            if estimated_remaining == 0:
+            if estimated_remaining <= self._held_spots(held_back):
                 if not wait:
                     raise RateLimitedError()
-                self._pending.put_nowait(
-                    session
-                )  # This can't raise a exception as pending is always infinite unless someone else modified it
-                await session.pending_future  # Wait for a spot in the rate limit.
-                # This will automatically be removed by the waker.
-
-            self._reserved.append(session)
+                if self._pending is None:
+                    self._pending = WaiterQueue(priority_aging=self.priority_aging)
+                session = RequestSession(priority=priority, held_back=held_back)
+                self._pending.push(session, front=retry)
+                if estimated_remaining > 0:
+                    # Only waiting for the held back spots, which are lent out if they go unused.
+                    self._schedule_lend()
+                try:
+                    await session.pending_future  # Wait for a spot in the rate limit.
+                    # This will automatically be removed by the waker.
+                except CancelledError:
+                    if not self._pending.remove(session) and self._merged_into is None:
+                        # Cancelled after being let through, give the spot to the next request instead.
+                        self._release_pending(1)
+                    raise
+
+                if self._merged_into is not None:
+                    # Woken up by a merge, wait in the merged bucket instead.
+                    async with self._merged_into.acquire(
+                        priority=priority, wait=wait, retry=retry, held_back=held_back
+                    ):
+                        yield
+                    return
+
+            self._reserved += 1
             try:
                 yield  # Let the user do the request
             except:
                 # Release one request as we assume the request failed.
-                if self._pending.qsize() >= 1:
-                    self._release_pending(1)
+                self._resolve()._release_pending(1)
 
                 raise  # Re-raise the exception
             finally:
-                self._reserved.remove(session)
+                self._resolve()._reserved -= 1
             return
 
         # We have no info on rate limits, so we have to do a "blind" request to find out what the rate limits is.
-        # We will only do one "blind" request at a time per bucket though in case the rate limit is small.
-        # This could be tweaked to use more on routes with higher rate limits, however this would require hard coding which is not a thing I want
-        # for nextcore.
-        session = RequestSession(priority=priority)
-
-        if self._can_do_blind_request.is_set():
-            self._can_do_blind_request.clear()
-
-            self._reserved.append(session)
+        # The amount of "blind" requests at a time is limited by max_blind_requests in case the rate limit is small.
+        if self._blind_requests < self.max_blind_requests:
+            self._blind_requests += 1
+            self._reserved += 1
             try:
                 yield  # Let the user do the request
             except:
                 # Release one request as we assume the request failed.
-                if self._pending.qsize() >= 1:
-                    self._release_pending(1)
+                self._resolve()._release_pending(1)
 
                 raise  # Re-raise the exception
             else:
-                if self._remaining is None:
+                if self._merged_into is not None:
+                    pass  # The waiters were moved to the merged bucket.
+                elif self._remaining is None:
                     logger.warning("A user of Bucket is not calling .update! This will cause performance issues...")
                     self._release_pending(1)
                 else:
-                    self._release_pending(self._remaining)
+                    # This request is still reserved, but it is done.
+                    self._release_pending(max(self._remaining - self._reserved + 1, 0))
             finally:
-                self._reserved.remove(session)
-                self._can_do_blind_request.set()
+                self._resolve()._reserved -= 1
+                self._blind_requests -= 1
+                if self._can_do_blind_request is not None:
+                    self._can_do_blind_request.set()
+                    self._can_do_blind_request = None  # Waiters that do not get a spot will create a new one
                 logger.debug("Done cleaning up blind request!")
             return
 
         # Currently doing blind request
+        if self._can_do_blind_request is None:
+            self._can_do_blind_request = Event()
         await self._can_do_blind_request.wait()
 
         # Try again
-        async with self.acquire(priority=priority, wait=wait):
+        async with self.acquire(priority=priority, wait=wait, retry=retry, held_back=held_back):
             yield
 
     @overload
@@ -170,6 +260,11 @@ class Bucket:
     async def update(
         self, remaining: int | None = None, reset_after: float | None = None, *, unlimited: bool = False
     ) -> None:
+        if self._merged_into is not None:
+            # Requests that were in progress during a merge still update this bucket.
+            await self._merged_into.update(remaining, reset_after, unlimited=unlimited)  # type: ignore [call-overload]
+            return
+
         if unlimited:
             # Updating metadata is handled by the HTTPClient, so we do not need to do this.
 
@@ -177,38 +272,176 @@ class Bucket:
             self._release_pending()
         else:
             self._remaining = remaining
+            self._updated = True
 
             # Start a reset
-            if self._resetting:
+            if self._reset_handle is not None:
                 return  # Don't do it when there is already a reset in progress
 
-            self._resetting = True
-
             # Call the reset callback (after the reset duration)
             reset_after = cast(float, reset_after)
-            loop = get_running_loop()
-            loop.call_later(reset_after, self._reset_callback)
+            self._reset_handle = TimerWheel.for_loop().call_later(reset_after, self._reset_callback)
+            self._lend_at = get_running_loop().time() + reset_after * self.lend_held_after
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Estimate how many seconds a new request would wait for a spot.
+
+        This is a lower bound. It only counts the wait until the next reset,
+        as the length of the windows after it is not known until they start.
+
+        Parameters
+        ----------
+        priority:
+            The priority the request would have.
+        """
+        bucket = self._resolve()
+        if bucket.metadata.unlimited:
+            return 0
+
+        remaining = bucket._remaining if bucket._remaining is not None else bucket._starting_limit()
+        if remaining is None:
+            return 0  # Not known until a blind request finishes.
+
+        ahead = bucket._pending.ahead_of(priority) if bucket._pending else 0
+        if ahead < remaining - bucket._reserved or bucket._reset_handle is None:
+            return 0
+        return max(bucket._reset_handle.when() - get_running_loop().time(), 0)
+
+    def backoff(self, retry_after: float) -> None:
+        """Stop letting requests through until ``retry_after`` seconds from now.
+
+        This is used after a ``429`` on the bucket, in case the reset from the headers was already scheduled or missing.
+
+        Parameters
+        ----------
+        retry_after:
+            How many seconds to wait before letting requests through again.
+        """
+        bucket = self._resolve()
+        if bucket.metadata.unlimited:
+            return  # Nothing is being rate limited. The next response with headers will fix this.
+
+        bucket._remaining = 0
+
+        when = get_running_loop().time() + retry_after
+        if bucket._reset_handle is not None:
+            if bucket._reset_handle.when() >= when:
+                return  # The reset that is already scheduled is late enough.
+            bucket._reset_handle.cancel()
+        bucket._reset_handle = TimerWheel.for_loop().call_at(when, bucket._reset_callback)
 
     def _reset_callback(self) -> None:
-        self._resetting = False  # Allow future resets
+        self._reset_handle = None  # Allow future resets
         self._remaining = None  # It should use metadata's limit as a starting point.
+        self._lend_at = None
+        if self._lend_handle is not None:
+            self._lend_handle.cancel()
+            self._lend_handle = None
 
         # Reset up to the limit
         self._release_pending(self.metadata.limit)
 
     def _release_pending(self, max_count: int | None = None):
+        pending = self._pending
+        if pending is None:
+            return  # Nobody has waited yet
+
         if max_count is None:
-            max_count = self._pending.qsize()
-        else:
-            max_count = min(max_count, self._pending.qsize())
+            # Everyone, no matter what is held back
+            for _ in range(len(pending)):
+                session = pending.pop()  # This can't raise a exception due to the guard clause.
+                session.pending_future.set_result(None)
+            return
 
-        for _ in range(max_count):
-            session = self._pending.get_nowait()  # This can't raise a exception due to the guard clause.
+        while pending and max_count > 0:
+            session = pending.peek()
+            if session.held_back and max_count <= self._held_spots(session.held_back):
+                # The rest of the spots are kept free for more important requests.
+                # Requests behind this one are at most as important, so they can not use them either.
+                break
+            pending.pop()
+            session.pending_future.set_result(None)
+            max_count -= 1
+
+    def _starting_limit(self) -> int | None:
+        if self._updated or self.metadata.min_limit is None:
+            return self.metadata.limit
+        # Buckets of a route can have different limits, so the first window of a new bucket uses the smallest one seen.
+        # The spots this misses are not released early, as the bucket may turn out to share a Discord bucket
+        # with requests it can not see yet.
+        return self.metadata.min_limit
+
+    def _held_spots(self, held_back: float) -> int:
+        if not held_back or self.metadata.limit is None:
+            return 0
+        if self._lend_at is not None and get_running_loop().time() >= self._lend_at:
+            return 0  # Late in the window, spots that are still free would go unused.
+        return int(held_back * self.metadata.limit)
+
+    def _schedule_lend(self) -> None:
+        if self._lend_handle is not None or self._lend_at is None:
+            return
+        self._lend_handle = TimerWheel.for_loop().call_at(self._lend_at, self._lend_callback)
 
-            # Mark it as completed in the queue to avoid a infinitly overflowing int
-            self._pending.task_done()
+    def _lend_callback(self) -> None:
+        self._lend_handle = None
+        if self._remaining is not None:
+            self._release_pending(self._remaining - self._reserved)
 
-            session.pending_future.set_result(None)
+    def migrate_to(self, bucket: Bucket) -> None:
+        """Merge this bucket into another bucket.
+
+        This is used when two buckets turn out to share the same Discord rate limit bucket.
+
+        Requests waiting on this bucket are moved to ``bucket`` in priority order,
+        requests in progress will count towards ``bucket``, and any future use of this bucket will use ``bucket`` instead.
+
+        Parameters
+        ----------
+        bucket:
+            The bucket to merge into.
+        """
+        target = bucket._resolve()
+        if target is self:
+            return
+
+        self._merged_into = target
+
+        # Both buckets are the same rate limit, so the lowest remaining count is the most accurate.
+        if self._remaining is not None:
+            if target._remaining is None:
+                target._remaining = self._remaining
+            else:
+                target._remaining = min(target._remaining, self._remaining)
+            self._remaining = None
+        target._updated = target._updated or self._updated
+
+        # Requests in progress use up spots in the merged bucket now.
+        target._reserved += self._reserved
+        self._reserved = 0
+
+        # Move the reset over
+        if self._reset_handle is not None:
+            if target._reset_handle is None:
+                target._reset_handle = TimerWheel.for_loop().call_at(self._reset_handle.when(), target._reset_callback)
+
+            self._reset_handle.cancel()
+            self._reset_handle = None
+        if self._lend_handle is not None:
+            self._lend_handle.cancel()
+            self._lend_handle = None
+
+        # Wake up everyone waiting. They will re-queue in the merged bucket in the order they were woken up in.
+        self._release_pending()
+        if self._can_do_blind_request is not None:
+            self._can_do_blind_request.set()
+            self._can_do_blind_request = None
+
+    def _resolve(self) -> Bucket:
+        bucket = self
+        while bucket._merged_into is not None:
+            bucket = bucket._merged_into
+        return bucket
 
     @property
     def dirty(self) -> bool:
@@ -39,6 +39,10 @@ class BucketMetadata:
     unlimited:
         Whether the bucket has an unlimited number of requests. If this is :class:`True`,
         limit has to be None.
+    bucket_hash:
+        The Discord bucket hash for the route.
+    min_limit:
+        The smallest limit seen for the route. Defaults to ``limit``.
 
     Attributes
     ----------
@@ -51,10 +55,29 @@ class BucketMetadata:
             This will also be :data:`None` if no limit has been fetched yet.
     unlimited:
         Wheter the bucket has no rate limiting enabled.
+    bucket_hash:
+        The Discord bucket hash for the route. This is the ``X-RateLimit-Bucket`` header.
+
+        .. note::
+            This will be :data:`None` if no request has been made to the route yet.
+    min_limit:
+        The smallest limit seen for the route. This is used as the limit of the first window of a new :class:`Bucket`.
+
+        .. note::
+            This will be :data:`None` if no limit has been fetched yet.
     """
 
-    __slots__ = ("limit", "unlimited")
+    __slots__ = ("limit", "unlimited", "bucket_hash", "min_limit")
 
-    def __init__(self, limit: int | None = None, *, unlimited: bool = False) -> None:
+    def __init__(
+        self,
+        limit: int | None = None,
+        *,
+        unlimited: bool = False,
+        bucket_hash: str | None = None,
+        min_limit: int | None = None,
+    ) -> None:
         self.limit: int | None = limit
         self.unlimited: bool = unlimited
+        self.bucket_hash: str | None = bucket_hash
+        self.min_limit: int | None = limit if min_limit is None else min_limit
@@ -0,0 +1,206 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+import json
+import os
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from .bucket_metadata import BucketMetadata
+
+if TYPE_CHECKING:
+    from typing import Any, ClassVar, Final
+
+    from typing_extensions import Self
+
+logger = getLogger(__name__)
+
+__all__: Final[tuple[str, ...]] = ("BucketMetadataSnapshot",)
+
+# Well known route limits. These are on the low side, the real limit is learned from the first response.
+# Routes are shared between methods, so this has to be the lowest limit of all methods on the route.
+_SEED: Final[dict[str, int]] = {
+    "/channels/{channel_id}": 5,
+    "/channels/{channel_id}/messages": 5,
+    "/channels/{channel_id}/messages/{message_id}": 5,
+    "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me": 1,
+    "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}": 1,
+    "/channels/{channel_id}/typing": 5,
+    "/guilds/{guild_id}/members/{user_id}": 5,
+    "/webhooks/{webhook_id}/{webhook_token}": 5,
+}
+
+
+class BucketMetadataSnapshot:
+    """Learned :class:`BucketMetadata` by route which can be saved to and loaded from a file.
+
+    This lets the :class:`HTTPClient` skip the blind requests done on every new route after a restart.
+
+    .. note::
+        Only the route, limit, whether it is unlimited and the Discord bucket hash is stored. No tokens are stored.
+
+    Parameters
+    ----------
+    metadata:
+        The metadata by route. This is copied.
+
+    Attributes
+    ----------
+    metadata:
+        The metadata by route (:attr:`Route.route`).
+    """
+
+    __slots__ = ("metadata",)
+
+    VERSION: ClassVar[int] = 1
+
+    def __init__(self, metadata: dict[str, BucketMetadata] | None = None) -> None:
+        self.metadata: dict[str, BucketMetadata] = {}
+        if metadata is not None:
+            for route, route_metadata in metadata.items():
+                self.set(route, route_metadata)
+
+    @classmethod
+    def default(cls) -> Self:
+        """A snapshot with the built-in limits for well known routes."""
+        return cls({route: BucketMetadata(limit) for route, limit in _SEED.items()})
+
+    def get(self, route: str) -> BucketMetadata | None:
+        """Get a copy of the metadata for a route.
+
+        Parameters
+        ----------
+        route:
+            The route. This is :attr:`Route.route`.
+
+        Returns
+        -------
+        BucketMetadata | None
+            A new :class:`BucketMetadata`, or :data:`None` if the route is not in the snapshot.
+        """
+        metadata = self.metadata.get(route)
+        if metadata is None:
+            return None
+        return BucketMetadata(metadata.limit, unlimited=metadata.unlimited, bucket_hash=metadata.bucket_hash)
+
+    def set(self, route: str, metadata: BucketMetadata) -> None:
+        """Store a copy of the metadata for a route.
+
+        Parameters
+        ----------
+        route:
+            The route. This is :attr:`Route.route`.
+        metadata:
+            The metadata to store.
+        """
+        self.metadata[route] = BucketMetadata(
+            metadata.limit, unlimited=metadata.unlimited, bucket_hash=metadata.bucket_hash
+        )
+
+    def update(self, other: BucketMetadataSnapshot) -> None:
+        """Add all routes from another snapshot, replacing existing ones.
+
+        Parameters
+        ----------
+        other:
+            The snapshot to copy from.
+        """
+        for route, metadata in other.metadata.items():
+            self.set(route, metadata)
+
+    def dumps(self) -> str:
+        """Serialize the snapshot to JSON."""
+        routes = {
+            route: [metadata.limit, metadata.unlimited, metadata.bucket_hash]
+            for route, metadata in self.metadata.items()
+        }
+        return json.dumps({"version": self.VERSION, "routes": routes}, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, data: str) -> Self:
+        """Load a snapshot serialized with :meth:`BucketMetadataSnapshot.dumps`.
+
+        Parameters
+        ----------
+        data:
+            The JSON data.
+
+        Raises
+        ------
+        ValueError
+            The data is not a valid snapshot.
+        """
+        try:
+            raw: Any = json.loads(data)
+            if raw["version"] != cls.VERSION:
+                raise ValueError(f"Unsupported snapshot version {raw['version']}")
+
+            snapshot = cls()
+            for route, (limit, unlimited, bucket_hash) in raw["routes"].items():
+                if not isinstance(route, str) or not isinstance(unlimited, bool):
+                    raise ValueError(f"Invalid route {route!r}")
+                if limit is not None and not isinstance(limit, int):
+                    raise ValueError(f"Invalid limit for route {route}")
+                if bucket_hash is not None and not isinstance(bucket_hash, str):
+                    raise ValueError(f"Invalid bucket hash for route {route}")
+                snapshot.metadata[route] = BucketMetadata(limit, unlimited=unlimited, bucket_hash=bucket_hash)
+        except (KeyError, TypeError, AttributeError) as error:
+            raise ValueError("Invalid snapshot") from error
+        # json.JSONDecodeError is a subclass of ValueError
+        return snapshot
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save the snapshot to a file.
+
+        The file is replaced atomically, so a crash while saving will not corrupt it.
+
+        Parameters
+        ----------
+        path:
+            The file to save to.
+        """
+        temporary_path = f"{os.fspath(path)}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self.dumps())
+        os.replace(temporary_path, path)
+        logger.debug("Saved %s routes to %s", len(self.metadata), path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Self:
+        """Load a snapshot from a file saved with :meth:`BucketMetadataSnapshot.save`.
+
+        Parameters
+        ----------
+        path:
+            The file to load from.
+
+        Raises
+        ------
+        OSError
+            The file could not be read.
+        ValueError
+            The file is not a valid snapshot.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls.loads(file.read())
@@ -25,13 +25,17 @@ from abc import ABC, abstractmethod
 from logging import getLogger
 from typing import TYPE_CHECKING
 
+from ...common import UNDEFINED
 from ..route import Route
 
 if TYPE_CHECKING:
-    from typing import Any, Final
+    from typing import Any, Final, Hashable
 
     from aiohttp import ClientResponse
 
+    from ...common import UndefinedType
+    from ..qos import QoSClass
+
 logger = getLogger(__name__)
 
 __all__: Final[tuple[str, ...]] = ("AbstractHTTPClient",)
@@ -55,6 +59,10 @@ class AbstractHTTPClient(ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        idempotent: bool | None = None,
+        deadline: float | None = None,
+        tenant: Hashable | UndefinedType = UNDEFINED,
+        qos: QoSClass | None = None,
         **kwargs: Any,
     ) -> ClientResponse:
         ...
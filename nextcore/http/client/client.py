@@ -21,20 +21,28 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from asyncio import Task
+from asyncio import TimeoutError as AsyncioTimeoutError
+from asyncio import create_task, shield, sleep, wait_for
+from collections import Counter, defaultdict
+from functools import partial
 from logging import getLogger
-from time import time
+from time import monotonic, time
 from typing import TYPE_CHECKING
 
 from aiohttp import ClientSession
 
 from ... import __version__ as nextcore_version
 from ...common import UNDEFINED, Dispatcher, UndefinedType
+from ...common.errors import RateLimitedError
+from ..batch import BatchExecutor
 from ..bucket import Bucket
 from ..bucket_metadata import BucketMetadata
+from ..bucket_metadata_snapshot import BucketMetadataSnapshot
 from ..errors import (
     BadRequestError,
     CloudflareBanError,
+    DeadlineExceededError,
     ForbiddenError,
     HTTPRequestStatusError,
     InternalServerError,
@@ -42,20 +50,46 @@ from ..errors import (
     RateLimitingFailedError,
     UnauthorizedError,
 )
+from ..invalid_request_guard import InvalidRequestGuard
+from ..negative_cache import NegativeCache
 from ..rate_limit_storage import RateLimitStorage
+from ..request_body import RequestBody
+from ..resource_backoff_registry import ResourceBackoffRegistry
+from ..retry_policy import RetryPolicy
 from ..route import Route
 from .base_client import BaseHTTPClient
 
 if TYPE_CHECKING:
-    from typing import Any, Final, Literal
+    from os import PathLike
+    from typing import (
+        Any,
+        AsyncContextManager,
+        AsyncIterable,
+        Awaitable,
+        Callable,
+        Coroutine,
+        Final,
+        Hashable,
+        Iterable,
+        Literal,
+    )
 
     from aiohttp import ClientResponse, ClientWebSocketResponse
 
+    from ..batch import BatchRequest
+    from ..qos import QoSClass
+
 logger = getLogger(__name__)
 
 __all__: Final[tuple[str, ...]] = ("HTTPClient",)
 
 
+def _retry_reason(error: Exception) -> str:
+    if isinstance(error, HTTPRequestStatusError):
+        return str(error.status)
+    return type(error).__name__
+
+
 class HTTPClient(BaseHTTPClient):
     """The HTTP client to interface with the Discord API.
 
@@ -81,6 +115,38 @@ class HTTPClient(BaseHTTPClient):
         The default request timeout in seconds.
     max_rate_limit_retries:
         How many times to attempt to retry a request after rate limiting failed.
+    bucket_metadata_path:
+        A file to load learned rate limit info from on :meth:`HTTPClient.setup` and save it to on :meth:`HTTPClient.close`.
+
+        This avoids having to re-learn the rate limits of every route after a restart.
+        The file is created if it does not exist.
+    seed_bucket_metadata:
+        Whether to start with the built-in rate limits of well known routes.
+        See :meth:`BucketMetadataSnapshot.default`
+    max_blind_requests:
+        How many requests a bucket can do at once before its rate limit is known, on routes where no limit has been seen.
+
+        Once a limit has been seen on a route, the smallest one seen is used instead.
+    priority_aging:
+        How many seconds a request has to wait for its bucket priority to improve by 1.
+        This stops low priority requests from waiting forever. If this is :data:`None`, priorities never change.
+    invalid_request_guard:
+        What to use to avoid cloudflare bans from too many ``401``, ``403`` and ``429`` responses.
+        By default every client gets its own :class:`InvalidRequestGuard`.
+        Pass the same guard to multiple clients to share the budget, or :data:`None` to disable it.
+    negative_cache:
+        Remembers routes that failed with ``403`` or ``404`` so requesting them again fails without a request.
+        If this is :data:`None`, every request is sent.
+    retry_policy:
+        Which requests to retry after a server error or a connection error.
+        By default idempotent requests are retried with :class:`RetryPolicy`. If this is :data:`None`, they are not retried.
+    qos_classes:
+        Classes of requests that get a reserved share of every rate limit. See :class:`QoSClass`
+
+    Raises
+    ------
+    ValueError
+        The reserved shares of ``qos_classes`` add up to ``1`` or more.
 
     Attributes
     ----------
@@ -148,6 +214,35 @@ class HTTPClient(BaseHTTPClient):
         The key here is the rate_limit_key (often a user ID).
     dispatcher:
         Events from the HTTPClient. See the :ref:`events<HTTPClient dispatcher>`
+    bucket_metadata_path:
+        A file to load learned rate limit info from on :meth:`HTTPClient.setup` and save it to on :meth:`HTTPClient.close`.
+    bucket_metadata_snapshot:
+        Rate limit info used for routes that have not been requested yet.
+    max_blind_requests:
+        How many requests a bucket can do at once before its rate limit is known, on routes where no limit has been seen.
+    priority_aging:
+        How many seconds a request has to wait for its bucket priority to improve by 1.
+    invalid_request_guard:
+        What is used to avoid cloudflare bans. If this is :data:`None`, requests are never throttled or rejected.
+    negative_cache:
+        Routes that failed with ``403`` or ``404`` recently. If this is :data:`None`, every request is sent.
+    rate_limit_retries:
+        How many requests has been retried after a ``429``, by the ``X-RateLimit-Scope`` of the response.
+    resource_backoffs:
+        Resources that hit a ``shared`` scope rate limit recently. Requests to them wait before acquiring their bucket.
+    retry_policy:
+        Which requests to retry after a server error or a connection error. If this is :data:`None`, they are not retried.
+    request_retries:
+        How many requests has been retried by :attr:`HTTPClient.retry_policy`, by the response status or exception name.
+    qos_classes:
+        Classes of requests that get a reserved share of every rate limit, from most to least important.
+    single_flight:
+        Whether concurrent identical ``GET`` requests share one request and response.
+
+        Requests are identical if they have the same formatted path, ``Authorization`` header, query parameters,
+        priorities, ``wait``, ``idempotent`` and ``tenant``. ``deadline`` is applied to each caller on its own,
+        so a caller with a short deadline stops waiting without failing the request for the rest.
+        Responses are only shared while the request is in flight, they are never cached.
     """
 
     __slots__ = (
@@ -157,7 +252,22 @@ class HTTPClient(BaseHTTPClient):
         "max_retries",
         "rate_limit_storages",
         "dispatcher",
+        "bucket_metadata_path",
+        "bucket_metadata_snapshot",
+        "max_blind_requests",
+        "priority_aging",
+        "invalid_request_guard",
+        "negative_cache",
+        "rate_limit_retries",
+        "resource_backoffs",
+        "retry_policy",
+        "request_retries",
+        "qos_classes",
+        "single_flight",
         "_session",
+        "_global_backoffs",
+        "_in_flight",
+        "_seeded_routes",
     )
 
     def __init__(
@@ -166,6 +276,15 @@ class HTTPClient(BaseHTTPClient):
         trust_local_time: bool = True,
         timeout: float = 60,
         max_rate_limit_retries: int = 10,
+        bucket_metadata_path: str | PathLike[str] | None = None,
+        seed_bucket_metadata: bool = True,
+        max_blind_requests: int = 1,
+        priority_aging: float | None = None,
+        invalid_request_guard: InvalidRequestGuard | None | UndefinedType = UNDEFINED,
+        negative_cache: NegativeCache | None = None,
+        retry_policy: RetryPolicy | None | UndefinedType = UNDEFINED,
+        qos_classes: Iterable[QoSClass] = (),
+        single_flight: bool = False,
     ) -> None:
         self.trust_local_time: bool = trust_local_time
         self.timeout: float = timeout
@@ -177,9 +296,31 @@ class HTTPClient(BaseHTTPClient):
             RateLimitStorage
         )  # User ID -> RateLimitStorage
         self.dispatcher: Dispatcher[Literal["request_response"]] = Dispatcher()
+        self.bucket_metadata_path: str | PathLike[str] | None = bucket_metadata_path
+        self.bucket_metadata_snapshot: BucketMetadataSnapshot = (
+            BucketMetadataSnapshot.default() if seed_bucket_metadata else BucketMetadataSnapshot()
+        )
+        self.max_blind_requests: int = max_blind_requests
+        self.priority_aging: float | None = priority_aging
+        self.invalid_request_guard: InvalidRequestGuard | None = (
+            InvalidRequestGuard() if invalid_request_guard is UNDEFINED else invalid_request_guard
+        )
+        self.negative_cache: NegativeCache | None = negative_cache
+        self.rate_limit_retries: Counter[str] = Counter()
+        self.resource_backoffs: ResourceBackoffRegistry = ResourceBackoffRegistry()
+        self.retry_policy: RetryPolicy | None = RetryPolicy() if retry_policy is UNDEFINED else retry_policy
+        self.request_retries: Counter[str] = Counter()
+        self.qos_classes: tuple[QoSClass, ...] = tuple(sorted(qos_classes, key=lambda qos: qos.priority))
+        if sum(qos.reserved for qos in self.qos_classes) >= 1:
+            raise ValueError("The reserved shares of qos_classes have to add up to less than 1")
+        self.single_flight: bool = single_flight
 
         # Internals
         self._session: ClientSession | None = None
+        self._global_backoffs: dict[str | None, float] = {}  # Rate limit key -> when requests can be done again
+        self._in_flight: dict[Hashable, Task[ClientResponse]] = {}  # Single flight key -> request
+        # Routes seeded from the snapshot in storages that never return a missing bucket
+        self._seeded_routes: set[tuple[RateLimitStorage, str]] = set()
 
     async def setup(self) -> None:
         """Sets up the HTTP session
@@ -196,11 +337,33 @@ class HTTPClient(BaseHTTPClient):
             raise RuntimeError("This method can only be called once!")
         self._session = ClientSession()
 
+        if self.bucket_metadata_path is not None:
+            try:
+                self.bucket_metadata_snapshot.update(BucketMetadataSnapshot.load(self.bucket_metadata_path))
+            except FileNotFoundError:
+                logger.debug("No bucket metadata snapshot found at %s", self.bucket_metadata_path)
+            except (OSError, ValueError):
+                logger.warning(
+                    "Could not load bucket metadata snapshot from %s", self.bucket_metadata_path, exc_info=True
+                )
+
     async def close(self) -> None:
-        """Clean up internal state"""
+        """Clean up internal state
+
+        This will also save the learned rate limits to :attr:`HTTPClient.bucket_metadata_path` if it is set.
+        """
+        if self.bucket_metadata_path is not None:
+            try:
+                self.bucket_metadata_snapshot.save(self.bucket_metadata_path)
+            except OSError:
+                logger.warning(
+                    "Could not save bucket metadata snapshot to %s", self.bucket_metadata_path, exc_info=True
+                )
+
         for rate_limit_storage in self.rate_limit_storages.values():
             await rate_limit_storage.close()
         self.rate_limit_storages.clear()
+        self._seeded_routes.clear()
 
         self.dispatcher.close()
 
@@ -216,6 +379,10 @@ class HTTPClient(BaseHTTPClient):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        idempotent: bool | None = None,
+        deadline: float | None = None,
+        tenant: Hashable | UndefinedType = UNDEFINED,
+        qos: QoSClass | None = None,
         **kwargs: Any,
     ) -> ClientResponse:
         """Requests a route from the Discord API
@@ -237,15 +404,39 @@ class HTTPClient(BaseHTTPClient):
         global_priority:
             The request priority for global requests. **Lower** priority will be picked first.
 
+            This is also used by :attr:`HTTPClient.invalid_request_guard` to pick which requests to reject first.
+
             .. warning::
                 This may be ignored by your :class:`BaseGlobalRateLimiter`.
         wait:
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        idempotent:
+            Whether the request is safe to send more than once, and can be retried by :attr:`HTTPClient.retry_policy`.
+
+            If this is :data:`None`, :attr:`RetryPolicy.methods` decides it from the HTTP method.
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits and retries.
+
+            Requests that are estimated to miss it are rejected before they use a spot in the rate limit.
+            See :meth:`HTTPClient.estimate_wait`
+        tenant:
+            Who the request is for, used to share the global rate limit fairly between tenants.
+
+            This defaults to :attr:`Route.guild_id`.
+
+            .. note::
+                This is only used if :attr:`BaseGlobalRateLimiter.supports_tenants` is :data:`True`, like with :class:`FairGlobalRateLimiter`.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority`` with :attr:`QoSClass.priority`,
+            and records the latency of the request in the class.
         kwargs:
             Keyword arguments to pass to :meth:`aiohttp.ClientSession.request`
 
+            ``data`` can also be a :class:`RequestBody`. ``json`` is encoded to a :class:`RequestBody` once,
+            so retries do not have to encode it again.
+
         Returns
         -------
         ClientResponse
@@ -268,12 +459,18 @@ class HTTPClient(BaseHTTPClient):
             The token was valid but you do not have permission to use do this.
         NotFoundError
             The endpoint you requested was not found or a route parameter was invalid.
+
+            With :attr:`HTTPClient.negative_cache` set, this and :exc:`ForbiddenError` may be raised from the cache without doing a request.
         InternalServerError
             Discord is having issues. Try again later.
         HTTPRequestStatusError
             A non-200 status code was returned.
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        InvalidRequestBudgetExceededError
+            The request was rejected by :attr:`HTTPClient.invalid_request_guard` to avoid a cloudflare ban.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         # Make sure we have a session
         if self._session is None:
@@ -281,6 +478,13 @@ class HTTPClient(BaseHTTPClient):
         if self._session.closed:
             raise RuntimeError("HTTPClient is closed")
 
+        if self.negative_cache is not None:
+            self.negative_cache.check(route, rate_limit_key)
+
+        if qos is not None:
+            bucket_priority = global_priority = qos.priority
+            started_at = qos.last_request_at = monotonic()
+
         # Get the per user rate limit storage
         rate_limit_storage = self.rate_limit_storages[rate_limit_key]
 
@@ -291,40 +495,314 @@ class HTTPClient(BaseHTTPClient):
         # Merge default headers with user provided ones
         headers = {**self.default_headers, **headers}
 
+        # Encode the body once, so retries send the same bytes instead of encoding it again.
+        if kwargs.get("json") is not None:
+            kwargs["data"] = RequestBody.json(kwargs.pop("json"))
+        body = kwargs.get("data")
+        if isinstance(body, RequestBody):
+            kwargs["data"] = body.data
+            headers["Content-Type"] = body.content_type
+
+        if tenant is UNDEFINED:
+            tenant = route.guild_id
+        single_flight_key = self._single_flight_key(
+            route, headers, kwargs, (bucket_priority, global_priority, wait, idempotent, tenant)
+        )
+
+        send = self._send(
+            route,
+            rate_limit_key,
+            rate_limit_storage,
+            headers,
+            bucket_priority=bucket_priority,
+            global_priority=global_priority,
+            wait=wait,
+            idempotent=idempotent,
+            # A shared request can not use the deadline of one caller, it is applied per caller below instead.
+            deadline=deadline if single_flight_key is None else None,
+            tenant=tenant,
+            kwargs=kwargs,
+        )
+        if single_flight_key is not None:
+            send = self._share(send, single_flight_key)
+        if deadline is not None:
+            send = self._with_deadline(send, deadline)
+        if qos is None:
+            return await send
+
+        try:
+            return await send
+        finally:
+            qos.record(monotonic() - started_at)  # pyright: ignore [reportUnboundVariable]
+
+    def _single_flight_key(
+        self, route: Route, headers: dict[str, str], kwargs: dict[str, Any], options: tuple[Hashable, ...]
+    ) -> Hashable | None:
+        # Only side effect free requests without a body can be shared.
+        # Requests are only shared with requests that wait, retry and are prioritized the same way.
+        if not self.single_flight or route.method != "GET" or kwargs.keys() - {"params"}:
+            return None
+        params = kwargs.get("params") or {}
+        try:
+            return (route.path, headers.get("Authorization"), tuple(sorted(params.items())), options)
+        except (AttributeError, TypeError):
+            return None  # Query parameters we can not compare
+
+    async def _share(self, send: Coroutine[Any, Any, ClientResponse], key: Hashable) -> ClientResponse:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = create_task(self._read_response(send))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            send.close()  # Never awaited, the request in flight is used instead.
+
+        # Shielded so one caller being cancelled does not cancel the request for the rest.
+        return await shield(task)
+
+    async def _read_response(self, send: Awaitable[ClientResponse]) -> ClientResponse:
+        response = await send
+        # Read the body now, so every caller reads the same buffered body instead of the connection.
+        await response.read()
+        return response
+
+    async def _with_deadline(self, send: Awaitable[ClientResponse], deadline: float) -> ClientResponse:
+        try:
+            return await wait_for(send, deadline - monotonic())
+        except AsyncioTimeoutError:
+            if monotonic() < deadline:
+                raise  # A timeout from the request itself
+            raise DeadlineExceededError() from None
+
+    def _held_back(self, priority: int) -> float:
+        # The share of the rate limits kept free for classes more important than this priority.
+        # Classes that have been idle for a while lend their share out.
+        if not self.qos_classes:
+            return 0
+        now = monotonic()
+        return sum(qos.reserved for qos in self.qos_classes if qos.priority < priority and qos.active(now))
+
+    async def _send(
+        self,
+        route: Route,
+        rate_limit_key: str | None,
+        rate_limit_storage: RateLimitStorage,
+        headers: dict[str, str],
+        *,
+        bucket_priority: int,
+        global_priority: int,
+        wait: bool,
+        idempotent: bool | None,
+        deadline: float | None,
+        tenant: Hashable,
+        kwargs: dict[str, Any],
+    ) -> ClientResponse:
+        assert self._session is not None, "_request checks this"
+
+        global_rate_limiter = rate_limit_storage.global_rate_limiter
+        # Limiters only take tenant and held_back when they support them.
+        global_acquire: Callable[..., AsyncContextManager[None]] = (
+            partial(global_rate_limiter.acquire, tenant=tenant)
+            if global_rate_limiter.supports_tenants
+            else global_rate_limiter.acquire
+        )
+
         retries = max(self.max_retries + 1, 1)
 
-        for _ in range(retries):
-            bucket = await self._get_bucket(route, rate_limit_storage)
-            async with bucket.acquire(priority=bucket_priority, wait=wait):
-                if not route.ignore_global:
-                    async with rate_limit_storage.global_rate_limiter.acquire(priority=global_priority, wait=wait):
-                        logger.info("Requesting %s %s", route.method, route.path)
+        rate_limited = 0
+        error_retries = 0
+        retry = False
+        while rate_limited < retries:
+            if self.invalid_request_guard is not None:
+                await self.invalid_request_guard.check(global_priority)
+            if self.resource_backoffs or self._global_backoffs:
+                await self._wait_for_backoff(route, rate_limit_key, wait)
+
+            # Worked out for every attempt, as classes may have gone idle or active while this request waited.
+            bucket_held_back = self._held_back(bucket_priority)
+            global_held_back = self._held_back(global_priority) if global_rate_limiter.supports_reservations else 0
+
+            bucket = None
+            if rate_limit_storage.supports_nowait:
+                # Fast path for in-memory storages, the bucket usually already exists.
+                bucket = rate_limit_storage.get_bucket_by_nextcore_id_nowait(route.bucket)
+            if bucket is None:
+                bucket = await self._get_bucket(route, rate_limit_storage)
+
+            if deadline is not None:
+                # Reject requests that can not make it before they take a spot.
+                estimated_wait = self._estimate_wait(
+                    route, rate_limit_key, rate_limit_storage, bucket, bucket_priority, global_priority
+                )
+                if estimated_wait >= deadline - monotonic():
+                    raise DeadlineExceededError(estimated_wait)
+            try:
+                async with bucket.acquire(priority=bucket_priority, wait=wait, retry=retry, held_back=bucket_held_back):
+                    if not route.ignore_global:
+                        global_lock = (
+                            global_acquire(priority=global_priority, wait=wait, held_back=global_held_back)
+                            if global_held_back
+                            else global_acquire(priority=global_priority, wait=wait)
+                        )
+                        async with global_lock:
+                            logger.info("Requesting %s %s", route.method, route.path)
+                            response = await self._session.request(
+                                route.method,
+                                route.BASE_URL + route.path,
+                                headers=headers,
+                                timeout=self.timeout,
+                                **kwargs,
+                            )
+                    else:
+                        # Interactions are immune to global rate limits, ignore them here.
+                        logger.info("Requesting (NO-GLOBAL) %s %s", route.method, route.path)
                         response = await self._session.request(
                             route.method, route.BASE_URL + route.path, headers=headers, timeout=self.timeout, **kwargs
                         )
-                else:
-                    # Interactions are immune to global rate limits, ignore them here.
-                    logger.info("Requesting (NO-GLOBAL) %s %s", route.method, route.path)
-                    response = await self._session.request(
-                        route.method, route.BASE_URL + route.path, headers=headers, timeout=self.timeout, **kwargs
-                    )
-                await self._update_bucket(response, route, bucket, rate_limit_storage)
+                    await self._update_bucket(response, route, bucket, rate_limit_storage)
+
+                    logger.debug("Response status: %s", response.status)
+                    await self.dispatcher.dispatch("request_response", response)
+
+                    # Response handling
+                    if response.status < 300:
+                        # Ok!
+                        return response
+
+                    try:
+                        scope, retry_after = await self._handle_response_error(route, response, rate_limit_storage)
+                    except (NotFoundError, ForbiddenError) as error:
+                        if self.negative_cache is not None:
+                            self.negative_cache.add(route, rate_limit_key, error)
+                        raise
+
+                    # Rate limited. Park the request where the rate limit is until it is allowed again.
+                    self.rate_limit_retries[scope] += 1
+                    if scope == "shared":
+                        # Shared rate limits are per resource, not per bucket.
+                        self.resource_backoffs.record(route.path, retry_after)
+                    elif scope == "global":
+                        until = monotonic() + retry_after
+                        self._global_backoffs[rate_limit_key] = max(self._global_backoffs.get(rate_limit_key, 0), until)
+                    else:
+                        # Keep the spot until the bucket is paused, so no other request gets in before the pause.
+                        bucket.backoff(retry_after)
+            except Exception as error:
+                retry_policy = self.retry_policy
+                if retry_policy is None or not retry_policy.should_retry(
+                    route.method, error, error_retries, idempotent=idempotent
+                ):
+                    raise
+                delay = retry_policy.delay(error_retries)
+                error_retries += 1
+                self.request_retries[_retry_reason(error)] += 1
+                logger.warning("Retrying %s %s in %.2fs after %r", route.method, route.path, delay, error)
+                await sleep(delay)
+                retry = True
+                continue
+            rate_limited += 1
+            retry = True
 
-                logger.debug("Response status: %s", response.status)
-                await self.dispatcher.dispatch("request_response", response)
+        raise RateLimitingFailedError(self.max_retries, response)  # pyright: ignore [reportUnboundVariable]
 
-                # Response handling
-                if response.status < 300:
-                    # Ok!
-                    return response
+    async def estimate_wait(
+        self, route: Route, rate_limit_key: str | None, *, bucket_priority: int = 0, global_priority: int = 0
+    ) -> float:
+        """Estimate how many seconds a request would wait for the rate limits before being sent.
 
-                await self._handle_response_error(route, response, rate_limit_storage)
+        This uses the state of the bucket, the global rate limiter and any backoff after a ``429``.
+        The estimate is a lower bound, so a request may wait longer but not shorter.
 
-        raise RateLimitingFailedError(self.max_retries, response)  # pyright: ignore [reportUnboundVariable]
+        Parameters
+        ----------
+        route:
+            The route to estimate for.
+        rate_limit_key:
+            The rate limit key the route would be requested with.
+        bucket_priority:
+            The bucket priority the request would have.
+        global_priority:
+            The global priority the request would have.
+        """
+        rate_limit_storage = self.rate_limit_storages[rate_limit_key]
+        if rate_limit_storage.supports_nowait:
+            bucket = rate_limit_storage.get_bucket_by_nextcore_id_nowait(route.bucket)
+        else:
+            bucket = await rate_limit_storage.get_bucket_by_nextcore_id(route.bucket)
+        return self._estimate_wait(route, rate_limit_key, rate_limit_storage, bucket, bucket_priority, global_priority)
+
+    def batch(
+        self,
+        requests: Iterable[BatchRequest] | AsyncIterable[BatchRequest],
+        *,
+        max_in_flight: int = 50,
+        lookahead: int = 1000,
+    ) -> BatchExecutor:
+        """Do a lot of requests as fast as the rate limits allow.
+
+        Requests for buckets with a spot free are sent first, and results are returned as they finish.
+        See :class:`BatchExecutor`
+
+        .. code-block:: python3
+
+            async for result in http_client.batch(requests):
+                ...
+
+        Parameters
+        ----------
+        requests:
+            The requests to do. This can be a iterable or a async iterable, and is only read as far as needed.
+        max_in_flight:
+            How many requests can be sent or waiting in a bucket at once.
+        lookahead:
+            How many requests are read ahead of the ones being sent, to find requests for buckets with a spot free.
+        """
+        return BatchExecutor(self, requests, max_in_flight=max_in_flight, lookahead=lookahead)
+
+    def _estimate_wait(
+        self,
+        route: Route,
+        rate_limit_key: str | None,
+        rate_limit_storage: RateLimitStorage,
+        bucket: Bucket | None,
+        bucket_priority: int,
+        global_priority: int,
+    ) -> float:
+        estimate = self.resource_backoffs.delay(route.path)
+        if bucket is not None:
+            estimate = max(estimate, bucket.estimate_wait(priority=bucket_priority))
+        if not route.ignore_global:
+            estimate = max(estimate, rate_limit_storage.global_rate_limiter.estimate_wait(priority=global_priority))
+            if rate_limit_key in self._global_backoffs:
+                estimate = max(estimate, self._global_backoffs[rate_limit_key] - monotonic())
+        return estimate
+
+    async def _wait_for_backoff(self, route: Route, rate_limit_key: str | None, wait: bool) -> None:
+        delay = self.resource_backoffs.delay(route.path)
+        if not route.ignore_global and rate_limit_key in self._global_backoffs:
+            global_delay = self._global_backoffs[rate_limit_key] - monotonic()
+            if global_delay <= 0:
+                del self._global_backoffs[rate_limit_key]
+            delay = max(delay, global_delay)
+
+        if delay <= 0:
+            return
+        if not wait:
+            raise RateLimitedError()
+        logger.debug("Waiting %ss for a rate limit on %s %s", delay, route.method, route.path)
+        await sleep(delay)
+
+    async def _handle_response_error(
+        self, route: Route, response: ClientResponse, storage: RateLimitStorage
+    ) -> tuple[str, float]:
+        """Raises the error for a response, or returns the scope and retry_after of a ``429``."""
+        if self.invalid_request_guard is not None and response.status in (401, 403, 429):
+            # Shared rate limits are out of our control and do not count towards a cloudflare ban
+            if response.headers.get("X-RateLimit-Scope") != "shared":
+                self.invalid_request_guard.record()
 
-    async def _handle_response_error(self, route: Route, response: ClientResponse, storage: RateLimitStorage) -> None:
         if response.status == 429:
-            await self._handle_rate_limited_error(route, response, storage)
+            return await self._handle_rate_limited_error(route, response, storage)
         else:
             error = await response.json()
             if response.status == 400:
@@ -341,13 +819,14 @@ class HTTPClient(BaseHTTPClient):
 
     async def _handle_rate_limited_error(
         self, route: Route, response: ClientResponse, storage: RateLimitStorage
-    ) -> None:
+    ) -> tuple[str, float]:
         # Cloudflare bans arent proxied so via is not sent
         # These bans are usually 1h, however they can be permenant due to repeat offense.
         if "via" not in response.headers:
             raise CloudflareBanError()
 
         error = await response.json()
+        retry_after: float = error["retry_after"]
 
         if "X-RateLimit-Scope" in response.headers:
             scope = response.headers["X-RateLimit-Scope"]
@@ -377,11 +856,14 @@ class HTTPClient(BaseHTTPClient):
 
             if is_global:
                 storage.global_rate_limiter.update(error["retry_after"])
+                scope = "global"
             else:
                 logger.warning(
                     "Received rate-limited response from a shared or bucket rate limit! No header was present. Bucket: %s",
                     route.bucket,
                 )
+                scope = "user"
+        return scope, retry_after
 
     async def connect_to_gateway(
         self,
@@ -448,7 +930,12 @@ class HTTPClient(BaseHTTPClient):
 
         Strategy:
         - Get by calculated id (:attr:`Route.bucket`)
+        - Get the linked bucket by the Discord bucket hash in :class:`BucketMetadata` found through the route (:attr:`Route.route`)
         - Create new based on :class:`BucketMetadata` found through the route (:attr:`Route.route`)
+        - Create new based on :attr:`HTTPClient.bucket_metadata_snapshot`
+
+          Storages where :attr:`RateLimitStorage.creates_buckets_on_lookup` is set get the snapshot metadata stored
+          the first time a route is used instead.
         - Create a new bucket with no info
 
         Parameters
@@ -461,15 +948,34 @@ class HTTPClient(BaseHTTPClient):
         # TODO: Can this be written better?
         bucket = await rate_limit_storage.get_bucket_by_nextcore_id(route.bucket)
         if bucket is not None:
+            if rate_limit_storage.creates_buckets_on_lookup:
+                # The storage created the bucket, so the snapshot fallback below is never reached.
+                await self._seed_metadata(route, rate_limit_storage)
             # Bucket already exists
             return bucket
 
         metadata = await rate_limit_storage.get_bucket_metadata(route.route)
 
+        if metadata is None:
+            # Use what was learned before a restart
+            metadata = self.bucket_metadata_snapshot.get(route.route)
+            if metadata is not None:
+                await rate_limit_storage.store_metadata(route.route, metadata)
+
         if metadata is not None:
+            if metadata.bucket_hash is not None:
+                # Other buckets of this route are linked to a Discord bucket, join it right away.
+                bucket = await rate_limit_storage.get_bucket_by_discord_id(metadata.bucket_hash)
+                if bucket is not None:
+                    await rate_limit_storage.store_bucket_by_nextcore_id(route.bucket, bucket)
+                    return bucket
+
             # Create a new bucket with info from the metadata
-            bucket = Bucket(metadata)
+            bucket = Bucket(metadata, max_blind_requests=self.max_blind_requests, priority_aging=self.priority_aging)
             await rate_limit_storage.store_bucket_by_nextcore_id(route.bucket, bucket)
+            if metadata.bucket_hash is not None:
+                # Let the next buckets of this route join this one before the first response arrives.
+                await rate_limit_storage.store_bucket_by_discord_id(metadata.bucket_hash, bucket)
             return bucket
 
         # Create a new bucket with no info
@@ -478,11 +984,24 @@ class HTTPClient(BaseHTTPClient):
         await rate_limit_storage.store_metadata(route.route, metadata)
 
         # Create the bucket
-        bucket = Bucket(metadata)
+        bucket = Bucket(metadata, max_blind_requests=self.max_blind_requests, priority_aging=self.priority_aging)
         await rate_limit_storage.store_bucket_by_nextcore_id(route.bucket, bucket)
 
         return bucket
 
+    async def _seed_metadata(self, route: Route, rate_limit_storage: RateLimitStorage) -> None:
+        key = (rate_limit_storage, route.route)
+        if key in self._seeded_routes:
+            return
+        self._seeded_routes.add(key)
+
+        metadata = self.bucket_metadata_snapshot.get(route.route)
+        if metadata is None:
+            return
+        # Do not overwrite what other processes sharing the storage have learned already.
+        if await rate_limit_storage.get_bucket_metadata(route.route) is None:
+            await rate_limit_storage.store_metadata(route.route, metadata)
+
     async def _update_bucket(
         self, response: ClientResponse, route: Route, bucket: Bucket, rate_limit_storage: RateLimitStorage
     ) -> None:
@@ -500,6 +1019,7 @@ class HTTPClient(BaseHTTPClient):
                 # No rate limit headers and no error, this is likely a route with no rate limits.
                 bucket.metadata.unlimited = True
                 await bucket.update(unlimited=True)
+                self.bucket_metadata_snapshot.set(route.route, bucket.metadata)
             return
         # Convert reset_at to reset_after
         if self.trust_local_time:
@@ -511,12 +1031,28 @@ class HTTPClient(BaseHTTPClient):
         # Update metadata
         # TODO: This isnt very extensible. Maybe make a async .update function?
         bucket.metadata.limit = limit
+        if bucket.metadata.min_limit is None or limit < bucket.metadata.min_limit:
+            bucket.metadata.min_limit = limit
         bucket.metadata.unlimited = False
+        bucket.metadata.bucket_hash = bucket_hash
+        self.bucket_metadata_snapshot.set(route.route, bucket.metadata)
 
         # Auto-link buckets based on bucket_hash
+        if rate_limit_storage.supports_nowait:
+            linked_bucket = rate_limit_storage.get_bucket_by_discord_id_nowait(bucket_hash)
+            if linked_bucket is not None:
+                if linked_bucket is not bucket:
+                    bucket.migrate_to(linked_bucket)
+                rate_limit_storage.store_bucket_by_nextcore_id_nowait(route.bucket, linked_bucket)
+            else:
+                # Automatically linking them
+                rate_limit_storage.store_bucket_by_discord_id_nowait(bucket_hash, bucket)
+            return
+
         linked_bucket = await rate_limit_storage.get_bucket_by_discord_id(bucket_hash)
         if linked_bucket is not None:
-            # TODO: Migrate pending requests to the linked bucket
+            if linked_bucket is not bucket:
+                bucket.migrate_to(linked_bucket)
             await rate_limit_storage.store_bucket_by_nextcore_id(route.bucket, linked_bucket)
         else:
             # Automatically linking them
@@ -44,6 +44,7 @@ if TYPE_CHECKING:
     from discord_typings.interactions.commands import Locales
 
     from ...authentication import BearerAuthentication, BotAuthentication
+    from ...qos import QoSClass
 
 logger = getLogger(__name__)
 
@@ -67,6 +68,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[ApplicationCommandData]:  # TODO: Narrow typing to never include guild_id and localization overload
         """Gets all global commands
 
@@ -89,11 +92,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -121,6 +131,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -142,6 +154,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ApplicationCommandData:  # TODO: Narrow typing to never include guild_id
         """Creates or updates a global application command
 
@@ -215,11 +229,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -259,6 +280,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -273,6 +296,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ApplicationCommandData:  # TODO: Narrow typing to never include guild_id
         """Gets a global command
 
@@ -297,12 +322,19 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -329,6 +361,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -351,6 +385,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ApplicationCommandData:  # TODO: Narrow typing to never include guild_id
         """Updates a global application command
 
@@ -424,12 +460,19 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -478,6 +521,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -492,6 +537,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a global command
 
@@ -501,6 +548,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -527,6 +576,11 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
         """
         route = Route(
             "GET",
@@ -542,6 +596,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -555,6 +611,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[ApplicationCommandData]:  # TODO: Narrow typing to never include guild_id
         """Creates or updates a global application command
 
@@ -585,12 +643,19 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -613,6 +678,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -628,6 +695,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[
         ApplicationCommandData
     ]:  # TODO: Narrow typing to always include guild_id and localization overload and never dm_permission
@@ -654,12 +723,19 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -692,6 +768,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -713,6 +791,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ApplicationCommandData:  # TODO: Narrow typing to never include guild_id
         """Creates or updates a guild command
 
@@ -783,11 +863,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -830,6 +917,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -845,6 +934,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ApplicationCommandData:  # TODO: Narrow typing to never include guild_id
         """Gets a guild command
 
@@ -871,11 +962,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -903,6 +1001,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -925,6 +1025,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ApplicationCommandData:  # TODO: Narrow typing
         """Updates a guild application command
 
@@ -995,11 +1097,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1049,6 +1158,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1064,6 +1175,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a guild command
 
@@ -1092,11 +1205,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1119,6 +1239,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1133,6 +1255,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[ApplicationCommandData]:  # TODO: Narrow typing to always include guild_id
         """Bulk overwrite guild commands
 
@@ -1165,11 +1289,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1199,6 +1330,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1213,6 +1346,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[GuildApplicationCommandPermissionData]:
         """Gets all application command permissions in a guild
 
@@ -1239,11 +1374,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1270,6 +1412,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1285,6 +1429,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildApplicationCommandPermissionData:
         """Gets permissions for a command in a guild
 
@@ -1311,11 +1457,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1343,6 +1496,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1360,6 +1515,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> MessageData:
         """Gets the first response sent to a interaction
 
@@ -1382,11 +1539,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1412,6 +1576,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1427,6 +1593,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes the first response sent to a interaction
 
@@ -1452,11 +1620,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1477,6 +1652,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     # TODO: Add Create Followup Message
@@ -1490,6 +1667,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> MessageData:
         """Gets a response sent to a interaction by message id
 
@@ -1514,11 +1693,18 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1545,6 +1731,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1560,6 +1748,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> MessageData:
         """Deletes a response sent to a interaction by message id
 
@@ -1584,12 +1774,19 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1611,6 +1808,8 @@ class ApplicationCommandsHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -25,16 +25,18 @@ from abc import ABC
 from typing import TYPE_CHECKING
 
 from ....common import UNDEFINED, UndefinedType
+from ...paginator import Paginator
 from ...route import Route
 from ..abstract_client import AbstractHTTPClient
 
 if TYPE_CHECKING:
     from typing import Final
 
-    from discord_typings import AuditLogData, Snowflake
+    from discord_typings import AuditLogData, AuditLogEntryData, Snowflake
     from discord_typings.resources.audit_log import AuditLogEvents
 
     from ...authentication import BotAuthentication
+    from ...qos import QoSClass
 
 __all__: Final[tuple[str, ...]] = ("AuditLogHTTPWrappers",)
 
@@ -59,6 +61,8 @@ class AuditLogHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> AuditLogData:
         """Gets the guild audit log.
 
@@ -100,11 +104,18 @@ class AuditLogHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -142,7 +153,83 @@ class AuditLogHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
         return await r.json()  # type: ignore [no-any-return]
+
+    def iter_guild_audit_log_entries(
+        self,
+        authentication: BotAuthentication,
+        guild_id: Snowflake,
+        *,
+        user_id: int | UndefinedType = UNDEFINED,
+        action_type: AuditLogEvents | UndefinedType = UNDEFINED,
+        before: int | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[AuditLogEntryData]:
+        """Iterates over the entries in the guild audit log, from newest to oldest.
+
+        This requests the pages with :meth:`AuditLogHTTPWrappers.get_guild_audit_log`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``VIEW_AUDIT_LOG`` permission.
+
+        .. note::
+            Only the entries are returned, not the users, webhooks and integrations they refer to.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        guild_id:
+            The guild to get the audit log from.
+        user_id:
+            Only include entries made by this user.
+        action_type:
+            Only include entries of this type.
+        before:
+            Get entries with a id lower than this.
+        page_size:
+            How many entries to get per request. This has to be between 1-100.
+        max_items:
+            The most entries to return. If this is :data:`None`, every entry is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[AuditLogEntryData]
+            A async iterator over the entries.
+        """
+
+        async def fetch(cursor: int | UndefinedType, limit: int) -> tuple[list[AuditLogEntryData], int | None]:
+            page = await self.get_guild_audit_log(
+                authentication,
+                guild_id,
+                user_id=user_id,
+                action_type=action_type,
+                before=cursor,
+                limit=limit,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            entries = page["audit_log_entries"]
+            return entries, Paginator.snowflake_cursor(entries, limit, forwards=False)
+
+        return Paginator(fetch, cursor=before, page_size=page_size, max_items=max_items, prefetch=prefetch)
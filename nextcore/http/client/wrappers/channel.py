@@ -25,9 +25,9 @@ from abc import ABC
 from typing import TYPE_CHECKING, overload
 from urllib.parse import quote
 
-from aiohttp import FormData
-
-from ....common import UNDEFINED, UndefinedType, json_dumps
+from ....common import UNDEFINED, UndefinedType
+from ...paginator import Paginator
+from ...request_body import RequestBody
 from ...route import Route
 from ..abstract_client import AbstractHTTPClient
 
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
 
     from ...authentication import BearerAuthentication, BotAuthentication
     from ...file import File
+    from ...qos import QoSClass
 
 __all__: Final[tuple[str, ...]] = ("ChannelHTTPWrappers",)
 
@@ -74,6 +75,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ChannelData:
         """Gets a channel by ID.
 
@@ -93,11 +96,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -122,6 +132,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -139,6 +151,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ChannelData:
         """Modifies the group dm.
 
@@ -173,12 +187,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -212,6 +233,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -239,6 +262,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ChannelData:
         """Modifies a guild channel.
 
@@ -330,12 +355,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -391,6 +423,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -411,6 +445,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ThreadChannelData:
         """Modifies a thread.
 
@@ -452,11 +488,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -498,6 +541,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -512,6 +557,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a channel.
 
@@ -541,12 +588,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -572,6 +626,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     @overload
@@ -585,6 +641,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[MessageData]:
         ...
 
@@ -599,6 +657,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[MessageData]:
         ...
 
@@ -613,6 +673,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[MessageData]:
         ...
 
@@ -625,6 +687,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[MessageData]:
         ...
 
@@ -640,6 +704,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[MessageData]:
         """Gets messages from a channel.
 
@@ -687,12 +753,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -729,6 +802,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -749,9 +824,13 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         files: Iterable[File] | UndefinedType = UNDEFINED,
         attachments: list[AttachmentData] | UndefinedType = UNDEFINED,  # TODO: Partial
         flags: int | UndefinedType = UNDEFINED,
+        nonce: int | str | UndefinedType = UNDEFINED,
+        enforce_nonce: bool | UndefinedType = UNDEFINED,
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> MessageData:
         """Creates a message in a channel.
 
@@ -806,6 +885,15 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
 
             .. note::
                 Only the ``SUPRESS_EMBEDS`` flag can be set.
+        nonce:
+            A value to verify that the message was sent.
+        enforce_nonce:
+            Whether Discord should return the message that was already sent with the same ``nonce``
+            instead of sending it again.
+
+            .. hint::
+                This makes the request safe to retry, so it will be retried by :attr:`HTTPClient.retry_policy`
+                after a server error or a timeout.
         global_priority:
             The priority of the request for the global rate-limiter.
         bucket_priority:
@@ -814,12 +902,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -863,16 +958,16 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             payload["attachments"] = attachments
         if flags is not UNDEFINED:
             payload["flags"] = flags
-
-        # Create a form data response as files cannot be uploaded via json.
-        form = FormData()
-        form.add_field("payload_json", json_dumps(payload))
-
-        # Add files
-        if files is not UNDEFINED:
-            for file_id, file in enumerate(files):
-                # Content type seems to have no effect here.
-                form.add_field(f"file[{file_id}]", file.contents, filename=file.name)
+        if nonce is not UNDEFINED:
+            payload["nonce"] = nonce
+        if enforce_nonce is not UNDEFINED:
+            payload["enforce_nonce"] = enforce_nonce
+
+        # Create a multipart body as files cannot be uploaded via json.
+        # This is encoded once, so it can be sent again if the request is retried.
+        form = RequestBody.multipart(
+            payload, [] if files is UNDEFINED else [(f"file[{file_id}]", file) for file_id, file in enumerate(files)]
+        )
 
         r = await self._request(
             route,
@@ -882,6 +977,10 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            # Discord sends back the existing message instead of a duplicate when the nonce is enforced.
+            idempotent=True if enforce_nonce is True and nonce is not UNDEFINED else None,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -896,6 +995,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> MessageData:
         """Publishes a message in a news channel
 
@@ -922,11 +1023,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -950,7 +1058,12 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         headers = {"Authorization": str(authentication)}
 
         r = await self._request(
-            route, rate_limit_key=authentication.rate_limit_key, headers=headers, global_priority=global_priority
+            route,
+            rate_limit_key=authentication.rate_limit_key,
+            headers=headers,
+            global_priority=global_priority,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -966,6 +1079,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Creates a reaction to a message.
 
@@ -996,12 +1111,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1031,6 +1153,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def delete_own_reaction(
@@ -1043,6 +1167,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a reaction from a message.
 
@@ -1068,11 +1194,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1100,6 +1233,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def delete_user_reaction(
@@ -1113,6 +1248,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a reaction from a message from another user.
 
@@ -1146,12 +1283,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1180,6 +1324,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_reactions(
@@ -1194,6 +1340,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[UserData]:
         """Gets the reactions to a message.
 
@@ -1232,11 +1380,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1284,6 +1439,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1298,6 +1455,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes all reactions from a message.
 
@@ -1325,12 +1484,19 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         aiohttp.ClientConnectorError
             Could not connect due to a problem with your connection
         UnauthorizedError
@@ -1358,6 +1524,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def delete_all_reactions_for_emoji(
@@ -1370,6 +1538,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes all reactions from a message with a specific emoji.
 
@@ -1401,11 +1571,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "DELETE",
@@ -1423,6 +1600,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def edit_message(
@@ -1441,6 +1620,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> MessageData:
         """Edits a message.
 
@@ -1496,11 +1677,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -1530,14 +1718,9 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             payload["attachments"] = attachments
 
         # This is a special case where we need to send the files as a multipart form
-        form = FormData()
-        if files is not UNDEFINED:
-            if files is None:
-                raise NotImplementedError("What is this even supposed to do?")
-            for file in files:
-                form.add_field("file", file.contents, filename=file.name)
-
-        form.add_field("payload_json", json_dumps(payload))
+        if files is None:
+            raise NotImplementedError("What is this even supposed to do?")
+        form = RequestBody.multipart(payload, [] if files is UNDEFINED else [("file", file) for file in files])
 
         r = await self._request(
             route,
@@ -1547,6 +1730,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -1562,6 +1747,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a message.
 
@@ -1594,11 +1781,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "DELETE", "/channels/{channel_id}/messages/{message_id}", channel_id=channel_id, message_id=message_id
@@ -1617,6 +1811,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def bulk_delete_messages(
@@ -1629,6 +1825,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes multiple messages.
 
@@ -1671,11 +1869,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("POST", "/channels/{channel_id}/messages/bulk-delete", channel_id=channel_id)
         headers = {"Authorization": str(authentication)}
@@ -1693,6 +1898,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def edit_channel_permissions(
@@ -1708,6 +1915,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Edits the permissions of a channel.
 
@@ -1754,11 +1963,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "PUT",
@@ -1790,6 +2006,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_channel_invites(
@@ -1800,6 +2018,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[InviteMetadata]:
         """Gets the invites for a channel.
 
@@ -1822,11 +2042,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -1843,6 +2070,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -1864,6 +2093,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> InviteData:
         ...
 
@@ -1883,6 +2114,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> InviteData:
         ...
 
@@ -1902,6 +2135,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> InviteData:
         ...
 
@@ -1920,6 +2155,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> InviteData:
         """Creates an invite for a channel.
 
@@ -1969,11 +2206,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -2008,6 +2252,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2023,6 +2269,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a channel permission.
 
@@ -2044,11 +2292,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "DELETE", "/channels/{channel_id}/permissions/{target_id}", channel_id=channel_id, target_id=target_id
@@ -2067,6 +2322,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def follow_news_channel(
@@ -2078,6 +2335,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> FollowedChannelData:
         """Follows a news channel.
 
@@ -2102,11 +2361,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -2125,6 +2391,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2138,6 +2406,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Triggers a typing indicator.
 
@@ -2157,11 +2427,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("POST", "/channels/{channel_id}/typing", channel_id=channel_id)
         headers = {"Authorization": str(authentication)}
@@ -2173,6 +2450,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_pinned_messages(
@@ -2183,6 +2462,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[MessageData]:
         """Gets the pinned messages of a channel.
 
@@ -2205,11 +2486,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -2226,6 +2514,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2241,6 +2531,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Pins a message.
 
@@ -2273,11 +2565,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PUT", "/channels/{channel_id}/pins/{message_id}", channel_id=channel_id, message_id=message_id)
         headers = {"Authorization": str(authentication)}
@@ -2294,6 +2593,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def unpin_message(
@@ -2305,6 +2606,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Unpins a message.
 
@@ -2329,11 +2632,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "DELETE", "/channels/{channel_id}/pins/{message_id}", channel_id=channel_id, message_id=message_id
@@ -2347,6 +2657,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def group_dm_add_recipient(
@@ -2358,6 +2670,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Adds a recipient to a group DM.
 
@@ -2379,11 +2693,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PUT", "/channels/{channel_id}/recipients/{user_id}", channel_id=channel_id, user_id=user_id)
         headers = {"Authorization": str(authentication)}
@@ -2395,6 +2716,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def group_dm_remove_recipient(
@@ -2406,6 +2729,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Removes a recipient from a group DM.
 
@@ -2427,17 +2752,29 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("DELETE", "/channels/{channel_id}/recipients/{user_id}", channel_id=channel_id, user_id=user_id)
         headers = {"Authorization": str(authentication)}
 
         await self._request(
-            route, rate_limit_key=authentication.rate_limit_key, headers=headers, global_priority=global_priority
+            route,
+            rate_limit_key=authentication.rate_limit_key,
+            headers=headers,
+            global_priority=global_priority,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def start_thread_from_message(
@@ -2453,6 +2790,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ChannelData:
         """Starts a thread from a message.
 
@@ -2483,11 +2822,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "POST",
@@ -2522,6 +2868,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2541,6 +2889,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ChannelData:
         """Starts a thread without a message
 
@@ -2572,11 +2922,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -2619,6 +2976,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2634,6 +2993,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Joins a thread.
 
@@ -2653,17 +3014,29 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PUT", "/channels/{channel_id}/thread-members/@me", channel_id=channel_id)
         headers = {"Authorization": str(authentication)}
 
         await self._request(
-            route, rate_limit_key=authentication.rate_limit_key, headers=headers, global_priority=global_priority
+            route,
+            rate_limit_key=authentication.rate_limit_key,
+            headers=headers,
+            global_priority=global_priority,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def add_thread_member(
@@ -2675,6 +3048,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Adds a member to a thread
 
@@ -2699,11 +3074,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PUT", "/channels/{channel_id}/thread-members/{user_id}", channel_id=channel_id, user_id=user_id)
 
@@ -2714,6 +3096,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def leave_thread(
@@ -2724,6 +3108,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Leaves a thread
 
@@ -2746,11 +3132,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("DELETE", "/channels/{channel_id}/thread-members/@me", channel_id=channel_id)
 
@@ -2761,6 +3154,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def remove_thread_member(
@@ -2772,6 +3167,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Removes a member from a thread
 
@@ -2801,11 +3198,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "DELETE", "/channels/{channel_id}/thread-members/{user_id}", channel_id=channel_id, user_id=user_id
@@ -2818,6 +3222,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_thread_member(
@@ -2829,6 +3235,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> ThreadMemberData:
         """Gets a thread member.
 
@@ -2850,11 +3258,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`.
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         :exc:`NotFoundError`
             The member is not part of the thread.
         """
@@ -2867,6 +3282,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2880,6 +3297,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[ThreadMemberData]:
         """Gets all thread members
 
@@ -2902,11 +3321,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/channels/{channel_id}/thread-members", channel_id=channel_id)
 
@@ -2917,6 +3343,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2932,6 +3360,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> HasMoreListThreadsData:
         """List public archived threads
 
@@ -2956,11 +3386,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         params: dict[str, str] = {}
 
@@ -2981,6 +3418,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -2996,6 +3435,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> HasMoreListThreadsData:
         """List private archived threads
 
@@ -3020,11 +3461,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         params: dict[str, str] = {}
 
@@ -3045,6 +3493,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -3060,6 +3510,8 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> HasMoreListThreadsData:
         """List private archived threads the bot has joined.
 
@@ -3084,11 +3536,18 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         params: dict[str, str] = {}
 
@@ -3109,7 +3568,358 @@ class ChannelHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
         return await r.json()  # type: ignore [no-any-return]
+
+    def iter_channel_messages(
+        self,
+        authentication: BotAuthentication,
+        channel_id: Snowflake,
+        *,
+        before: int | UndefinedType = UNDEFINED,
+        after: int | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[MessageData]:
+        """Iterates over the messages in a channel.
+
+        This requests the pages with :meth:`ChannelHTTPWrappers.get_channel_messages`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``view_channel`` permission.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        channel_id:
+            The id of the channel to get messages from.
+        before:
+            Get messages before this message id, from newest to oldest.
+
+            .. note::
+                If neither ``before`` or ``after`` is provided, this starts at the newest message.
+        after:
+            Get messages after this message id, from oldest to newest.
+        page_size:
+            How many messages to get per request. This has to be between 1-100.
+        max_items:
+            The most messages to return. If this is :data:`None`, every message is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[MessageData]
+            A async iterator over the messages.
+        """
+        forwards = after is not UNDEFINED
+
+        async def fetch(cursor: int | UndefinedType, limit: int) -> tuple[list[MessageData], int | None]:
+            if forwards:
+                page = await self.get_channel_messages(  # type: ignore [call-overload]
+                    authentication,
+                    channel_id,
+                    after=cursor,
+                    limit=limit,
+                    bucket_priority=bucket_priority,
+                    global_priority=global_priority,
+                    qos=qos,
+                )
+                # Pages are newest first, even when going forwards.
+                page.sort(key=lambda message: int(message["id"]))
+            else:
+                page = await self.get_channel_messages(  # type: ignore [call-overload]
+                    authentication,
+                    channel_id,
+                    before=cursor,
+                    limit=limit,
+                    bucket_priority=bucket_priority,
+                    global_priority=global_priority,
+                    qos=qos,
+                )
+            return page, Paginator.snowflake_cursor(page, limit, forwards=forwards)
+
+        return Paginator(
+            fetch, cursor=after if forwards else before, page_size=page_size, max_items=max_items, prefetch=prefetch
+        )
+
+    def iter_reactions(
+        self,
+        authentication: BotAuthentication,
+        channel_id: Snowflake,
+        message_id: Snowflake,
+        emoji: str,
+        *,
+        after: Snowflake | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[UserData]:
+        """Iterates over the users that reacted to a message with a emoji.
+
+        This requests the pages with :meth:`ChannelHTTPWrappers.get_reactions`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``READ_MESSAGE_HISTORY`` permission.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        channel_id:
+            The id of the channel where the message is located.
+        message_id:
+            The id of the message to get the reactions from.
+        emoji:
+            The emoji to get reactions for
+        after:
+            Get users with a id higher than this.
+        page_size:
+            How many users to get per request. This has to be between 1-100.
+        max_items:
+            The most users to return. If this is :data:`None`, every user is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[UserData]
+            A async iterator over the users.
+        """
+
+        async def fetch(cursor: Snowflake | UndefinedType, limit: int) -> tuple[list[UserData], int | None]:
+            page = await self.get_reactions(
+                authentication,
+                channel_id,
+                message_id,
+                emoji,
+                after=cursor,
+                limit=limit,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            return page, Paginator.snowflake_cursor(page, limit, forwards=True)
+
+        return Paginator(fetch, cursor=after, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+    def iter_public_archived_threads(
+        self,
+        authentication: BotAuthentication,
+        channel_id: Snowflake,
+        *,
+        before: str | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[ThreadChannelData]:
+        """Iterates over the public archived threads in a channel, from most to least recently archived.
+
+        This requests the pages with :meth:`ChannelHTTPWrappers.list_public_archived_threads`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``READ_MESSAGE_HISTORY`` permission.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        channel_id:
+            The channel to get threads from
+        before:
+            A ISO8601 timestamp threads have to be archived before to be included.
+        page_size:
+            How many threads to get per request.
+        max_items:
+            The most threads to return. If this is :data:`None`, every thread is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[ThreadChannelData]
+            A async iterator over the threads.
+        """
+
+        async def fetch(cursor: str | UndefinedType, limit: int) -> tuple[list[ThreadChannelData], str | None]:
+            page = await self.list_public_archived_threads(
+                authentication,
+                channel_id,
+                before=cursor,
+                limit=limit,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            threads = page["threads"]
+            if not page["has_more"] or not threads:
+                return threads, None
+            return threads, threads[-1]["thread_metadata"]["archive_timestamp"]
+
+        return Paginator(fetch, cursor=before, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+    def iter_private_archived_threads(
+        self,
+        authentication: BotAuthentication,
+        channel_id: Snowflake,
+        *,
+        before: str | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[ThreadChannelData]:
+        """Iterates over the private archived threads in a channel, from most to least recently archived.
+
+        This requests the pages with :meth:`ChannelHTTPWrappers.list_private_archived_threads`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``READ_MESSAGE_HISTORY`` and ``MANAGE_THREADS`` permission.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        channel_id:
+            The channel to get threads from
+        before:
+            A ISO8601 timestamp threads have to be archived before to be included.
+        page_size:
+            How many threads to get per request.
+        max_items:
+            The most threads to return. If this is :data:`None`, every thread is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[ThreadChannelData]
+            A async iterator over the threads.
+        """
+
+        async def fetch(cursor: str | UndefinedType, limit: int) -> tuple[list[ThreadChannelData], str | None]:
+            page = await self.list_private_archived_threads(
+                authentication,
+                channel_id,
+                before=cursor,
+                limit=limit,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            threads = page["threads"]
+            if not page["has_more"] or not threads:
+                return threads, None
+            return threads, threads[-1]["thread_metadata"]["archive_timestamp"]
+
+        return Paginator(fetch, cursor=before, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+    def iter_joined_private_archived_threads(
+        self,
+        authentication: BotAuthentication,
+        channel_id: Snowflake,
+        *,
+        before: Snowflake | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[ThreadChannelData]:
+        """Iterates over the private archived threads in a channel the bot has joined.
+
+        This requests the pages with :meth:`ChannelHTTPWrappers.list_joined_private_archived_threads`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``READ_MESSAGE_HISTORY`` permission.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        channel_id:
+            The channel to get threads from
+        before:
+            Get threads with a id lower than this.
+        page_size:
+            How many threads to get per request.
+        max_items:
+            The most threads to return. If this is :data:`None`, every thread is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[ThreadChannelData]
+            A async iterator over the threads.
+        """
+
+        async def fetch(cursor: Snowflake | UndefinedType, limit: int) -> tuple[list[ThreadChannelData], str | None]:
+            page = await self.list_joined_private_archived_threads(
+                authentication,
+                channel_id,
+                before=cursor if cursor is UNDEFINED else str(cursor),
+                limit=limit,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            threads = page["threads"]
+            if not page["has_more"] or not threads:
+                return threads, None
+            return threads, str(min(int(thread["id"]) for thread in threads))
+
+        return Paginator(fetch, cursor=before, page_size=page_size, max_items=max_items, prefetch=prefetch)
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from discord_typings import EmojiData, Snowflake
 
     from ...authentication import BotAuthentication
+    from ...qos import QoSClass
 
 __all__: Final[tuple[str, ...]] = ("EmojiHTTPWrappers",)
 
@@ -54,6 +55,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[EmojiData]:
         """List all emojis in a guild.
 
@@ -73,11 +76,18 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/emojis", guild_id=guild_id)
 
@@ -88,6 +98,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -102,6 +114,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[EmojiData]:
         """Get emoji info
 
@@ -123,11 +137,18 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/emojis/{emoji_id}", guild_id=guild_id, emoji_id=emoji_id)
 
@@ -138,6 +159,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -157,6 +180,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> EmojiData:
         """Modify a emoji
 
@@ -189,11 +214,18 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("PATCH", "/guilds/{guild_id}/emojis/{emoji_id}", guild_id=guild_id, emoji_id=emoji_id)
@@ -222,6 +254,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -237,6 +271,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[EmojiData]:
         """Delete a emoji
 
@@ -266,11 +302,18 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("DELETE", "/guilds/{guild_id}/emojis/{emoji_id}", guild_id=guild_id, emoji_id=emoji_id)
 
@@ -286,6 +329,8 @@ class EmojiHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from discord_typings import GetGatewayBotData, GetGatewayData
 
     from ...authentication import BotAuthentication
+    from ...qos import QoSClass
 
 logger = getLogger(__name__)
 
@@ -77,6 +78,8 @@ class GatewayHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GetGatewayBotData:
         """Gets gateway connection information.
 
@@ -100,11 +103,18 @@ class GatewayHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -119,6 +129,8 @@ class GatewayHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -26,6 +26,7 @@ from logging import getLogger
 from typing import TYPE_CHECKING, overload
 
 from ....common import UNDEFINED, UndefinedType
+from ...paginator import Paginator
 from ...route import Route
 from ..abstract_client import AbstractHTTPClient
 
@@ -54,6 +55,7 @@ if TYPE_CHECKING:
     )
 
     from ...authentication import BearerAuthentication, BotAuthentication
+    from ...qos import QoSClass
 
 logger = getLogger(__name__)
 
@@ -86,6 +88,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildData:
         """Create a guild
 
@@ -154,11 +158,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("POST", "/guilds")
         payload: dict[str, Any] = {"name": name}
@@ -194,6 +205,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -208,6 +221,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildData:  # TODO: More spesific typehints due to with_counts
         """Get a guild by ID
 
@@ -227,11 +242,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}", guild_id=guild_id)
 
@@ -250,6 +272,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -263,6 +287,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildPreviewData:
         """Gets a guild preview by ID
 
@@ -285,11 +311,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/preview", guild_id=guild_id)
 
@@ -300,6 +333,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -315,6 +350,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a guild
 
@@ -340,11 +377,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("DELETE", "/guilds/{guild_id}", guild_id=guild_id)
 
@@ -355,6 +399,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_guild_channels(
@@ -365,6 +411,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[ChannelData]:
         """Gets all channels in a guild
 
@@ -384,11 +432,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/channels", guild_id=guild_id)
 
@@ -399,6 +454,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -415,6 +472,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Modifies channel positions
 
@@ -438,11 +497,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PATCH", "/guilds/{guild_id}/channels", guild_id=guild_id)
 
@@ -461,6 +527,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def list_active_guild_threads(
@@ -471,6 +539,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> HasMoreListThreadsData:  # TODO: This is not the correct type
         """List active guild threads
 
@@ -490,11 +560,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/threads/active", guild_id=guild_id)
 
@@ -505,6 +582,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -519,6 +598,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildMemberData:
         """Gets a member
 
@@ -540,11 +621,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id)
 
@@ -555,6 +643,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -570,6 +660,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[GuildMemberData]:
         """Lists members in a guild
 
@@ -604,11 +696,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/members", guild_id=guild_id)
 
@@ -629,6 +728,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -644,6 +745,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[GuildMemberData]:
         """Searches for members in the guild with a username or nickname that starts with ``query``
 
@@ -670,11 +773,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/members/search", guild_id=guild_id)
 
@@ -694,6 +804,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -713,6 +825,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildMemberData | None:
         """Adds a member to a guild
 
@@ -762,11 +876,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
 
         Returns
@@ -799,6 +920,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         if r.status == 201:
@@ -822,6 +945,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildMemberData:
         """Modifies a member
 
@@ -879,11 +1004,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -924,6 +1056,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -939,6 +1073,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildMemberData:
         """Modifies a member
 
@@ -965,11 +1101,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -1000,6 +1143,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the data from Discord
@@ -1017,6 +1162,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Add a role to a member
 
@@ -1045,11 +1192,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "PUT",
@@ -1073,6 +1227,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def remove_guild_member_role(
@@ -1086,6 +1242,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Removes a role from a member
 
@@ -1114,11 +1272,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "DELETE",
@@ -1142,6 +1307,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def remove_guild_member(
@@ -1154,6 +1321,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Removes a member from a guild
 
@@ -1180,11 +1349,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("DELETE", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id)
 
@@ -1202,6 +1378,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     @overload
@@ -1215,6 +1393,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[BanData]:
         ...
 
@@ -1229,6 +1409,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[BanData]:
         ...
 
@@ -1241,6 +1423,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[BanData]:
         ...
 
@@ -1255,6 +1439,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[BanData]:
         """Gets a list of bans in a guild.
 
@@ -1294,11 +1480,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/bans", guild_id=guild_id)
@@ -1323,6 +1516,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1337,6 +1532,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> BanData:
         """Gets a ban
 
@@ -1361,11 +1558,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id)
@@ -1377,6 +1581,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1393,6 +1599,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Bans a user from a guild
 
@@ -1421,11 +1629,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PUT", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id)
 
@@ -1451,6 +1666,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def remove_guild_ban(
@@ -1463,6 +1680,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Unbans a user from a guild
 
@@ -1489,11 +1708,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("DELETE", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id)
 
@@ -1511,6 +1737,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_guild_roles(
@@ -1521,6 +1749,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[RoleData]:
         """Gets all roles in a guild
 
@@ -1540,11 +1770,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -1560,6 +1797,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1580,6 +1819,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         ...
 
@@ -1599,6 +1840,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         ...
 
@@ -1618,6 +1861,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         ...
 
@@ -1637,6 +1882,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         """Creates a role
 
@@ -1681,11 +1928,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -1728,6 +1982,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1742,6 +1998,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[RoleData]:
         """Modifies role positions
 
@@ -1768,11 +2026,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/roles", guild_id=guild_id)
 
@@ -1790,6 +2055,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1812,6 +2079,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         ...
 
@@ -1832,6 +2101,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         ...
 
@@ -1852,6 +2123,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> RoleData:
         """Modifies a role
 
@@ -1898,11 +2171,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -1945,6 +2225,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -1960,6 +2242,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a channel.
 
@@ -1981,11 +2265,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("DELETE", "/guilds/{guild_id}/roles/{role_id}", guild_id=guild_id, role_id=role_id)
@@ -2003,6 +2294,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_guild_prune_count(
@@ -2015,6 +2308,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> dict[str, Any]:  # TODO: Replace return type
         """Gets the amount of members that would be pruned
 
@@ -2044,11 +2339,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/prune", guild_id=guild_id)
 
@@ -2070,6 +2372,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2087,6 +2391,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> dict[str, Any]:  # TODO: Replace return type
         """Gets the amount of members that would be pruned
 
@@ -2116,11 +2422,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/prune", guild_id=guild_id)
 
@@ -2152,6 +2465,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2165,6 +2480,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[VoiceRegionData]:
         """Gets voice regions for a guild.
 
@@ -2184,11 +2501,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/regions", guild_id=guild_id)
@@ -2200,6 +2524,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2213,6 +2539,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[InviteMetadata]:
         """Gets all guild invites
 
@@ -2235,11 +2563,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/invites", guild_id=guild_id)
@@ -2251,6 +2586,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2264,6 +2601,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[IntegrationData]:
         """Gets guild integrations
 
@@ -2284,11 +2623,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/invites", guild_id=guild_id)
@@ -2300,6 +2646,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2315,6 +2663,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes a integration
 
@@ -2344,11 +2694,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route(
@@ -2371,6 +2728,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def get_guild_widget_settings(
@@ -2381,6 +2740,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildWidgetSettingsData:
         """Gets widget settings for a guild
 
@@ -2403,11 +2764,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/widget", guild_id=guild_id)
@@ -2419,6 +2787,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2435,6 +2805,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildWidgetSettingsData:
         """Modifies a guilds widget settings
 
@@ -2459,11 +2831,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("PATCH", "/guilds/{guild_id}/widget", guild_id=guild_id)
@@ -2491,6 +2870,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2528,6 +2909,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildWidgetSettingsData:
         """Gets the vanity invite from a guild
 
@@ -2550,11 +2933,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/vanity-url", guild_id=guild_id)
@@ -2566,6 +2956,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2581,6 +2973,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> WelcomeScreenData:
         """Gets the welcome screen for a guild
 
@@ -2603,11 +2997,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("GET", "/guilds/{guild_id}/welcome-screen", guild_id=guild_id)
@@ -2619,6 +3020,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2636,6 +3039,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> WelcomeScreenData:
         """Modifies a guilds welcome screen
 
@@ -2664,11 +3069,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("PATCH", "/guilds/{guild_id}/welcome-screen", guild_id=guild_id)
 
@@ -2697,6 +3109,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -2713,6 +3127,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Modifies the voice state of the bot
 
@@ -2747,11 +3163,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("PATCH", "/guilds/{guild_id}/voice-states/@me", guild_id=guild_id)
@@ -2773,6 +3196,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def modify_user_voice_state(
@@ -2786,6 +3211,8 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Modifies the voice state of the bot
 
@@ -2814,11 +3241,18 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route("PATCH", "/guilds/{guild_id}/voice-states/{user_id}", guild_id=guild_id, user_id=user_id)
@@ -2838,4 +3272,150 @@ class GuildHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
+        )
+
+    def iter_guild_members(
+        self,
+        authentication: BotAuthentication,
+        guild_id: Snowflake,
+        *,
+        after: int | UndefinedType = UNDEFINED,
+        page_size: int = 1000,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[GuildMemberData]:
+        """Iterates over the members in a guild, from lowest to highest user id.
+
+        This requests the pages with :meth:`GuildHTTPWrappers.list_guild_members`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``GUILD_MEMBERS`` intent enabled in the `developer portal <https://discord.com/developers/applications>`__
+
+        Parameters
+        ----------
+        authentication:
+            Auth info.
+        guild_id:
+            The guild to get the members from
+        after:
+            What a members id has to be above for them to be returned.
+        page_size:
+            How many members to get per request. This has to be between 1-1000.
+        max_items:
+            The most members to return. If this is :data:`None`, every member is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[GuildMemberData]
+            A async iterator over the members.
+        """
+
+        async def fetch(cursor: int | UndefinedType, limit: int) -> tuple[list[GuildMemberData], int | None]:
+            page = await self.list_guild_members(
+                authentication,
+                guild_id,
+                after=cursor,
+                limit=limit,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            return page, Paginator.snowflake_cursor(page, limit, forwards=True, key="user")
+
+        return Paginator(fetch, cursor=after, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+    def iter_guild_bans(
+        self,
+        authentication: BotAuthentication,
+        guild_id: Snowflake,
+        *,
+        before: Snowflake | UndefinedType = UNDEFINED,
+        after: Snowflake | UndefinedType = UNDEFINED,
+        page_size: int = 1000,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[BanData]:
+        """Iterates over the bans in a guild.
+
+        This requests the pages with :meth:`GuildHTTPWrappers.get_guild_bans`. See :class:`Paginator`
+
+        .. note::
+            This requires the ``BAN_MEMBERS`` permission.
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        guild_id:
+            The guild to get bans from.
+        before:
+            Get bans of users with a id lower than this, from highest to lowest user id.
+        after:
+            Get bans of users with a id higher than this, from lowest to highest user id.
+
+            .. note::
+                If neither ``before`` or ``after`` is provided, this starts at the lowest user id.
+        page_size:
+            How many bans to get per request. This has to be between 1-1000.
+        max_items:
+            The most bans to return. If this is :data:`None`, every ban is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[BanData]
+            A async iterator over the bans.
+        """
+        forwards = before is UNDEFINED
+
+        async def fetch(cursor: Snowflake | UndefinedType, limit: int) -> tuple[list[BanData], int | None]:
+            if forwards:
+                page = await self.get_guild_bans(  # type: ignore [call-overload]
+                    authentication,
+                    guild_id,
+                    after=cursor,
+                    limit=limit,
+                    bucket_priority=bucket_priority,
+                    global_priority=global_priority,
+                    qos=qos,
+                )
+            else:
+                page = await self.get_guild_bans(  # type: ignore [call-overload]
+                    authentication,
+                    guild_id,
+                    before=cursor,
+                    limit=limit,
+                    bucket_priority=bucket_priority,
+                    global_priority=global_priority,
+                    qos=qos,
+                )
+            return page, Paginator.snowflake_cursor(page, limit, forwards=forwards, key="user")
+
+        return Paginator(
+            fetch, cursor=after if forwards else before, page_size=page_size, max_items=max_items, prefetch=prefetch
         )
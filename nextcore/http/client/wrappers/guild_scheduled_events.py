@@ -25,6 +25,7 @@ from abc import ABC
 from typing import TYPE_CHECKING, overload
 
 from ....common import UNDEFINED, UndefinedType
+from ...paginator import Paginator
 from ...route import Route
 from ..abstract_client import AbstractHTTPClient
 
@@ -34,10 +35,12 @@ if TYPE_CHECKING:
     from discord_typings import (
         GuildScheduledEventData,
         GuildScheduledEventEntityMetadata,
+        GuildScheduledEventUserData,
         Snowflake,
     )
 
     from ...authentication import BearerAuthentication, BotAuthentication
+    from ...qos import QoSClass
 
 __all__: Final[tuple[str, ...]] = ("GuildScheduledEventHTTPWrappers",)
 
@@ -59,6 +62,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[GuildScheduledEventData]:  # TODO: Narrow type more with a overload with_user_count
         """Gets all scheduled events for a guild
 
@@ -80,11 +85,18 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route("GET", "/guilds/{guild_id}/scheduled-events", guild_id=guild_id)
 
@@ -103,6 +115,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -126,6 +140,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildScheduledEventData:
         ...
 
@@ -147,6 +163,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildScheduledEventData:
         ...
 
@@ -168,6 +186,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildScheduledEventData:
         """Create a scheduled event
 
@@ -215,11 +235,18 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -263,6 +290,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -278,6 +307,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildScheduledEventData:  # TODO: Narrow type more with a overload with_user_count
         """Gets a scheduled event by id
 
@@ -301,11 +332,18 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
         route = Route(
             "GET",
@@ -329,6 +367,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -346,6 +386,8 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Deletes scheduled event.
 
@@ -372,11 +414,18 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         """
 
         route = Route(
@@ -393,7 +442,186 @@ class GuildScheduledEventHTTPWrappers(AbstractHTTPClient, ABC):
             headers["X-Audit-Log-Reason"] = reason
 
         await self._request(
-            route, headers=headers, rate_limit_key=authentication.rate_limit_key, global_priority=global_priority
+            route,
+            headers=headers,
+            rate_limit_key=authentication.rate_limit_key,
+            global_priority=global_priority,
+            qos=qos,
+            deadline=deadline,
+        )
+
+    async def get_guild_scheduled_event_users(
+        self,
+        authentication: BotAuthentication,
+        guild_id: Snowflake,
+        guild_scheduled_event_id: Snowflake,
+        *,
+        limit: int | UndefinedType = UNDEFINED,
+        with_member: bool | UndefinedType = UNDEFINED,
+        before: Snowflake | UndefinedType = UNDEFINED,
+        after: Snowflake | UndefinedType = UNDEFINED,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
+    ) -> list[GuildScheduledEventUserData]:
+        """Gets the users subscribed to a scheduled event
+
+        Read the `documentation <https://discord.dev/resources/guild-scheduled-event#get-guild-scheduled-event-users>`__
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        guild_id:
+            The id of the guild the event is in.
+        guild_scheduled_event_id:
+            The id of the event to get users from.
+        limit:
+            How many users to return.
+
+            .. note::
+                This has to be between 1-100.
+            .. note::
+                If this is not provided it will default to ``100``.
+        with_member:
+            Include the guild member of every user.
+        before:
+            Get users with a id lower than this.
+        after:
+            Get users with a id higher than this.
+        global_priority:
+            The priority of the request for the global rate-limiter.
+        bucket_priority:
+            The priority of the request for the bucket rate-limiter.
+        wait:
+            Wait when rate limited.
+
+            This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
+
+        Raises
+        ------
+        RateLimitedError
+            You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
+        """
+        route = Route(
+            "GET",
+            "/guilds/{guild_id}/scheduled-events/{guild_scheduled_event_id}/users",
+            guild_id=guild_id,
+            guild_scheduled_event_id=guild_scheduled_event_id,
         )
 
-    # TODO: Add Get Guild Scheduled Event Users
+        params: dict[str, str] = {}
+
+        # These have different behaviour when not provided and set to None.
+        # This only adds them if they are provided (not Undefined)
+        if limit is not UNDEFINED:
+            params["limit"] = str(limit)
+        if with_member is not UNDEFINED:
+            params["with_member"] = str(with_member).lower()
+        if before is not UNDEFINED:
+            params["before"] = str(before)
+        if after is not UNDEFINED:
+            params["after"] = str(after)
+
+        r = await self._request(
+            route,
+            headers={"Authorization": str(authentication)},
+            rate_limit_key=authentication.rate_limit_key,
+            params=params,
+            bucket_priority=bucket_priority,
+            global_priority=global_priority,
+            wait=wait,
+            qos=qos,
+            deadline=deadline,
+        )
+
+        # TODO: Make this verify the payload from discord?
+        return await r.json()  # type: ignore [no-any-return]
+
+    def iter_guild_scheduled_event_users(
+        self,
+        authentication: BotAuthentication,
+        guild_id: Snowflake,
+        guild_scheduled_event_id: Snowflake,
+        *,
+        with_member: bool | UndefinedType = UNDEFINED,
+        before: Snowflake | UndefinedType = UNDEFINED,
+        after: Snowflake | UndefinedType = UNDEFINED,
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[GuildScheduledEventUserData]:
+        """Iterates over the users subscribed to a scheduled event.
+
+        This requests the pages with :meth:`GuildScheduledEventHTTPWrappers.get_guild_scheduled_event_users`. See :class:`Paginator`
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        guild_id:
+            The id of the guild the event is in.
+        guild_scheduled_event_id:
+            The id of the event to get users from.
+        with_member:
+            Include the guild member of every user.
+        before:
+            Get users with a id lower than this, from highest to lowest id.
+        after:
+            Get users with a id higher than this, from lowest to highest id.
+
+            .. note::
+                If neither ``before`` or ``after`` is provided, this starts at the lowest id.
+        page_size:
+            How many users to get per request. This has to be between 1-100.
+        max_items:
+            The most users to return. If this is :data:`None`, every user is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[GuildScheduledEventUserData]
+            A async iterator over the users.
+        """
+        forwards = before is UNDEFINED
+
+        async def fetch(
+            cursor: Snowflake | UndefinedType, limit: int
+        ) -> tuple[list[GuildScheduledEventUserData], int | None]:
+            page = await self.get_guild_scheduled_event_users(
+                authentication,
+                guild_id,
+                guild_scheduled_event_id,
+                limit=limit,
+                with_member=with_member,
+                before=UNDEFINED if forwards else cursor,
+                after=cursor if forwards else UNDEFINED,
+                bucket_priority=bucket_priority,
+                global_priority=global_priority,
+                qos=qos,
+            )
+            return page, Paginator.snowflake_cursor(page, limit, forwards=forwards, key="user")
+
+        return Paginator(
+            fetch, cursor=after if forwards else before, page_size=page_size, max_items=max_items, prefetch=prefetch
+        )
@@ -25,6 +25,7 @@ from abc import ABC
 from typing import TYPE_CHECKING
 
 from ....common import UNDEFINED, UndefinedType
+from ...paginator import Paginator
 from ...route import Route
 from ..abstract_client import AbstractHTTPClient
 
@@ -40,6 +41,7 @@ if TYPE_CHECKING:
     )
 
     from ...authentication import BearerAuthentication, BotAuthentication
+    from ...qos import QoSClass
 
 __all__: Final[tuple[str, ...]] = ("UserHTTPWrappers",)
 
@@ -59,6 +61,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> UserData:
         """Gets the current user
 
@@ -81,11 +85,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -101,6 +112,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -114,6 +127,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> UserData:
         """Gets a user by id
 
@@ -133,11 +148,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
         Returns
         -------
         discord_typings.UserData
@@ -152,6 +174,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -166,6 +190,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> UserData:
         """Modifies the current user
 
@@ -187,11 +213,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -216,6 +249,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -231,6 +266,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[GuildData]:  # TODO: Replace with partial guild data
         """Gets the guilds the current user is in
 
@@ -268,11 +305,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -300,6 +344,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -313,6 +359,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> GuildMemberData:
         """Gets the current users member in a guild
 
@@ -335,11 +383,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -355,6 +410,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -368,6 +425,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> None:
         """Leave a guild
 
@@ -387,11 +446,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -407,6 +473,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
     async def create_dm(
@@ -417,6 +485,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> DMChannelData:
         """Creates a DM channel
 
@@ -441,11 +511,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -462,6 +539,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
@@ -476,6 +555,8 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
         bucket_priority: int = 0,
         global_priority: int = 0,
         wait: bool = True,
+        qos: QoSClass | None = None,
+        deadline: float | None = None,
     ) -> list[dict[str, Any]]:  # TODO: This should be more strict
         """Gets the users connections
 
@@ -496,11 +577,18 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             Wait when rate limited.
 
             This will raise :exc:`RateLimitedError` if set to :data:`False` and you are rate limited.
+        qos:
+            The class of the request. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+        deadline:
+            The :func:`time.monotonic` time the request has to finish by, including waiting for rate limits.
 
         Raises
         ------
         RateLimitedError
             You are rate limited, and ``wait`` was set to :data:`False`
+        DeadlineExceededError
+            The request could not finish before ``deadline``.
 
         Returns
         -------
@@ -516,7 +604,83 @@ class UserHTTPWrappers(AbstractHTTPClient, ABC):
             bucket_priority=bucket_priority,
             global_priority=global_priority,
             wait=wait,
+            qos=qos,
+            deadline=deadline,
         )
 
         # TODO: Make this verify the payload from discord?
         return await r.json()  # type: ignore [no-any-return]
+
+    def iter_current_user_guilds(
+        self,
+        authentication: BotAuthentication | BearerAuthentication,
+        *,
+        before: Snowflake | UndefinedType = UNDEFINED,
+        after: Snowflake | UndefinedType = UNDEFINED,
+        page_size: int = 200,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        bucket_priority: int = 0,
+        global_priority: int = 0,
+        qos: QoSClass | None = None,
+    ) -> Paginator[GuildData]:
+        """Iterates over the guilds the current user is in.
+
+        This requests the pages with :meth:`UserHTTPWrappers.get_current_user_guilds`. See :class:`Paginator`
+
+        Parameters
+        ----------
+        authentication:
+            Authentication info.
+        before:
+            Get guilds with a id lower than this, from highest to lowest id.
+        after:
+            Get guilds with a id higher than this, from lowest to highest id.
+
+            .. note::
+                If neither ``before`` or ``after`` is provided, this starts at the lowest id.
+        page_size:
+            How many guilds to get per request. This has to be between 1-200.
+        max_items:
+            The most guilds to return. If this is :data:`None`, every guild is returned.
+        prefetch:
+            Whether to request the next page while the current page is being iterated over.
+        global_priority:
+            The priority of the requests for the global rate-limiter.
+        bucket_priority:
+            The priority of the requests for the bucket rate-limiter.
+        qos:
+            The class of the requests. This replaces ``bucket_priority`` and ``global_priority``.
+            See :class:`QoSClass`
+
+        Returns
+        -------
+        Paginator[GuildData]
+            A async iterator over the guilds.
+        """
+        forwards = before is UNDEFINED
+
+        async def fetch(cursor: Snowflake | UndefinedType, limit: int) -> tuple[list[GuildData], int | None]:
+            if forwards:
+                page = await self.get_current_user_guilds(
+                    authentication,
+                    after=cursor,
+                    limit=limit,
+                    bucket_priority=bucket_priority,
+                    global_priority=global_priority,
+                    qos=qos,
+                )
+            else:
+                page = await self.get_current_user_guilds(
+                    authentication,
+                    before=cursor,
+                    limit=limit,
+                    bucket_priority=bucket_priority,
+                    global_priority=global_priority,
+                    qos=qos,
+                )
+            return page, Paginator.snowflake_cursor(page, limit, forwards=forwards)
+
+        return Paginator(
+            fetch, cursor=after if forwards else before, page_size=page_size, max_items=max_items, prefetch=prefetch
+        )
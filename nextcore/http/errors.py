@@ -38,6 +38,8 @@ __all__: Final[tuple[str, ...]] = (
     "NotFoundError",
     "InternalServerError",
     "CloudflareBanError",
+    "InvalidRequestBudgetExceededError",
+    "DeadlineExceededError",
 )
 
 
@@ -129,11 +131,17 @@ class HTTPRequestStatusError(Exception):
         The error json from the body.
     response:
         The response to the request.
+    status:
+        The status code of the response. This has to be set if ``response`` is :data:`None`.
 
     Attributes
     ----------
     response:
         The response to the request.
+
+        This is :data:`None` for errors raised from :class:`NegativeCache`, as the response is not kept.
+    status:
+        The status code of the response.
     error_code:
         The error code.
     message:
@@ -142,8 +150,15 @@ class HTTPRequestStatusError(Exception):
         The error json from the body.
     """
 
-    def __init__(self, error: HTTPErrorResponseData, response: ClientResponse) -> None:
-        self.response: ClientResponse = response
+    def __init__(
+        self, error: HTTPErrorResponseData, response: ClientResponse | None, *, status: int | None = None
+    ) -> None:
+        if status is None:
+            if response is None:
+                raise TypeError("status has to be set if response is None")
+            status = response.status
+        self.response: ClientResponse | None = response
+        self.status: int = status
 
         self.error_code: int = error["code"]
         self.message: str = error["message"]
@@ -182,3 +197,56 @@ class CloudflareBanError(Exception):
 
     See the `documentation <https://discord.dev/topics/rate-limits#invalid-request-limit-aka-cloudflare-bans>`__ for more info.
     """
+
+
+class InvalidRequestBudgetExceededError(Exception):
+    """A error for when a request was rejected by :class:`InvalidRequestGuard`
+
+    This happens when too many ``401``, ``403`` or ``429`` responses has been received recently,
+    and doing more requests could get you banned by cloudflare.
+
+    Parameters
+    ----------
+    count:
+        How many invalid responses has been received in the window.
+    limit:
+        How many invalid responses are allowed in the window.
+
+    Attributes
+    ----------
+    count:
+        How many invalid responses has been received in the window.
+    limit:
+        How many invalid responses are allowed in the window.
+    """
+
+    def __init__(self, count: int, limit: int) -> None:
+        self.count: int = count
+        self.limit: int = limit
+
+        super().__init__(f"Rejected request to avoid a cloudflare ban, {count} of {limit} invalid requests used")
+
+
+class DeadlineExceededError(Exception):
+    """A error for when a request could not finish before its ``deadline``.
+
+    Parameters
+    ----------
+    estimated_wait:
+        How long the request was estimated to wait for the rate limit, if it was rejected before being sent.
+
+    Attributes
+    ----------
+    estimated_wait:
+        How long the request was estimated to wait for the rate limit, if it was rejected before being sent.
+
+        This is :data:`None` if the deadline passed while doing the request.
+    """
+
+    def __init__(self, estimated_wait: float | None = None) -> None:
+        self.estimated_wait: float | None = estimated_wait
+
+        if estimated_wait is None:
+            super().__init__("The deadline passed before the request finished")
+        else:
+            super().__init__(f"The request would have to wait at least {estimated_wait:.2f}s, past its deadline")
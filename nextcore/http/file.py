@@ -46,6 +46,8 @@ class File:
             Only files ending with a `supported file extension <https://discord.dev/reference#image-formatting-image-formats>`__ can be included in embeds.
     contents:
         The contents of the file.
+    content_type:
+        The ``Content-Type`` of the file. If this is :data:`None`, it is guessed from ``name``.
 
     Attributes
     ----------
@@ -56,10 +58,13 @@ class File:
             Only files ending with a `supported file extension <https://discord.dev/reference#image-formatting-image-formats>`__ can be included in embeds.
     contents:
         The contents of the file.
+    content_type:
+        The ``Content-Type`` of the file. If this is :data:`None`, it is guessed from ``name``.
     """
 
-    __slots__ = ("name", "contents")
+    __slots__ = ("name", "contents", "content_type")
 
-    def __init__(self, name: str, contents: Contents) -> None:
+    def __init__(self, name: str, contents: Contents, *, content_type: str | None = None) -> None:
         self.name: Final[str] = name
         self.contents: Contents = contents
+        self.content_type: str | None = content_type
@@ -23,11 +23,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .adaptive import AdaptiveGlobalRateLimiter
 from .base import BaseGlobalRateLimiter
+from .fair import FairGlobalRateLimiter
 from .limited import LimitedGlobalRateLimiter
 from .unlimited import UnlimitedGlobalRateLimiter
 
 if TYPE_CHECKING:
     from typing import Final
 
-__all__: Final[tuple[str, ...]] = ("BaseGlobalRateLimiter", "UnlimitedGlobalRateLimiter", "LimitedGlobalRateLimiter")
+__all__: Final[tuple[str, ...]] = (
+    "BaseGlobalRateLimiter",
+    "UnlimitedGlobalRateLimiter",
+    "LimitedGlobalRateLimiter",
+    "AdaptiveGlobalRateLimiter",
+    "FairGlobalRateLimiter",
+)
@@ -0,0 +1,200 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from logging import getLogger
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from ...common import TimesPer
+from .base import BaseGlobalRateLimiter
+
+if TYPE_CHECKING:
+    from typing import ClassVar, Final, Literal
+
+__all__: Final[tuple[str, ...]] = ("AdaptiveGlobalRateLimiter",)
+
+logger = getLogger(__name__)
+
+
+class AdaptiveGlobalRateLimiter(TimesPer, BaseGlobalRateLimiter):
+    """A global rate-limiter that learns the real global rate limit.
+
+    This starts at ``limit`` requests per second and adjusts it with additive increase and multiplicative decrease:
+
+    - On a global 429 the limit is multiplied by ``decrease_factor``, and all requests wait for ``retry_after``.
+    - If every spot in a second was used and there has been no global 429 for ``increase_after`` seconds,
+      the limit is raised by ``increase``.
+
+    This lets bots that Discord has given a higher global rate limit use it,
+    while slowing down bots that hit the global rate limit.
+
+    Parameters
+    ----------
+    limit:
+        The amount of requests per second to start at.
+    min_limit:
+        The lowest the limit can be lowered to.
+    max_limit:
+        The highest the limit can be raised to. If this is :data:`None` there is no maximum.
+    increase:
+        How many requests per second to add when raising the limit.
+    decrease_factor:
+        What to multiply the limit by on a global 429.
+    increase_after:
+        How many seconds without a global 429 before the limit is raised.
+    algorithm:
+        How requests are spread out over the second. See :class:`~nextcore.common.TimesPer`
+
+    Attributes
+    ----------
+    min_limit:
+        The lowest the limit can be lowered to.
+    max_limit:
+        The highest the limit can be raised to. If this is :data:`None` there is no maximum.
+    increase:
+        How many requests per second to add when raising the limit.
+    decrease_factor:
+        What to multiply the limit by on a global 429.
+    increase_after:
+        How many seconds without a global 429 before the limit is raised.
+    rate_limited:
+        How many global 429s has been received.
+    """
+
+    __slots__ = (
+        "min_limit",
+        "max_limit",
+        "increase",
+        "decrease_factor",
+        "increase_after",
+        "rate_limited",
+        "_paused_until",
+        "_last_change",
+    )
+
+    supports_reservations: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        limit: int = 50,
+        *,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        increase: int = 1,
+        decrease_factor: float = 0.5,
+        increase_after: float = 10,
+        algorithm: Literal["fixed_window", "sliding_log", "pacing"] = "fixed_window",
+    ) -> None:
+        TimesPer.__init__(self, limit, 1, algorithm=algorithm)
+        self.min_limit: int = min_limit
+        self.max_limit: int | None = max_limit
+        self.increase: int = increase
+        self.decrease_factor: float = decrease_factor
+        self.increase_after: float = increase_after
+        self.rate_limited: int = 0
+        self._paused_until: float = 0
+        self._last_change: float = monotonic()
+
+    @property
+    def estimated_limit(self) -> int:
+        """The current estimate of the global rate limit in requests per second."""
+        return self.limit
+
+    def update(self, retry_after: float) -> None:
+        """Lower the limit and pause all requests after a global 429.
+
+        Parameters
+        ----------
+        retry_after:
+            The time from the `retry_after` field in the JSON response or the `retry_after` header.
+
+            .. hint::
+                The JSON field has more precision than the header.
+        """
+        self.rate_limited += 1
+        now = monotonic()
+
+        if now >= self._paused_until:
+            # Requests that were already in flight will also get a 429, only lower it once for all of them.
+            new_limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+            logger.warning(
+                "Exceeded global rate-limit! Lowering the limit from %s to %s (Retry after: %s)",
+                self.limit,
+                new_limit,
+                retry_after,
+            )
+            self.limit = new_limit
+            self.remaining = min(self.remaining, new_limit)
+        else:
+            logger.debug("Exceeded global rate-limit while paused (Retry after: %s)", retry_after)
+        self._last_change = now
+
+        paused_until = now + retry_after
+        if paused_until > self._paused_until:
+            self._paused_until = paused_until
+            get_running_loop().call_later(retry_after, self._release_pending)
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Estimate how many seconds a new request would wait for a spot.
+
+        This is a lower bound, see :meth:`TimesPer.estimate_wait <nextcore.common.TimesPer.estimate_wait>`.
+
+        Parameters
+        ----------
+        priority:
+            The priority the request would have.
+        """
+        return max(self._paused_until - monotonic(), super().estimate_wait(priority=priority))
+
+    def _available(self, now: float, held: int = 0) -> bool:
+        if now < self._paused_until:
+            return False
+        return super()._available(now, held)
+
+    def _schedule_wake(self, now: float) -> None:
+        if now < self._paused_until:
+            return  # The end of the pause releases the waiters
+        if self._pending and self.algorithm != "fixed_window":
+            self._maybe_increase()
+        super()._schedule_wake(now)
+
+    def _reset(self) -> None:
+        if self.remaining <= 0:
+            self._maybe_increase()
+        super()._reset()
+
+    def _maybe_increase(self) -> None:
+        # Every spot was used, try a higher limit if it has been quiet for a while.
+        now = monotonic()
+        if now - self._last_change < self.increase_after:
+            return
+        if self.max_limit is not None and self.limit >= self.max_limit:
+            return
+
+        new_limit = self.limit + self.increase
+        if self.max_limit is not None:
+            new_limit = min(new_limit, self.max_limit)
+        logger.info("No global rate limits for a while, raising the limit from %s to %s", self.limit, new_limit)
+        self.limit = new_limit
+        self._last_change = now
@@ -25,7 +25,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import AsyncContextManager, Final, TypeVar
+    from typing import AsyncContextManager, ClassVar, Final, TypeVar
 
     ExceptionT = TypeVar("ExceptionT", bound=BaseException)
 
@@ -38,11 +38,25 @@ class BaseGlobalRateLimiter(ABC):
     .. warning::
         This does not contain any implementation!
 
-        You are probably looking for :class:`LimitedGlobalRateLimiter` or :class:`UnlimitedGlobalRateLimiter`
+        You are probably looking for :class:`LimitedGlobalRateLimiter`, :class:`AdaptiveGlobalRateLimiter` or :class:`UnlimitedGlobalRateLimiter`
+
+    Attributes
+    ----------
+    supports_tenants:
+        Whether :meth:`BaseGlobalRateLimiter.acquire` takes a ``tenant`` keyword argument.
+
+        :class:`HTTPClient` passes who a request is for if this is :data:`True`. See :class:`FairGlobalRateLimiter`
+    supports_reservations:
+        Whether :meth:`BaseGlobalRateLimiter.acquire` takes a ``held_back`` keyword argument.
+
+        :class:`HTTPClient` passes the share of the limit kept free for more important :class:`QoSClass` es if this is :data:`True`.
     """
 
     __slots__ = ()
 
+    supports_tenants: ClassVar[bool] = False
+    supports_reservations: ClassVar[bool] = False
+
     @abstractmethod
     def acquire(self, *, priority: int = 0, wait: bool = True) -> AsyncContextManager[None]:
         """Use a spot in the rate-limit.
@@ -79,3 +93,16 @@ class BaseGlobalRateLimiter(ABC):
                 The JSON field has more precision than the header.
         """
         ...
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Estimate how many seconds a new request would wait for a spot.
+
+        This is a lower bound. The default implementation always returns ``0``.
+
+        Parameters
+        ----------
+        priority:
+            The priority the request would have.
+        """
+        del priority  # Unused
+        return 0
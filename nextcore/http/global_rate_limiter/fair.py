@@ -0,0 +1,226 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Future
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from logging import getLogger
+from typing import TYPE_CHECKING, AsyncIterator
+
+from ...common.errors import RateLimitedError
+from ...common.times_per.priority_queue_container import PriorityQueueContainer
+from ...common.waiter_queue import WaiterQueue
+from .base import BaseGlobalRateLimiter
+from .limited import LimitedGlobalRateLimiter
+
+if TYPE_CHECKING:
+    from typing import ClassVar, Final, Hashable, Literal, Mapping
+
+__all__: Final[tuple[str, ...]] = ("FairGlobalRateLimiter",)
+
+logger = getLogger(__name__)
+
+
+class _Tenant:
+    __slots__ = ("weight", "deficit", "queue")
+
+    def __init__(self, weight: float) -> None:
+        self.weight: float = weight
+        self.deficit: float = 0
+        self.queue: WaiterQueue[PriorityQueueContainer] = WaiterQueue()
+
+
+class FairGlobalRateLimiter(BaseGlobalRateLimiter):
+    """A global rate-limiter that shares the rate limit fairly between tenants.
+
+    Requests that have to wait are grouped by tenant, which :class:`HTTPClient` sets to the guild id of the route by default.
+    Tenants take turns with deficit round robin, so one guild doing a lot of requests can not starve every other guild.
+    A tenant with a weight of ``2`` gets twice as many turns as a tenant with a weight of ``1``.
+    Inside a tenant, requests are ordered by priority.
+
+    Parameters
+    ----------
+    limit:
+        The amount of requests that can be made per second.
+    weights:
+        The weight of specific tenants.
+    default_weight:
+        The weight of tenants not in ``weights``.
+    algorithm:
+        How requests are spread out over the second. See :class:`~nextcore.common.TimesPer`
+
+    Raises
+    ------
+    ValueError
+        A weight was not above ``0``.
+
+    Attributes
+    ----------
+    weights:
+        The weight of specific tenants. Changes apply once a tenant has no requests waiting.
+    default_weight:
+        The weight of tenants not in ``weights``.
+    """
+
+    __slots__ = ("weights", "default_weight", "_limiter", "_tenants", "_admitting")
+
+    supports_tenants: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        limit: int = 50,
+        *,
+        weights: Mapping[Hashable, float] | None = None,
+        default_weight: float = 1,
+        algorithm: Literal["fixed_window", "sliding_log", "pacing"] = "fixed_window",
+    ) -> None:
+        if default_weight <= 0 or any(weight <= 0 for weight in (weights or {}).values()):
+            raise ValueError("Weights have to be above 0")
+
+        self.weights: dict[Hashable, float] = dict(weights or {})
+        self.default_weight: float = default_weight
+        self._limiter: LimitedGlobalRateLimiter = LimitedGlobalRateLimiter(limit, algorithm=algorithm)
+        self._tenants: OrderedDict[Hashable, _Tenant] = OrderedDict()  # Tenants with requests waiting, in turn order
+        self._admitting: bool = False  # Whether a request has been let through and is waiting for a spot
+
+    @asynccontextmanager
+    async def acquire(self, *, priority: int = 0, wait: bool = True, tenant: Hashable = None) -> AsyncIterator[None]:
+        """Use a spot in the rate-limit.
+
+        Parameters
+        ----------
+        priority:
+            The request priority. **Lower** number means it will be requested earlier than other requests from the tenant.
+        wait:
+            Whether to wait for a spot in the rate limit.
+
+            If this is :data:`False`, this will raise :exc:`RateLimitedError` instead.
+        tenant:
+            Who the request is for.
+
+        Raises
+        ------
+        RateLimitedError
+            ``wait`` was set to :data:`False` and there was no more spots in the rate limit.
+        """
+        if not self._tenants and not self._admitting and self._limiter.estimate_wait(priority=priority) == 0:
+            # Nobody is waiting, so there is nothing to be fair about.
+            async with self._limiter.acquire(priority=priority, wait=wait):
+                yield
+            return
+
+        if not wait:
+            raise RateLimitedError()
+
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = self._tenants[tenant] = _Tenant(self.weights.get(tenant, self.default_weight))
+        container = PriorityQueueContainer(priority, Future())
+        state.queue.push(container)
+        if not self._admitting:
+            self._admit_next()
+
+        try:
+            await container.future
+        except CancelledError:
+            if not state.queue.remove(container):
+                # Cancelled after being let through, let the next request through instead.
+                self._admit_next()
+            elif not state.queue and self._tenants.get(tenant) is state:
+                del self._tenants[tenant]
+            raise
+
+        entered = False
+        try:
+            async with self._limiter.acquire(priority=priority):
+                entered = True
+                self._admit_next()
+                yield
+        finally:
+            if not entered:
+                self._admit_next()
+
+    def update(self, retry_after: float) -> None:
+        """A function that gets called whenever the global rate-limit gets exceeded
+
+        This just makes a warning log.
+        """
+        self._limiter.update(retry_after)
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Estimate how many seconds a new request would wait for a spot.
+
+        This is a lower bound, as it does not know which tenant the request is for.
+
+        Parameters
+        ----------
+        priority:
+            The priority the request would have.
+        """
+        return self._limiter.estimate_wait(priority=priority)
+
+    def queue_depth(self, tenant: Hashable) -> int:
+        """How many requests from a tenant are waiting.
+
+        Parameters
+        ----------
+        tenant:
+            The tenant to check.
+        """
+        state = self._tenants.get(tenant)
+        return 0 if state is None else len(state.queue)
+
+    def queue_depths(self) -> dict[Hashable, int]:
+        """How many requests are waiting per tenant, for every tenant with requests waiting."""
+        return {tenant: len(state.queue) for tenant, state in self._tenants.items() if state.queue}
+
+    def _admit_next(self) -> None:
+        # Deficit round robin. The tenant at the front gets its weight added to its deficit at the start of its turn,
+        # and lets a request through for every 1 deficit it has. Then it goes to the back.
+        tenants = self._tenants
+        while tenants:
+            tenant, state = next(iter(tenants.items()))
+            if not state.queue:
+                # Every request from it was cancelled
+                del tenants[tenant]
+                continue
+            if state.deficit < 1:
+                state.deficit += state.weight
+                if state.deficit < 1:
+                    # Weights below 1 take more than one round to get a turn.
+                    tenants.move_to_end(tenant)
+                    continue
+
+            state.deficit -= 1
+            container = state.queue.pop()
+            if not state.queue:
+                # Tenants do not keep their deficit while they have nothing waiting.
+                del tenants[tenant]
+            elif state.deficit < 1:
+                tenants.move_to_end(tenant)
+
+            self._admitting = True
+            container.future.set_result(None)
+            return
+        self._admitting = False
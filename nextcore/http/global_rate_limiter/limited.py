@@ -28,7 +28,7 @@ from ...common import TimesPer
 from .base import BaseGlobalRateLimiter
 
 if TYPE_CHECKING:
-    from typing import Final
+    from typing import ClassVar, Final, Literal
 
 __all__: Final[tuple[str, ...]] = ("LimitedGlobalRateLimiter",)
 
@@ -42,12 +42,18 @@ class LimitedGlobalRateLimiter(TimesPer, BaseGlobalRateLimiter):
     ----------
     limit:
         The amount of requests that can be made per second.
+    algorithm:
+        How requests are spread out over the second. See :class:`~nextcore.common.TimesPer`
     """
 
     __slots__ = ()
 
-    def __init__(self, limit: int = 50) -> None:
-        TimesPer.__init__(self, limit, 1)
+    supports_reservations: ClassVar[bool] = True
+
+    def __init__(
+        self, limit: int = 50, *, algorithm: Literal["fixed_window", "sliding_log", "pacing"] = "fixed_window"
+    ) -> None:
+        TimesPer.__init__(self, limit, 1, algorithm=algorithm)
 
     def update(self, retry_after: float) -> None:
         """A function that gets called whenever the global rate-limit gets exceeded
@@ -0,0 +1,188 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import sleep
+from collections import deque
+from logging import getLogger
+from math import floor
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .errors import InvalidRequestBudgetExceededError
+
+if TYPE_CHECKING:
+    from typing import Final
+
+__all__: Final[tuple[str, ...]] = ("InvalidRequestGuard",)
+
+logger = getLogger(__name__)
+
+
+class InvalidRequestGuard:
+    """Keeps track of ``401``, ``403`` and ``429`` responses to avoid a cloudflare ban.
+
+    Discord bans your IP for an hour if it gets more than ``limit`` invalid responses in ``per`` seconds.
+    See the `documentation <https://discord.dev/topics/rate-limits#invalid-request-limit-aka-cloudflare-bans>`__ for more info.
+
+    Invalid responses are counted in a sliding window with a resolution of one second.
+
+    - Below ``soft_threshold`` of the limit, requests are not affected.
+    - Between ``soft_threshold`` and ``hard_threshold``, requests with a priority number higher than ``shed_priority`` are rejected,
+      and the rest are delayed more and more as the count goes up, up to ``max_delay`` seconds.
+    - At ``hard_threshold`` and above, every request is rejected until old responses leave the window.
+
+    The same guard can be passed to multiple :class:`HTTPClient` to share the budget between them.
+    To share it between processes, override :meth:`InvalidRequestGuard.record` and :attr:`InvalidRequestGuard.count`.
+
+    Parameters
+    ----------
+    limit:
+        How many invalid responses Discord allows in ``per`` seconds.
+    per:
+        The size of the window in seconds.
+    soft_threshold:
+        The fraction of ``limit`` where requests start getting throttled and low priority requests get rejected.
+    hard_threshold:
+        The fraction of ``limit`` where every request gets rejected.
+    max_delay:
+        How many seconds requests are delayed right before ``hard_threshold``.
+    shed_priority:
+        Requests with a priority number higher than this are rejected once ``soft_threshold`` is reached.
+
+    Attributes
+    ----------
+    limit:
+        How many invalid responses Discord allows in ``per`` seconds.
+    per:
+        The size of the window in seconds.
+    soft_threshold:
+        The fraction of ``limit`` where requests start getting throttled and low priority requests get rejected.
+    hard_threshold:
+        The fraction of ``limit`` where every request gets rejected.
+    max_delay:
+        How many seconds requests are delayed right before ``hard_threshold``.
+    shed_priority:
+        Requests with a priority number higher than this are rejected once ``soft_threshold`` is reached.
+    rejected:
+        How many requests has been rejected.
+    """
+
+    __slots__ = (
+        "limit",
+        "per",
+        "soft_threshold",
+        "hard_threshold",
+        "max_delay",
+        "shed_priority",
+        "rejected",
+        "_window",
+        "_count",
+    )
+
+    def __init__(
+        self,
+        limit: int = 10_000,
+        per: float = 600,
+        *,
+        soft_threshold: float = 0.5,
+        hard_threshold: float = 0.9,
+        max_delay: float = 5,
+        shed_priority: int = 0,
+    ) -> None:
+        if not 0 < soft_threshold <= hard_threshold <= 1:
+            raise ValueError("Thresholds has to be 0 < soft_threshold <= hard_threshold <= 1")
+
+        self.limit: int = limit
+        self.per: float = per
+        self.soft_threshold: float = soft_threshold
+        self.hard_threshold: float = hard_threshold
+        self.max_delay: float = max_delay
+        self.shed_priority: int = shed_priority
+        self.rejected: int = 0
+
+        # Internals
+        self._window: deque[list[int]] = deque()  # [second, count] pairs, oldest first
+        self._count: int = 0
+
+    def record(self, amount: int = 1) -> None:
+        """Count invalid responses.
+
+        Parameters
+        ----------
+        amount:
+            How many invalid responses to count.
+        """
+        second = floor(monotonic())
+        if self._window and self._window[-1][0] == second:
+            self._window[-1][1] += amount
+        else:
+            self._window.append([second, amount])
+        self._count += amount
+
+    @property
+    def count(self) -> int:
+        """How many invalid responses has been received in the last ``per`` seconds."""
+        expires_before = monotonic() - self.per
+        while self._window and self._window[0][0] < expires_before:
+            _, count = self._window.popleft()
+            self._count -= count
+        return self._count
+
+    @property
+    def remaining(self) -> int:
+        """How many more invalid responses can be received before Discord bans you."""
+        return max(self.limit - self.count, 0)
+
+    async def check(self, priority: int = 0) -> None:
+        """Wait until a request may be done, or reject it.
+
+        Parameters
+        ----------
+        priority:
+            The priority of the request. **Lower** priority is rejected last.
+
+        Raises
+        ------
+        InvalidRequestBudgetExceededError
+            The request was rejected to protect the remaining budget.
+        """
+        used = self.count / self.limit
+
+        if used < self.soft_threshold:
+            return
+
+        if used >= self.hard_threshold or priority > self.shed_priority:
+            self.rejected += 1
+            logger.warning(
+                "Rejecting request with priority %s, %s of %s invalid requests used", priority, self.count, self.limit
+            )
+            raise InvalidRequestBudgetExceededError(self.count, self.limit)
+
+        # Throttle the remaining requests more the closer the count gets to the hard threshold.
+        if self.hard_threshold == self.soft_threshold:
+            return
+        progress = (used - self.soft_threshold) / (self.hard_threshold - self.soft_threshold)
+        delay = self.max_delay * progress
+        logger.debug("Delaying request for %ss, %s of %s invalid requests used", delay, self.count, self.limit)
+        await sleep(delay)
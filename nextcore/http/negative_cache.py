@@ -0,0 +1,244 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from logging import getLogger
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+    from discord_typings import HTTPErrorResponseData
+    from typing_extensions import TypeAlias
+
+    from .errors import HTTPRequestStatusError
+    from .route import Route
+
+    NegativeCacheKey: TypeAlias = "tuple[str | None, str, str]"
+
+__all__: Final[tuple[str, ...]] = ("NegativeCache",)
+
+# Events that can change whether a route is forbidden or not found.
+_INVALIDATING_EVENTS: Final[frozenset[str]] = frozenset(("GUILD_CREATE", "GUILD_UPDATE", "GUILD_DELETE"))
+_INVALIDATING_EVENT_PREFIXES: Final[tuple[str, ...]] = ("CHANNEL_", "THREAD_", "GUILD_ROLE_", "GUILD_MEMBER_")
+
+logger = getLogger(__name__)
+
+
+class _NegativeCacheEntry:
+    __slots__ = ("expires_at", "error_type", "error", "status", "snowflakes")
+
+    def __init__(
+        self,
+        expires_at: float,
+        error_type: type[HTTPRequestStatusError],
+        error: HTTPErrorResponseData,
+        status: int,
+        snowflakes: tuple[str, ...],
+    ) -> None:
+        self.expires_at: float = expires_at
+        self.error_type: type[HTTPRequestStatusError] = error_type
+        self.error: HTTPErrorResponseData = error
+        self.status: int = status
+        self.snowflakes: tuple[str, ...] = snowflakes
+
+
+class NegativeCache:
+    """Remembers routes that failed with a ``403`` or ``404`` to fail fast when they are requested again.
+
+    Requesting a deleted channel or a guild you no longer have access to costs a rate limit spot,
+    and counts towards a cloudflare ban. This makes the same request fail locally for ``ttl`` seconds instead.
+
+    Entries are per rate limit key, method and formatted path.
+
+    **Example usage**
+
+    .. code-block:: python3
+
+        http_client = HTTPClient(negative_cache=NegativeCache())
+
+        # Forget about channels, guilds, roles etc. when the gateway says they changed.
+        shard_manager.event_dispatcher.add_listener(http_client.negative_cache.on_dispatch)
+
+    Parameters
+    ----------
+    ttl:
+        How many seconds to remember a failed route for.
+    max_entries:
+        How many failed routes to remember. The least recently failed ones are removed first.
+
+    Attributes
+    ----------
+    ttl:
+        How many seconds to remember a failed route for.
+    max_entries:
+        How many failed routes to remember.
+    hits:
+        How many requests has been failed from the cache.
+    """
+
+    __slots__ = ("ttl", "max_entries", "hits", "_entries", "_by_snowflake")
+
+    def __init__(self, ttl: float = 30, max_entries: int = 10_000) -> None:
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+
+        # Internals
+        # Every entry has the same ttl, so insertion order is also expiry order.
+        self._entries: OrderedDict[NegativeCacheKey, _NegativeCacheEntry] = OrderedDict()
+        self._by_snowflake: dict[str, set[NegativeCacheKey]] = {}
+
+    def __len__(self) -> int:
+        self._evict_expired(monotonic())
+        return len(self._entries)
+
+    def check(self, route: Route, rate_limit_key: str | None) -> None:
+        """Raise the remembered error if the route failed recently.
+
+        Parameters
+        ----------
+        route:
+            The route to check.
+        rate_limit_key:
+            The rate limit key the route is requested with.
+
+        Raises
+        ------
+        HTTPRequestStatusError
+            A copy of the error the route failed with. :attr:`HTTPRequestStatusError.response` is :data:`None`.
+        """
+        if not self._entries:
+            return
+        key = (rate_limit_key, route.method, route.path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if entry.expires_at <= monotonic():
+            self._remove(key)
+            return
+
+        self.hits += 1
+        logger.debug("Failing %s %s from the negative cache", route.method, route.path)
+        # A new error is raised every time, re-raising the same one would keep growing its traceback.
+        raise entry.error_type(entry.error, None, status=entry.status)
+
+    def add(self, route: Route, rate_limit_key: str | None, error: HTTPRequestStatusError) -> None:
+        """Remember that a route failed.
+
+        Parameters
+        ----------
+        route:
+            The route that failed.
+        rate_limit_key:
+            The rate limit key the route was requested with.
+        error:
+            The error the route failed with.
+        """
+        now = monotonic()
+        key = (rate_limit_key, route.method, route.path)
+        if key in self._entries:
+            self._remove(key)
+
+        snowflakes = tuple(segment for segment in route.path.split("/") if segment.isdigit())
+        self._entries[key] = _NegativeCacheEntry(now + self.ttl, type(error), error.error, error.status, snowflakes)
+        for snowflake in snowflakes:
+            self._by_snowflake.setdefault(snowflake, set()).add(key)
+
+        self._evict_expired(now)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, snowflake: str | int) -> None:
+        """Forget every failed route that has a ID in its path.
+
+        Parameters
+        ----------
+        snowflake:
+            The ID of the channel, guild, role, user etc. that changed.
+        """
+        keys = self._by_snowflake.pop(str(snowflake), None)
+        if keys is None:
+            return
+        for key in keys:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Forget every failed route."""
+        self._entries.clear()
+        self._by_snowflake.clear()
+
+    async def on_dispatch(self, event_name: str, data: Any) -> None:
+        """Invalidate routes using the IDs in a gateway event.
+
+        This can be added as a global listener to :attr:`ShardManager.event_dispatcher`.
+
+        Only events that can change access are used, which are ``CHANNEL_*``, ``THREAD_*``, ``GUILD_CREATE``,
+        ``GUILD_UPDATE``, ``GUILD_DELETE``, ``GUILD_ROLE_*`` and ``GUILD_MEMBER_*``.
+        Frequent events like ``MESSAGE_CREATE`` or ``PRESENCE_UPDATE`` would otherwise empty the cache in busy guilds.
+
+        Parameters
+        ----------
+        event_name:
+            The name of the event.
+        data:
+            The event data.
+        """
+        if not self._by_snowflake or not isinstance(data, dict):
+            return
+        if event_name not in _INVALIDATING_EVENTS and not event_name.startswith(_INVALIDATING_EVENT_PREFIXES):
+            return
+
+        for field in ("id", "guild_id", "channel_id", "parent_id"):
+            snowflake = data.get(field)
+            if snowflake is not None:
+                self.invalidate(snowflake)
+        # GUILD_ROLE_* and GUILD_MEMBER_* events have the changed object nested
+        for field in ("role", "user"):
+            nested = data.get(field)
+            if isinstance(nested, dict) and "id" in nested:
+                self.invalidate(nested["id"])
+        role_id = data.get("role_id")
+        if role_id is not None:
+            self.invalidate(role_id)
+
+    def _evict_expired(self, now: float) -> None:
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now:
+                break
+            self._remove(key)
+
+    def _remove(self, key: NegativeCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for snowflake in entry.snowflakes:
+            keys = self._by_snowflake.get(snowflake)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._by_snowflake[snowflake]
@@ -0,0 +1,188 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import CancelledError, create_task
+from os import PathLike
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from ..common import UNDEFINED, json_dumps
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import Any, AsyncIterator, Awaitable, Callable, Final, TextIO
+
+__all__: Final[tuple[str, ...]] = ("Paginator",)
+
+ItemT = TypeVar("ItemT")
+
+
+class Paginator(Generic[ItemT]):
+    """A async iterator over every item of a cursor based endpoint.
+
+    The next page is requested while the current page is being iterated over,
+    so there is no wait between pages unless the items are used faster than Discord returns them.
+
+    .. code-block:: python3
+
+        async for message in http_client.iter_channel_messages(authentication, channel_id, max_items=1000):
+            ...
+
+    .. note::
+        At most 2 pages are kept in memory at once, the page being iterated over and the next page.
+        Use ``page_size`` to lower the memory used.
+
+    Parameters
+    ----------
+    fetch:
+        Gets a page. This is called with the cursor and how many items to get,
+        and returns the items and the cursor of the next page, or :data:`None` if it was the last page.
+    cursor:
+        The cursor of the first page.
+    page_size:
+        How many items to get per request.
+    max_items:
+        The most items to return. If this is :data:`None`, every item is returned.
+        If this is ``0`` or less, no requests are made.
+    prefetch:
+        Whether to request the next page while the current page is being iterated over.
+
+    Attributes
+    ----------
+    page_size:
+        How many items to get per request.
+    max_items:
+        The most items to return. If this is :data:`None`, every item is returned.
+        If this is ``0`` or less, no requests are made.
+    prefetch:
+        Whether to request the next page while the current page is being iterated over.
+    """
+
+    __slots__ = ("page_size", "max_items", "prefetch", "_fetch", "_cursor")
+
+    def __init__(
+        self,
+        fetch: Callable[[Any, int], Awaitable[tuple[list[ItemT], Any]]],
+        *,
+        cursor: Any = UNDEFINED,
+        page_size: int,
+        max_items: int | None = None,
+        prefetch: bool = True,
+    ) -> None:
+        self.page_size: int = page_size
+        self.max_items: int | None = max_items
+        self.prefetch: bool = prefetch
+        self._fetch: Callable[[Any, int], Awaitable[tuple[list[ItemT], Any]]] = fetch
+        self._cursor: Any = cursor
+
+    async def __aiter__(self) -> AsyncIterator[ItemT]:
+        if self.max_items is not None and self.max_items <= 0:
+            return  # Discord rejects a limit of 0, so do not request anything.
+
+        received = 0
+        next_page: Task[tuple[list[ItemT], Any]] | None = self._request_page(self._cursor, received)
+
+        try:
+            while next_page is not None:
+                items, cursor = await next_page
+                next_page = None
+                if self.max_items is not None:
+                    del items[self.max_items - received :]
+                received += len(items)
+
+                done = cursor is None or (self.max_items is not None and received >= self.max_items)
+                if not done and self.prefetch:
+                    next_page = self._request_page(cursor, received)
+
+                for item in items:
+                    yield item
+
+                if not done and not self.prefetch:
+                    next_page = self._request_page(cursor, received)
+        finally:
+            if next_page is not None:
+                # Stopped early, the next page is not needed.
+                next_page.cancel()
+                try:
+                    await next_page
+                except (CancelledError, Exception):
+                    pass
+
+    def _request_page(self, cursor: Any, received: int) -> Task[tuple[list[ItemT], Any]]:
+        limit = self.page_size
+        if self.max_items is not None:
+            limit = min(limit, self.max_items - received)
+        return create_task(self._fetch(cursor, limit))
+
+    async def write_ndjson(self, file: str | PathLike[str] | TextIO) -> int:
+        """Write every item to a file as `newline delimited JSON <http://ndjson.org>`__.
+
+        Items are written page by page, so the items do not have to fit in memory.
+
+        Parameters
+        ----------
+        file:
+            The path of the file to write to, or a file opened in text mode.
+            A path is overwritten if it exists.
+
+        Returns
+        -------
+        int
+            How many items were written.
+        """
+        if isinstance(file, (str, PathLike)):
+            with open(file, "w", encoding="utf-8") as opened:
+                return await self.write_ndjson(opened)
+
+        written = 0
+        async for item in self:
+            file.write(json_dumps(item))
+            file.write("\n")
+            written += 1
+        return written
+
+    @staticmethod
+    def snowflake_cursor(items: list[Any], limit: int, *, forwards: bool, key: str | None = None) -> int | None:
+        """Get the cursor of the next page of a endpoint that uses snowflakes as cursors.
+
+        Parameters
+        ----------
+        items:
+            The items of the current page.
+        limit:
+            How many items were requested. A shorter page means it was the last page.
+        forwards:
+            Whether the pages go from old to new, with a ``after`` cursor. Otherwise they go from new to old, with ``before``.
+        key:
+            The key of a object with the snowflake in every item, like ``"user"`` for members. If this is :data:`None`, ``"id"`` in the item itself is used.
+
+        Returns
+        -------
+        int | None
+            The cursor of the next page, or :data:`None` if it was the last page.
+        """
+        if len(items) < limit or not items:
+            return None
+        ids = (int(item[key]["id"] if key is not None else item["id"]) for item in items)
+        # Do not depend on the order of the page, not every endpoint returns it in the order it paginates in.
+        return max(ids) if forwards else min(ids)
@@ -0,0 +1,140 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Final
+
+__all__: Final[tuple[str, ...]] = ("QoSClass",)
+
+
+class QoSClass:
+    """A named class of requests with a guaranteed share of the rate limits.
+
+    Requests in a class use :attr:`QoSClass.priority` as both the bucket and the global priority.
+    A share of every bucket and of the global rate limit is kept free for requests in the class,
+    so a backlog of less important requests can not use up the whole window before it.
+
+    The share is reserved from the start, so the first request of a class after a quiet period does not queue behind
+    a window full of less important requests. Reserved spots that are still unused late in a window are lent out,
+    see :attr:`Bucket.lend_held_after`. With :attr:`QoSClass.idle_after` set, the whole share is also lent out
+    while the class has not made a request for that long.
+
+    .. note::
+        A class only reserves capacity once it is passed to :class:`HTTPClient` in ``qos_classes``.
+
+    Parameters
+    ----------
+    name:
+        The name of the class, used in logs and metrics.
+    priority:
+        The priority of requests in the class. **Lower** number means it is more important.
+    reserved:
+        The share of every rate limit kept free for this class and more important classes. This is between ``0`` and ``1``.
+    idle_after:
+        How many seconds after the last request of the class its reserved share can be borrowed.
+        If this is :data:`None`, the share is always reserved.
+
+    Raises
+    ------
+    ValueError
+        ``reserved`` was not between ``0`` and ``1``.
+
+    Attributes
+    ----------
+    name:
+        The name of the class, used in logs and metrics.
+    priority:
+        The priority of requests in the class. **Lower** number means it is more important.
+    reserved:
+        The share of every rate limit kept free for this class and more important classes.
+    idle_after:
+        How many seconds after the last request of the class its reserved share can be borrowed.
+        If this is :data:`None`, the share is always reserved.
+    last_request_at:
+        When the last request of the class was started, in :func:`time.monotonic` time.
+    requests:
+        How many requests in the class have finished.
+    total_latency:
+        The seconds the finished requests took in total, including waiting for rate limits and retries.
+    max_latency:
+        The most seconds a finished request took.
+    """
+
+    __slots__ = (
+        "name",
+        "priority",
+        "reserved",
+        "idle_after",
+        "last_request_at",
+        "requests",
+        "total_latency",
+        "max_latency",
+    )
+
+    def __init__(self, name: str, *, priority: int = 0, reserved: float = 0, idle_after: float | None = None) -> None:
+        if not 0 <= reserved < 1:
+            raise ValueError("reserved has to be between 0 and 1")
+
+        self.name: str = name
+        self.priority: int = priority
+        self.reserved: float = reserved
+        self.idle_after: float | None = idle_after
+        self.last_request_at: float = float("-inf")
+        self.requests: int = 0
+        self.total_latency: float = 0
+        self.max_latency: float = 0
+
+    @property
+    def average_latency(self) -> float:
+        """The average seconds a finished request took, or ``0`` if none have finished."""
+        if self.requests == 0:
+            return 0
+        return self.total_latency / self.requests
+
+    def active(self, now: float) -> bool:
+        """Whether the reserved share of the class is in use, and can not be borrowed.
+
+        Parameters
+        ----------
+        now:
+            The current :func:`time.monotonic` time.
+        """
+        if self.idle_after is None:
+            return True
+        return now - self.last_request_at < self.idle_after
+
+    def record(self, latency: float) -> None:
+        """Record a finished request.
+
+        Parameters
+        ----------
+        latency:
+            How many seconds the request took.
+        """
+        self.requests += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
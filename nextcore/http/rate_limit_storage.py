@@ -21,15 +21,18 @@
 
 from __future__ import annotations
 
-import gc
+from asyncio import get_running_loop
+from collections import OrderedDict
 from logging import getLogger
+from time import monotonic
 from typing import TYPE_CHECKING
 from weakref import WeakValueDictionary
 
 from .global_rate_limiter import BaseGlobalRateLimiter, LimitedGlobalRateLimiter
 
 if TYPE_CHECKING:
-    from typing import Final, Literal
+    from asyncio import TimerHandle
+    from typing import Any, ClassVar, Final, Hashable
 
     from .bucket import Bucket
     from .bucket_metadata import BucketMetadata
@@ -38,37 +41,133 @@ logger = getLogger(__name__)
 
 __all__: Final[tuple[str, ...]] = ("RateLimitStorage",)
 
+# Async methods and the synchronous versions that have to be overridden with them.
+_NOWAIT_METHODS: Final[tuple[tuple[str, str], ...]] = (
+    ("get_bucket_by_nextcore_id", "get_bucket_by_nextcore_id_nowait"),
+    ("store_bucket_by_nextcore_id", "store_bucket_by_nextcore_id_nowait"),
+    ("get_bucket_by_discord_id", "get_bucket_by_discord_id_nowait"),
+    ("store_bucket_by_discord_id", "store_bucket_by_discord_id_nowait"),
+    ("get_bucket_metadata", "get_bucket_metadata_nowait"),
+    ("store_metadata", "store_metadata_nowait"),
+)
+
 
 class RateLimitStorage:
     """Storage for rate limits for a user.
 
     One of these should be created for each user.
 
-    .. note::
-        This will register a gc callback to clean up the buckets.
+    Buckets that are not used for ``bucket_ttl`` seconds and the least recently used buckets above ``max_buckets`` are
+    evicted. This runs every ``eviction_interval`` seconds and handles at most ``eviction_batch`` buckets and metadata
+    at a time, so the event loop is never stalled by a large storage.
+    Buckets that are currently rate limited or doing a request are never evicted.
+
+    Parameters
+    ----------
+    bucket_ttl:
+        How many seconds a bucket can be unused before it is evicted.
+    max_buckets:
+        The maximum amount of buckets to keep. If this is :data:`None` there is no limit.
+    max_metadata:
+        The maximum amount of routes to keep :class:`BucketMetadata` for. If this is :data:`None` there is no limit.
+
+        Metadata used by a stored bucket is not evicted, so this can be exceeded while many routes have buckets.
+    eviction_interval:
+        How often to evict buckets in seconds.
+    eviction_batch:
+        The maximum amount of buckets, and of metadata, to check each time evictions run.
 
     Attributes
     ----------
     global_lock:
         The users per user global rate limit.
+    bucket_ttl:
+        How many seconds a bucket can be unused before it is evicted.
+    max_buckets:
+        The maximum amount of buckets to keep. If this is :data:`None` there is no limit.
+    max_metadata:
+        The maximum amount of routes to keep :class:`BucketMetadata` for. If this is :data:`None` there is no limit.
+    eviction_interval:
+        How often to evict buckets in seconds.
+    eviction_batch:
+        The maximum amount of buckets, and of metadata, to check each time evictions run.
+    evicted_buckets:
+        How many buckets has been evicted.
+    evicted_metadata:
+        How many :class:`BucketMetadata` has been evicted.
+    supports_nowait:
+        If the ``_nowait`` methods can be used instead of awaiting the async methods.
+
+        This lets :class:`HTTPClient` skip creating and awaiting a coroutine for every lookup.
+        It is set to :data:`False` for subclasses that override a async method without overriding the ``_nowait`` version,
+        as the ``_nowait`` version would use the wrong storage.
+    creates_buckets_on_lookup:
+        If :meth:`RateLimitStorage.get_bucket_by_nextcore_id` creates missing buckets instead of returning :data:`None`.
+
+        :class:`HTTPClient` uses this to seed the metadata of a route from :attr:`HTTPClient.bucket_metadata_snapshot`
+        the first time the route is used, as it never sees a missing bucket.
     """
 
-    __slots__ = ("_nextcore_buckets", "_discord_buckets", "_bucket_metadata", "global_rate_limiter")
-
-    def __init__(self) -> None:
-        self._nextcore_buckets: dict[str, Bucket] = {}
+    __slots__ = (
+        "_nextcore_buckets",
+        "_last_used",
+        "_discord_buckets",
+        "_bucket_metadata",
+        "_metadata_users",
+        "_eviction_handle",
+        "global_rate_limiter",
+        "bucket_ttl",
+        "max_buckets",
+        "max_metadata",
+        "eviction_interval",
+        "eviction_batch",
+        "evicted_buckets",
+        "evicted_metadata",
+    )
+
+    supports_nowait: ClassVar[bool] = True
+    creates_buckets_on_lookup: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "supports_nowait" in cls.__dict__:
+            # Explicitly set by the subclass
+            return
+        for async_name, nowait_name in _NOWAIT_METHODS:
+            if async_name in cls.__dict__ and nowait_name not in cls.__dict__:
+                cls.supports_nowait = False
+                return
+
+    def __init__(
+        self,
+        *,
+        bucket_ttl: float = 300,
+        max_buckets: int | None = 100_000,
+        max_metadata: int | None = 10_000,
+        eviction_interval: float = 10,
+        eviction_batch: int = 1000,
+    ) -> None:
+        # Both of these are ordered from least to most recently used.
+        self._nextcore_buckets: OrderedDict[Hashable, Bucket] = OrderedDict()
+        self._last_used: dict[Hashable, float] = {}
         self._discord_buckets: WeakValueDictionary[str, Bucket] = WeakValueDictionary()
-        self._bucket_metadata: dict[
-            str, BucketMetadata
-        ] = {}  # This will never get cleared however it improves performance so I think not deleting it is fine
+        self._bucket_metadata: OrderedDict[str, BucketMetadata] = OrderedDict()
+        self._metadata_users: dict[int, int] = {}  # How many stored buckets use a metadata, by id of the metadata
+        self._eviction_handle: TimerHandle | None = None
         self.global_rate_limiter: BaseGlobalRateLimiter = LimitedGlobalRateLimiter()
 
-        # Register a garbage collection callback
-        gc.callbacks.append(self._cleanup_buckets)
+        self.bucket_ttl: float = bucket_ttl
+        self.max_buckets: int | None = max_buckets
+        self.max_metadata: int | None = max_metadata
+        self.eviction_interval: float = eviction_interval
+        self.eviction_batch: int = eviction_batch
+        self.evicted_buckets: int = 0
+        self.evicted_metadata: int = 0
 
     # These are async and not just public dicts because we want to support custom implementations that use asyncio.
     # This does introduce some overhead, but it's not too bad.
-    async def get_bucket_by_nextcore_id(self, nextcore_id: str) -> Bucket | None:
+    async def get_bucket_by_nextcore_id(self, nextcore_id: Hashable) -> Bucket | None:
         """Get a rate limit bucket from a nextcore created id.
 
         Parameters
@@ -76,9 +175,25 @@ class RateLimitStorage:
         nextcore_id:
             The nextcore generated bucket id. This can be gotten by using :attr:`Route.bucket`
         """
-        return self._nextcore_buckets.get(nextcore_id)
+        return self.get_bucket_by_nextcore_id_nowait(nextcore_id)
 
-    async def store_bucket_by_nextcore_id(self, nextcore_id: str, bucket: Bucket) -> None:
+    def get_bucket_by_nextcore_id_nowait(self, nextcore_id: Hashable) -> Bucket | None:
+        """Get a rate limit bucket from a nextcore created id without awaiting.
+
+        Only available if :attr:`RateLimitStorage.supports_nowait` is :data:`True`.
+
+        Parameters
+        ----------
+        nextcore_id:
+            The nextcore generated bucket id. This can be gotten by using :attr:`Route.bucket`
+        """
+        bucket = self._nextcore_buckets.get(nextcore_id)
+        if bucket is not None:
+            self._nextcore_buckets.move_to_end(nextcore_id)
+            self._last_used[nextcore_id] = monotonic()
+        return bucket
+
+    async def store_bucket_by_nextcore_id(self, nextcore_id: Hashable, bucket: Bucket) -> None:
         """Store a rate limit bucket by nextcore generated id.
 
         Parameters
@@ -88,13 +203,49 @@ class RateLimitStorage:
         bucket:
             The bucket to store.
         """
+        self.store_bucket_by_nextcore_id_nowait(nextcore_id, bucket)
+
+    def store_bucket_by_nextcore_id_nowait(self, nextcore_id: Hashable, bucket: Bucket) -> None:
+        """Store a rate limit bucket by nextcore generated id without awaiting.
+
+        Only available if :attr:`RateLimitStorage.supports_nowait` is :data:`True`.
+
+        Parameters
+        ----------
+        nextcore_id:
+            The nextcore generated id of the
+        bucket:
+            The bucket to store.
+        """
+        old_bucket = self._nextcore_buckets.get(nextcore_id)
+        if old_bucket is not bucket:
+            if old_bucket is not None:
+                self._remove_metadata_user(old_bucket.metadata)
+            metadata_id = id(bucket.metadata)
+            self._metadata_users[metadata_id] = self._metadata_users.get(metadata_id, 0) + 1
+
         self._nextcore_buckets[nextcore_id] = bucket
+        self._nextcore_buckets.move_to_end(nextcore_id)
+        self._last_used[nextcore_id] = monotonic()
+        self._schedule_eviction()
 
     async def get_bucket_by_discord_id(self, discord_id: str) -> Bucket | None:
         """Get a rate limit bucket from the Discord bucket hash.
 
         This can be obtained via the ``X-Ratelimit-Bucket`` header.
 
+        Parameters
+        ----------
+        discord_id:
+            The Discord bucket hash
+        """
+        return self.get_bucket_by_discord_id_nowait(discord_id)
+
+    def get_bucket_by_discord_id_nowait(self, discord_id: str) -> Bucket | None:
+        """Get a rate limit bucket from the Discord bucket hash without awaiting.
+
+        Only available if :attr:`RateLimitStorage.supports_nowait` is :data:`True`.
+
         Parameters
         ----------
         discord_id:
@@ -107,6 +258,20 @@ class RateLimitStorage:
 
         This can be obtained via the ``X-Ratelimit-Bucket`` header.
 
+        Parameters
+        ----------
+        discord_id:
+            The Discord bucket hash
+        bucket:
+            The bucket to store.
+        """
+        self.store_bucket_by_discord_id_nowait(discord_id, bucket)
+
+    def store_bucket_by_discord_id_nowait(self, discord_id: str, bucket: Bucket) -> None:
+        """Store a rate limit bucket by the discord bucket hash without awaiting.
+
+        Only available if :attr:`RateLimitStorage.supports_nowait` is :data:`True`.
+
         Parameters
         ----------
         discord_id:
@@ -124,7 +289,22 @@ class RateLimitStorage:
         bucket_route:
             The bucket route.
         """
-        return self._bucket_metadata.get(bucket_route)
+        return self.get_bucket_metadata_nowait(bucket_route)
+
+    def get_bucket_metadata_nowait(self, bucket_route: str) -> BucketMetadata | None:
+        """Get the metadata for a bucket from the route without awaiting.
+
+        Only available if :attr:`RateLimitStorage.supports_nowait` is :data:`True`.
+
+        Parameters
+        ----------
+        bucket_route:
+            The bucket route.
+        """
+        metadata = self._bucket_metadata.get(bucket_route)
+        if metadata is not None:
+            self._bucket_metadata.move_to_end(bucket_route)
+        return metadata
 
     async def store_metadata(self, bucket_route: str, metadata: BucketMetadata) -> None:
         """Store the metadata for a bucket from the route.
@@ -136,23 +316,109 @@ class RateLimitStorage:
         metadata:
             The metadata to store.
         """
-        self._bucket_metadata[bucket_route] = metadata
+        self.store_metadata_nowait(bucket_route, metadata)
 
-    # Garbage collection
-    def _cleanup_buckets(self, phase: Literal["start", "stop"], info: dict[str, int]) -> None:
-        del info  # Unused
+    def store_metadata_nowait(self, bucket_route: str, metadata: BucketMetadata) -> None:
+        """Store the metadata for a bucket from the route without awaiting.
 
-        if phase == "stop":
-            # No need to clean up buckets after the gc is done.
+        Only available if :attr:`RateLimitStorage.supports_nowait` is :data:`True`.
+
+        Parameters
+        ----------
+        bucket_route:
+            The bucket route.
+        metadata:
+            The metadata to store.
+        """
+        self._bucket_metadata[bucket_route] = metadata
+        self._bucket_metadata.move_to_end(bucket_route)
+        self._schedule_eviction()
+
+    # Eviction
+    def _schedule_eviction(self) -> None:
+        if self._eviction_handle is not None:
             return
-        logger.debug("Cleaning up buckets")
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            # No event loop to run evictions on yet, this will be retried on the next store.
+            return
+        self._eviction_handle = loop.call_later(self.eviction_interval, self._evict)
+
+    def _evict(self) -> None:
+        self._eviction_handle = None
+        self.evict()
 
-        # We are copying it due to the size changing during the loop
-        for bucket_id, bucket in self._nextcore_buckets.copy().items():
-            if not bucket.dirty:
-                logger.debug("Cleaning up bucket %s", bucket_id)
-                # Delete the main reference. Other references like RateLimitStorage._discord_buckets should get cleaned up automatically as it is a weakref.
-                del self._nextcore_buckets[bucket_id]
+        if self._nextcore_buckets or self._bucket_metadata:
+            self._schedule_eviction()
+
+    def evict(self) -> int:
+        """Evict unused buckets and metadata.
+
+        This is called automatically every :attr:`RateLimitStorage.eviction_interval` seconds.
+        At most :attr:`RateLimitStorage.eviction_batch` buckets and metadata are checked per call.
+
+        Returns
+        -------
+        int
+            How many buckets were evicted.
+        """
+        buckets = self._nextcore_buckets
+        last_used = self._last_used
+        expired_before = monotonic() - self.bucket_ttl
+        max_buckets = self.max_buckets
+        evicted = 0
+
+        for _ in range(min(self.eviction_batch, len(buckets))):
+            nextcore_id, bucket = next(iter(buckets.items()))
+            too_many = max_buckets is not None and len(buckets) > max_buckets
+            if not too_many and last_used[nextcore_id] > expired_before:
+                # Everything after this was used more recently
+                break
+
+            if bucket.dirty:
+                # Still rate limited or in use, evicting it would lose the rate limit.
+                buckets.move_to_end(nextcore_id)
+                last_used[nextcore_id] = monotonic()
+                continue
+
+            logger.debug("Evicting bucket %s", nextcore_id)
+            # Other references like RateLimitStorage._discord_buckets get cleaned up automatically as it is a weakref.
+            del buckets[nextcore_id]
+            del last_used[nextcore_id]
+            self._remove_metadata_user(bucket.metadata)
+            evicted += 1
+
+        self.evicted_buckets += evicted
+
+        if self.max_metadata is not None and len(self._bucket_metadata) > self.max_metadata:
+            self._evict_metadata(self.max_metadata)
+
+        return evicted
+
+    def _evict_metadata(self, max_metadata: int) -> None:
+        # Metadata used by a stored bucket is kept, or new buckets for the route would start without the limit,
+        # min_limit and bucket_hash. It is evicted once its buckets are.
+        bucket_metadata = self._bucket_metadata
+        metadata_users = self._metadata_users
+
+        for _ in range(min(self.eviction_batch, len(bucket_metadata))):
+            if len(bucket_metadata) <= max_metadata:
+                break
+            bucket_route, metadata = next(iter(bucket_metadata.items()))
+            if id(metadata) in metadata_users:
+                bucket_metadata.move_to_end(bucket_route)
+                continue
+            del bucket_metadata[bucket_route]
+            self.evicted_metadata += 1
+
+    def _remove_metadata_user(self, metadata: BucketMetadata) -> None:
+        metadata_id = id(metadata)
+        users = self._metadata_users[metadata_id] - 1
+        if users:
+            self._metadata_users[metadata_id] = users
+        else:
+            del self._metadata_users[metadata_id]
 
     async def close(self) -> None:
         """Clean up before deletion.
@@ -160,11 +426,14 @@ class RateLimitStorage:
         .. warning::
             If this is not called before you delete this or it goes out of scope, you will get a memory leak.
         """
-        # Remove the garbage collection callback
-        gc.callbacks.remove(self._cleanup_buckets)
+        if self._eviction_handle is not None:
+            self._eviction_handle.cancel()
+            self._eviction_handle = None
 
         # Clear up the buckets
         self._nextcore_buckets.clear()
+        self._last_used.clear()
+        self._metadata_users.clear()
 
         # Clear up the metadata
         self._bucket_metadata.clear()
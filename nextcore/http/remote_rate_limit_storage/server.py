@@ -0,0 +1,431 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import (
+    create_task,
+    current_task,
+    gather,
+    get_running_loop,
+    sleep,
+    start_server,
+)
+from collections import defaultdict
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from ...common import json_dumps, json_loads
+from ...common.errors import RateLimitedError
+from ..bucket import Bucket
+from ..bucket_metadata import BucketMetadata
+from ..rate_limit_storage import RateLimitStorage
+
+if TYPE_CHECKING:
+    from asyncio import AbstractServer, StreamReader, StreamWriter, Task
+    from typing import Any, AsyncContextManager, Final, Hashable
+
+logger = getLogger(__name__)
+
+__all__: Final[tuple[str, ...]] = ("RateLimitStorageServer",)
+
+
+class _RemoteRequestFailed(Exception):
+    """Passed into a held :meth:`Bucket.acquire` when a client reports that its request failed."""
+
+
+def _hashable(value: Any) -> Hashable:
+    # JSON has no tuples, so composite keys arrive as lists.
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)  # type: ignore [reportUnknownVariableType]
+    return value
+
+
+class _GlobalWindow:
+    """A fixed window global rate limit that hands out tokens in leases."""
+
+    __slots__ = ("limit", "per", "_used", "_window_end", "_paused_until")
+
+    def __init__(self, limit: int, per: float) -> None:
+        self.limit: int = limit
+        self.per: float = per
+        self._used: int = 0
+        self._window_end: float = 0
+        self._paused_until: float = 0
+
+    async def lease(self, count: int, *, wait: bool) -> tuple[int, float, float]:
+        """Take up to ``count`` tokens from the current window.
+
+        Returns
+        -------
+        tuple[int, float, float]
+            How many tokens were granted, how long was waited for them and how long they are valid for.
+        """
+        loop = get_running_loop()
+        started_at = loop.time()
+        while True:
+            now = loop.time()
+
+            if self._paused_until > now:
+                # A global 429 was reported by one of the clients.
+                if not wait:
+                    return 0, 0, 0
+                await sleep(self._paused_until - now)
+                continue
+
+            if now >= self._window_end:
+                self._window_end = now + self.per
+                self._used = 0
+
+            available = self.limit - self._used
+            if available > 0:
+                granted = min(count, available)
+                self._used += granted
+                return granted, now - started_at, self._window_end - now
+
+            if not wait:
+                return 0, 0, 0
+            await sleep(self._window_end - now)
+
+    def pause(self, retry_after: float) -> None:
+        """Stop handing out tokens for ``retry_after`` seconds."""
+        loop = get_running_loop()
+        self._paused_until = max(self._paused_until, loop.time() + retry_after)
+
+
+class _Namespace:
+    __slots__ = ("storage", "global_window")
+
+    def __init__(self, global_limit: int) -> None:
+        self.storage: RateLimitStorage = RateLimitStorage()
+        self.global_window: _GlobalWindow = _GlobalWindow(global_limit, 1)
+
+
+class RateLimitStorageServer:
+    """A server that keeps rate limit state for :class:`RemoteRateLimitStorage` clients.
+
+    Every client connected to the same namespace shares the same buckets, bucket metadata and global rate limit.
+    The buckets are regular :class:`Bucket` instances, so the rate limiting behaviour is the same as with a local :class:`RateLimitStorage`.
+
+    **Example usage**
+
+    .. code-block:: python3
+
+        server = RateLimitStorageServer()
+        await server.start("127.0.0.1", 6543)
+
+        await server.serve_forever()
+
+    .. warning::
+        The protocol has no authentication or encryption. Anyone that can connect can use up or release rate limits
+        of every namespace. Only listen on a loopback or private interface that only your own processes can reach,
+        and use a firewall or a private network when workers are on other machines.
+
+    **Protocol**
+
+    The protocol is newline delimited JSON over TCP.
+    The first message on a connection is ``{"op": "hello", "namespace": ...}``.
+    Every following message has a ``op`` field, and requests that expect a reply also have a ``id`` field.
+    The reply will be ``{"id": ..., "result": ...}`` or ``{"id": ..., "error": ...}``.
+
+    Clients are expected to send several messages in a single write, and messages that do not expect a reply are processed in order.
+
+    Malformed messages are logged and skipped. If the message can be read, the reply will be ``{"id": ..., "error": "invalid_message"}``.
+    If it can not, the ``id`` will be :data:`None`. The connection is kept open, so buckets and leases held by it are not released.
+
+    Parameters
+    ----------
+    global_limit:
+        The amount of requests per second each namespace can do.
+
+    Attributes
+    ----------
+    global_limit:
+        The amount of requests per second each namespace can do.
+    """
+
+    __slots__ = ("global_limit", "_namespaces", "_server", "_connections")
+
+    def __init__(self, *, global_limit: int = 50) -> None:
+        self.global_limit: int = global_limit
+        self._namespaces: defaultdict[str | None, _Namespace] = defaultdict(lambda: _Namespace(self.global_limit))
+        self._server: AbstractServer | None = None
+        self._connections: dict[Task[None], StreamWriter] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start listening for connections.
+
+        Parameters
+        ----------
+        host:
+            The host to bind to.
+        port:
+            The port to bind to. If this is ``0`` a free port will be picked. See :attr:`RateLimitStorageServer.port`.
+
+        Raises
+        ------
+        RuntimeError
+            The server was already started.
+        """
+        if self._server is not None:
+            raise RuntimeError("This method can only be called once!")
+        self._server = await start_server(self._handle_connection, host, port)
+
+    @property
+    def port(self) -> int:
+        """The port the server is listening on.
+
+        Raises
+        ------
+        RuntimeError
+            The server has not been started yet.
+        """
+        if self._server is None:
+            raise RuntimeError("RateLimitStorageServer.start has to be called first")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve clients until the server is closed."""
+        if self._server is None:
+            raise RuntimeError("RateLimitStorageServer.start has to be called first")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop the server and clean up the rate limit state."""
+        if self._server is not None:
+            self._server.close()
+
+            # Disconnect the clients and wait for the state they held to be released
+            for writer in self._connections.values():
+                writer.close()
+            await gather(*self._connections, return_exceptions=True)
+
+        for namespace in self._namespaces.values():
+            await namespace.storage.close()
+        self._namespaces.clear()
+
+    async def _handle_connection(self, reader: StreamReader, writer: StreamWriter) -> None:
+        namespace: _Namespace | None = None
+        held: dict[int, AsyncContextManager[None]] = {}  # Request id -> acquired bucket
+        tasks: set[Task[None]] = set()
+        self._connections[current_task()] = writer  # type: ignore [index]
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break  # Disconnected
+
+                try:
+                    message: dict[str, Any] = json_loads(line.decode("utf-8"))
+                    op = message["op"]
+                except (ValueError, KeyError, TypeError):  # UnicodeDecodeError is a ValueError
+                    logger.warning("Received a malformed message, skipping it")
+                    self._reply_invalid(writer, None)
+                    continue
+
+                if op == "hello":
+                    namespace = self._namespaces[message.get("namespace")]
+                    continue
+                if namespace is None:
+                    logger.warning("Client sent %s before hello, closing the connection", op)
+                    break
+
+                if op in ("acquire", "lease", "get_metadata"):
+                    # These can block for a long time, so they are handled concurrently.
+                    task = create_task(self._handle_request(namespace, message, writer, held))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                else:
+                    try:
+                        await self._handle_notification(namespace, message, held)
+                    except (ValueError, KeyError, TypeError):
+                        # Notifications have no id to reply to.
+                        logger.warning("Received a malformed %s message, skipping it", op, exc_info=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            # The client is gone, so the requests it was doing will never report back.
+            for context in held.values():
+                await context.__aexit__(_RemoteRequestFailed, _RemoteRequestFailed(), None)
+            held.clear()
+
+            del self._connections[current_task()]  # type: ignore [arg-type]
+            writer.close()
+
+    async def _handle_request(
+        self,
+        namespace: _Namespace,
+        message: dict[str, Any],
+        writer: StreamWriter,
+        held: dict[int, AsyncContextManager[None]],
+    ) -> None:
+        try:
+            reply = await self._request_reply(namespace, message, held)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Received a malformed %s message, skipping it", message["op"], exc_info=True)
+            self._reply_invalid(writer, message.get("id"))
+            return
+
+        if writer.is_closing():
+            return
+        writer.write(json_dumps(reply).encode("utf-8") + b"\n")
+
+    def _reply_invalid(self, writer: StreamWriter, request_id: Any) -> None:
+        if writer.is_closing():
+            return
+        writer.write(json_dumps({"id": request_id, "error": "invalid_message"}).encode("utf-8") + b"\n")
+
+    async def _request_reply(
+        self, namespace: _Namespace, message: dict[str, Any], held: dict[int, AsyncContextManager[None]]
+    ) -> dict[str, Any]:
+        op = message["op"]
+        request_id = message["id"]
+        reply: dict[str, Any] = {"id": request_id}
+
+        if op == "acquire":
+            bucket = await self._resolve_bucket(namespace.storage, message["bucket"])
+            context = bucket.acquire(
+                priority=message["priority"],
+                wait=message["wait"],
+                retry=message.get("retry", False),
+                held_back=message.get("held_back", 0),
+            )
+            try:
+                await context.__aenter__()
+            except RateLimitedError:
+                reply["error"] = "rate_limited"
+            else:
+                held[request_id] = context
+                reply["result"] = {"limit": bucket.metadata.limit, "unlimited": bucket.metadata.unlimited}
+        elif op == "lease":
+            granted, waited, expires_after = await namespace.global_window.lease(message["count"], wait=message["wait"])
+            reply["result"] = {"granted": granted, "waited": waited, "expires_after": expires_after}
+        else:
+            metadata = await namespace.storage.get_bucket_metadata(_hashable(message["route"]))  # type: ignore [arg-type]
+            if metadata is None:
+                reply["result"] = None
+            else:
+                reply["result"] = {"limit": metadata.limit, "unlimited": metadata.unlimited}
+        return reply
+
+    async def _handle_notification(
+        self, namespace: _Namespace, message: dict[str, Any], held: dict[int, AsyncContextManager[None]]
+    ) -> None:
+        storage = namespace.storage
+        op = message["op"]
+
+        if op == "release":
+            context = held.pop(message["token"], None)
+            if context is None:
+                return
+            if message["failed"]:
+                await context.__aexit__(_RemoteRequestFailed, _RemoteRequestFailed(), None)
+            else:
+                await context.__aexit__(None, None, None)
+        elif op == "update":
+            bucket = await self._resolve_bucket(storage, message["bucket"])
+            if message["unlimited"]:
+                await bucket.update(unlimited=True)
+            else:
+                await bucket.update(message["remaining"], message["reset_after"])
+        elif op == "backoff":
+            bucket = await self._resolve_bucket(storage, message["bucket"])
+            bucket.backoff(message["retry_after"])
+        elif op == "set_metadata":
+            kind, key = message["target"]
+            if kind == "route":
+                metadata = await self._resolve_metadata(storage, _hashable(key))
+            else:
+                metadata = (await self._resolve_bucket(storage, key)).metadata
+            metadata.limit = message["limit"]
+            metadata.unlimited = message["unlimited"]
+        elif op == "store_metadata":
+            metadata = await self._resolve_metadata(storage, _hashable(message["route"]))
+            metadata.limit = message["limit"]
+            metadata.unlimited = message["unlimited"]
+        elif op == "store_nextcore":
+            await self._store_nextcore(storage, message["key"], message["bucket"])
+        elif op == "store_discord":
+            bucket = await self._resolve_bucket(storage, message["bucket"])
+            await storage.store_bucket_by_discord_id(message["hash"], bucket)
+        elif op == "global_update":
+            namespace.global_window.pause(message["retry_after"])
+        else:
+            logger.warning("Received unknown op %s", op)
+
+    async def _store_nextcore(self, storage: RateLimitStorage, key: list[Any], reference: list[Any]) -> None:
+        nextcore_id = _hashable(key[0])
+
+        if reference[0] != "discord":
+            bucket = await self._resolve_bucket(storage, reference)
+            await storage.store_bucket_by_nextcore_id(nextcore_id, bucket)  # type: ignore [arg-type]
+            return
+
+        # Clients cannot know if a Discord bucket hash has been seen without a round-trip,
+        # so linking is done here instead.
+        linked_bucket = await storage.get_bucket_by_discord_id(reference[1])
+        if linked_bucket is None:
+            bucket = await self._resolve_bucket(storage, ["nextcore", *key])
+            await storage.store_bucket_by_discord_id(reference[1], bucket)
+        else:
+            # Requests already waiting on the old bucket have to move over, this mirrors HTTPClient._update_bucket
+            bucket = await storage.get_bucket_by_nextcore_id(nextcore_id)  # type: ignore [arg-type]
+            if bucket is not None and bucket is not linked_bucket:
+                bucket.migrate_to(linked_bucket)
+            await storage.store_bucket_by_nextcore_id(nextcore_id, linked_bucket)  # type: ignore [arg-type]
+
+    async def _resolve_metadata(self, storage: RateLimitStorage, route: Any) -> BucketMetadata:
+        metadata = await storage.get_bucket_metadata(route)
+        if metadata is None:
+            metadata = BucketMetadata()
+            await storage.store_metadata(route, metadata)
+        return metadata
+
+    async def _resolve_bucket(self, storage: RateLimitStorage, reference: list[Any]) -> Bucket:
+        # This mirrors HTTPClient._get_bucket
+        if reference[0] == "discord":
+            bucket = await storage.get_bucket_by_discord_id(reference[1])
+            if bucket is not None:
+                return bucket
+            bucket = Bucket(BucketMetadata())
+            # Discord buckets are weakly referenced, keep a strong reference to it.
+            await storage.store_bucket_by_nextcore_id(_hashable(reference), bucket)  # type: ignore [arg-type]
+            await storage.store_bucket_by_discord_id(reference[1], bucket)
+            return bucket
+
+        _, key, metadata_key = reference
+        nextcore_id = _hashable(key)
+
+        bucket = await storage.get_bucket_by_nextcore_id(nextcore_id)  # type: ignore [arg-type]
+        if bucket is not None:
+            return bucket
+
+        if metadata_key is None:
+            metadata = BucketMetadata()
+        else:
+            metadata = await self._resolve_metadata(storage, _hashable(metadata_key))
+
+        bucket = Bucket(metadata)
+        await storage.store_bucket_by_nextcore_id(nextcore_id, bucket)  # type: ignore [arg-type]
+        return bucket
@@ -0,0 +1,621 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import (
+    CancelledError,
+    create_task,
+    get_running_loop,
+    open_connection,
+    shield,
+)
+from contextlib import asynccontextmanager
+from functools import partial
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from ...common import json_dumps, json_loads
+from ...common.errors import RateLimitedError
+from ..bucket import Bucket
+from ..bucket_metadata import BucketMetadata
+from ..global_rate_limiter import BaseGlobalRateLimiter
+from ..rate_limit_storage import RateLimitStorage
+
+if TYPE_CHECKING:
+    from asyncio import Future, StreamReader, StreamWriter, Task
+    from typing import Any, AsyncIterator, ClassVar, Final, Hashable
+
+logger = getLogger(__name__)
+
+__all__: Final[tuple[str, ...]] = (
+    "RemoteRateLimitStorage",
+    "RemoteBucket",
+    "RemoteBucketMetadata",
+    "RemoteGlobalRateLimiter",
+)
+
+
+def _metadata_key(nextcore_id: Hashable) -> str | None:
+    # Route.bucket is (method, route, *major parameters) and the metadata is stored by the route.
+    if isinstance(nextcore_id, tuple) and len(nextcore_id) > 1 and isinstance(nextcore_id[1], str):
+        return nextcore_id[1]
+    if isinstance(nextcore_id, str):
+        index = nextcore_id.find("/")
+        if index != -1:
+            return nextcore_id[index:]
+    return None
+
+
+class _RemoteConnection:
+    """A pipelined connection to a :class:`RateLimitStorageServer`.
+
+    Messages queued in the same event loop iteration are sent in a single write.
+    """
+
+    __slots__ = (
+        "host",
+        "port",
+        "namespace",
+        "_writer",
+        "_connecting",
+        "_reader_task",
+        "_buffer",
+        "_flush_scheduled",
+        "_replies",
+        "_next_id",
+    )
+
+    def __init__(self, host: str, port: int, namespace: str | None) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.namespace: str | None = namespace
+        self._writer: StreamWriter | None = None
+        self._connecting: Task[None] | None = None
+        self._reader_task: Task[None] | None = None
+        self._buffer: list[bytes] = []
+        self._flush_scheduled: bool = False
+        self._replies: dict[int, Future[Any]] = {}
+        self._next_id: int = 0
+
+    def send(self, op: str, **data: Any) -> None:
+        """Queue a message that does not expect a reply."""
+        data["op"] = op
+        self._queue(data)
+
+    def request(self, op: str, **data: Any) -> tuple[int, Future[Any]]:
+        """Queue a message that expects a reply.
+
+        Returns
+        -------
+        tuple[int, asyncio.Future[typing.Any]]
+            The id of the request and the future the reply will be set on.
+        """
+        loop = get_running_loop()
+        request_id = self._next_id
+        self._next_id += 1
+
+        future: Future[Any] = loop.create_future()
+        self._replies[request_id] = future
+
+        data["op"] = op
+        data["id"] = request_id
+        self._queue(data)
+        return request_id, future
+
+    def _queue(self, message: dict[str, Any]) -> None:
+        self._buffer.append(json_dumps(message).encode("utf-8") + b"\n")
+
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+
+        loop = get_running_loop()
+        if self._writer is not None:
+            loop.call_soon(self._flush)
+        elif self._connecting is None:
+            # This will flush once connected.
+            self._connecting = loop.create_task(self._connect())
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if self._writer is None or not self._buffer:
+            return
+        self._writer.write(b"".join(self._buffer))
+        self._buffer.clear()
+
+    async def _connect(self) -> None:
+        try:
+            reader, writer = await open_connection(self.host, self.port)
+        except OSError as error:
+            logger.error("Could not connect to the rate limit storage server at %s:%s", self.host, self.port)
+            self._connecting = None
+            self._fail(error)
+            return
+
+        writer.write(json_dumps({"op": "hello", "namespace": self.namespace}).encode("utf-8") + b"\n")
+
+        self._writer = writer
+        self._connecting = None
+        self._reader_task = create_task(self._read(reader))
+        self._flush()
+
+    async def _read(self, reader: StreamReader) -> None:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            reply: dict[str, Any] = json_loads(line.decode("utf-8"))
+            future = self._replies.pop(reply["id"], None)
+            if future is None or future.done():
+                continue
+
+            error = reply.get("error")
+            if error is None:
+                future.set_result(reply["result"])
+            elif error == "rate_limited":
+                future.set_exception(RateLimitedError())
+            else:
+                future.set_exception(RuntimeError(f"Rate limit storage server returned an error: {error}"))
+
+        logger.warning("Lost connection to the rate limit storage server")
+        self._writer = None
+        self._fail(ConnectionResetError("Lost connection to the rate limit storage server"))
+
+    def _fail(self, error: Exception) -> None:
+        self._flush_scheduled = False
+        self._buffer.clear()
+
+        replies = list(self._replies.values())
+        self._replies.clear()
+        for future in replies:
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+        self._fail(ConnectionResetError("The connection was closed"))
+
+
+def _release_cancelled(connection: _RemoteConnection, token: int, reply: Future[Any]) -> None:
+    # Someone stopped waiting for a spot, give it back if the server handed it out anyway.
+    if reply.cancelled():
+        return
+    if reply.exception() is None:
+        connection.send("release", token=token, failed=True)
+
+
+class RemoteBucketMetadata(BucketMetadata):
+    """A :class:`BucketMetadata` stored on a :class:`RateLimitStorageServer`.
+
+    Reading is done from a local copy, and changes are sent to the server without waiting for a reply.
+
+    .. note::
+        This should not be created manually, it is returned by :class:`RemoteRateLimitStorage` and :class:`RemoteBucket`
+    """
+
+    __slots__ = ("_connection", "_target", "_limit", "_unlimited")
+
+    def __init__(
+        self, connection: _RemoteConnection, target: list[Any], limit: int | None = None, *, unlimited: bool = False
+    ) -> None:
+        # BucketMetadata.__init__ is not called as that would send the initial values to the server.
+        self._connection: _RemoteConnection = connection
+        self._target: list[Any] = target
+        self._limit: int | None = limit
+        self._unlimited: bool = unlimited
+        self.bucket_hash: str | None = None  # Linking is done by the server.
+        self.min_limit: int | None = limit  # Only kept locally.
+
+    @property  # type: ignore [override]
+    def limit(self) -> int | None:
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit: int | None) -> None:
+        self._limit = limit
+        self._push()
+
+    @property  # type: ignore [override]
+    def unlimited(self) -> bool:
+        return self._unlimited
+
+    @unlimited.setter
+    def unlimited(self, unlimited: bool) -> None:
+        self._unlimited = unlimited
+        self._push()
+
+    def _push(self) -> None:
+        self._connection.send("set_metadata", target=self._target, limit=self._limit, unlimited=self._unlimited)
+
+
+class RemoteBucket(Bucket):
+    """A :class:`Bucket` stored on a :class:`RateLimitStorageServer`.
+
+    Acquiring takes one round-trip to the server. Updates and releases are sent without waiting for a reply.
+
+    .. note::
+        This should not be created manually, it is returned by :class:`RemoteRateLimitStorage`
+    """
+
+    def __init__(self, storage: RemoteRateLimitStorage, reference: list[Any]) -> None:
+        # Bucket.__init__ is not called as the state lives on the server.
+        self._storage: RemoteRateLimitStorage = storage
+        self._reference: list[Any] = reference
+
+        unlimited = reference[0] == "nextcore" and reference[1] in storage._unlimited_buckets
+        self.metadata: BucketMetadata = RemoteBucketMetadata(
+            storage._connection, ["bucket", reference], unlimited=unlimited
+        )
+
+    @asynccontextmanager
+    async def acquire(
+        self, *, priority: int = 0, wait: bool = True, retry: bool = False, held_back: float = 0
+    ) -> AsyncIterator[None]:
+        """Use a spot in the rate limit.
+
+        Parameters
+        ----------
+        priority:
+            The priority of a request. A lower number means it will be executed faster.
+        wait:
+            Wait for a spot in the rate limit.
+
+            If this is set to :data:`False`, this will raise :exc:`RateLimitedError` if no spot is available right now.
+        retry:
+            Whether this is a request being retried after a rate limit.
+
+            Retries are let through before other waiting requests with the same priority.
+        held_back:
+            The share of the limit this request can not use, as it is kept free for more important requests.
+
+        Raises
+        ------
+        RateLimitedError
+            You are rate limited and ``wait`` was set to :data:`False`
+        """
+        if self.metadata.unlimited:
+            # Unlimited buckets have no state on the server either, skip the round-trip.
+            yield
+            return
+
+        connection = self._storage._connection
+        token, reply = connection.request(
+            "acquire", bucket=self._reference, priority=priority, wait=wait, retry=retry, held_back=held_back
+        )
+        try:
+            result: dict[str, Any] = await shield(reply)
+        except CancelledError:
+            reply.add_done_callback(partial(_release_cancelled, connection, token))
+            raise
+
+        metadata: RemoteBucketMetadata = self.metadata  # type: ignore [assignment]
+        metadata._limit = result["limit"]
+        metadata._unlimited = result["unlimited"]
+
+        try:
+            yield
+        except:
+            connection.send("release", token=token, failed=True)
+            raise
+        connection.send("release", token=token, failed=False)
+
+    async def update(  # type: ignore [override]
+        self, remaining: int | None = None, reset_after: float | None = None, *, unlimited: bool = False
+    ) -> None:
+        if self._reference[0] == "nextcore":
+            if unlimited:
+                self._storage._unlimited_buckets.add(self._reference[1])
+            else:
+                self._storage._unlimited_buckets.discard(self._reference[1])
+
+        self._storage._connection.send(
+            "update", bucket=self._reference, remaining=remaining, reset_after=reset_after, unlimited=unlimited
+        )
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Always ``0``, as the state is only known by the server."""
+        del priority  # Unused
+        return 0
+
+    def backoff(self, retry_after: float) -> None:
+        """Stop letting requests through in any process until ``retry_after`` seconds from now.
+
+        Parameters
+        ----------
+        retry_after:
+            How many seconds to wait before letting requests through again.
+        """
+        self._storage._connection.send("backoff", bucket=self._reference, retry_after=retry_after)
+
+    def migrate_to(self, bucket: Bucket) -> None:
+        """Does nothing, linking buckets is done by the storage."""
+        del bucket  # Unused
+
+    @property
+    def dirty(self) -> bool:
+        """Always :data:`False`, as there is no local state."""
+        return False
+
+
+class RemoteGlobalRateLimiter(BaseGlobalRateLimiter):
+    """A global rate-limiter shared through a :class:`RateLimitStorageServer`.
+
+    To avoid a round-trip per request, spots are leased from the server in batches.
+    Leased spots are only valid for the global rate limit window they were handed out in.
+
+    .. note::
+        Request priority is ignored.
+
+    Parameters
+    ----------
+    storage:
+        The storage to share the rate limit through.
+    lease_size:
+        How many spots to lease from the server at once.
+
+        A higher number means fewer round-trips, but spots that are leased and not used in time are wasted.
+
+    Attributes
+    ----------
+    lease_size:
+        How many spots to lease from the server at once.
+    """
+
+    __slots__ = ("lease_size", "_connection", "_remaining", "_expires_at", "_lease", "_waiting")
+
+    def __init__(self, storage: RemoteRateLimitStorage, *, lease_size: int = 5) -> None:
+        self.lease_size: int = lease_size
+        self._connection: _RemoteConnection = storage._connection
+        self._remaining: int = 0
+        self._expires_at: float = 0
+        self._lease: Task[None] | None = None
+        self._waiting: int = 0
+
+    @asynccontextmanager
+    async def acquire(self, *, priority: int = 0, wait: bool = True) -> AsyncIterator[None]:
+        """Use a spot in the rate-limit.
+
+        Parameters
+        ----------
+        priority:
+            .. warning::
+                Request priority currently does nothing.
+        wait:
+            Whether to wait for a spot in the rate limit.
+
+            If this is :data:`False`, this will raise :exc:`RateLimitedError` instead.
+
+        Raises
+        ------
+        RateLimitedError
+            ``wait`` was set to :data:`False` and we are rate limited.
+        """
+        del priority  # Unused
+        loop = get_running_loop()
+
+        while self._remaining <= 0 or loop.time() >= self._expires_at:
+            if not wait:
+                await self._request_lease(1, wait=False)
+                if self._remaining <= 0:
+                    raise RateLimitedError()
+                break
+
+            # Share one lease request between everyone waiting.
+            if self._lease is None:
+                self._lease = create_task(self._shared_lease(max(self.lease_size, self._waiting + 1)))
+
+            self._waiting += 1
+            try:
+                await shield(self._lease)
+            finally:
+                self._waiting -= 1
+
+        self._remaining -= 1
+        yield None
+
+    async def _shared_lease(self, count: int) -> None:
+        try:
+            await self._request_lease(count, wait=True)
+        finally:
+            self._lease = None
+
+    async def _request_lease(self, count: int, *, wait: bool) -> None:
+        loop = get_running_loop()
+        sent_at = loop.time()
+
+        _, reply = self._connection.request("lease", count=count, wait=wait)
+        result: dict[str, Any] = await reply
+
+        # The server started handling the request after we sent it, so this errs on the safe side.
+        self._remaining = result["granted"]
+        self._expires_at = sent_at + result["waited"] + result["expires_after"]
+
+    def update(self, retry_after: float) -> None:
+        """Updates the rate-limiter with info from a global scoped 429.
+
+        This pauses the global rate limit on the server for every client.
+
+        Parameters
+        ----------
+        retry_after:
+            The time from the `retry_after` field in the JSON response or the `retry_after` header.
+        """
+        logger.warning("Exceeded global rate-limit! (Retry after: %s)", retry_after)
+        self._remaining = 0
+        self._connection.send("global_update", retry_after=retry_after)
+
+
+class RemoteRateLimitStorage(RateLimitStorage):
+    """A :class:`RateLimitStorage` that keeps its state on a :class:`RateLimitStorageServer`.
+
+    This allows multiple processes using the same token to share rate limits.
+
+    **Example usage**
+
+    .. code-block:: python3
+
+        http_client = HTTPClient()
+        http_client.rate_limit_storages[authentication.rate_limit_key] = RemoteRateLimitStorage(
+            "127.0.0.1", 6543, namespace=str(bot_id)
+        )
+
+    .. note::
+        Looking up buckets does not talk to the server.
+        :meth:`RemoteRateLimitStorage.get_bucket_by_nextcore_id` and :meth:`RemoteRateLimitStorage.get_bucket_by_discord_id`
+        will therefore never return :data:`None`, the bucket is created on the server when it is first used.
+
+    Parameters
+    ----------
+    host:
+        The host of the server.
+    port:
+        The port of the server.
+    namespace:
+        The namespace to use on the server. Storages using the same namespace share rate limits.
+
+        .. warning::
+            This is sent to the server. Do not use a token here, use something like the bot id instead.
+    lease_size:
+        See :attr:`RemoteGlobalRateLimiter.lease_size`
+
+    Attributes
+    ----------
+    global_rate_limiter:
+        The users per user global rate limit. This is a :class:`RemoteGlobalRateLimiter` by default.
+    """
+
+    __slots__ = ("_connection", "_unlimited_buckets")
+
+    creates_buckets_on_lookup: ClassVar[bool] = True
+
+    def __init__(self, host: str, port: int, *, namespace: str | None = None, lease_size: int = 5) -> None:
+        # RateLimitStorage.__init__ is not called as there is no local state to clean up.
+        self._connection: _RemoteConnection = _RemoteConnection(host, port, namespace)
+        self._unlimited_buckets: set[Hashable] = set()
+        self.global_rate_limiter: BaseGlobalRateLimiter = RemoteGlobalRateLimiter(self, lease_size=lease_size)
+
+    async def get_bucket_by_nextcore_id(self, nextcore_id: Hashable) -> Bucket | None:
+        """Get a rate limit bucket from a nextcore created id.
+
+        Parameters
+        ----------
+        nextcore_id:
+            The nextcore generated bucket id. This can be gotten by using :attr:`Route.bucket`
+        """
+        return RemoteBucket(self, ["nextcore", nextcore_id, _metadata_key(nextcore_id)])
+
+    async def store_bucket_by_nextcore_id(self, nextcore_id: Hashable, bucket: Bucket) -> None:
+        """Store a rate limit bucket by nextcore generated id.
+
+        If ``bucket`` was gotten from :meth:`RemoteRateLimitStorage.get_bucket_by_discord_id` and no bucket with that
+        Discord bucket hash exists yet, the bucket stored by ``nextcore_id`` will be linked to the hash instead.
+
+        Parameters
+        ----------
+        nextcore_id:
+            The nextcore generated id of the
+        bucket:
+            The bucket to store.
+
+        Raises
+        ------
+        TypeError
+            ``bucket`` is not a :class:`RemoteBucket`
+        """
+        if not isinstance(bucket, RemoteBucket):
+            raise TypeError("Only RemoteBucket can be stored in a RemoteRateLimitStorage")
+        self._connection.send("store_nextcore", key=[nextcore_id, _metadata_key(nextcore_id)], bucket=bucket._reference)
+
+    async def get_bucket_by_discord_id(self, discord_id: str) -> Bucket | None:
+        """Get a rate limit bucket from the Discord bucket hash.
+
+        This can be obtained via the ``X-Ratelimit-Bucket`` header.
+
+        Parameters
+        ----------
+        discord_id:
+            The Discord bucket hash
+        """
+        return RemoteBucket(self, ["discord", discord_id])
+
+    async def store_bucket_by_discord_id(self, discord_id: str, bucket: Bucket) -> None:
+        """Store a rate limit bucket by the discord bucket hash.
+
+        This can be obtained via the ``X-Ratelimit-Bucket`` header.
+
+        Parameters
+        ----------
+        discord_id:
+            The Discord bucket hash
+        bucket:
+            The bucket to store.
+
+        Raises
+        ------
+        TypeError
+            ``bucket`` is not a :class:`RemoteBucket`
+        """
+        if not isinstance(bucket, RemoteBucket):
+            raise TypeError("Only RemoteBucket can be stored in a RemoteRateLimitStorage")
+        self._connection.send("store_discord", hash=discord_id, bucket=bucket._reference)
+
+    async def get_bucket_metadata(self, bucket_route: str) -> BucketMetadata | None:
+        """Get the metadata for a bucket from the route.
+
+        This does a round-trip to the server.
+
+        Parameters
+        ----------
+        bucket_route:
+            The bucket route.
+        """
+        _, reply = self._connection.request("get_metadata", route=bucket_route)
+        result: dict[str, Any] | None = await reply
+        if result is None:
+            return None
+        return RemoteBucketMetadata(
+            self._connection, ["route", bucket_route], result["limit"], unlimited=result["unlimited"]
+        )
+
+    async def store_metadata(self, bucket_route: str, metadata: BucketMetadata) -> None:
+        """Store the metadata for a bucket from the route.
+
+        Parameters
+        ----------
+        bucket_route:
+            The bucket route.
+        metadata:
+            The metadata to store.
+        """
+        self._connection.send("store_metadata", route=bucket_route, limit=metadata.limit, unlimited=metadata.unlimited)
+
+    async def close(self) -> None:
+        """Close the connection to the server."""
+        await self._connection.close()
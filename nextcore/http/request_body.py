@@ -0,0 +1,143 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from mimetypes import guess_type
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from ..common import json_dumps
+
+if TYPE_CHECKING:
+    from typing import Any, Final, Iterable
+
+    from .file import File
+
+__all__: Final[tuple[str, ...]] = ("RequestBody",)
+
+
+def _quote(value: str) -> str:
+    # Same escaping as browsers use for multipart field names and file names.
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _read_contents(file: File) -> bytes:
+    contents = file.contents
+    if isinstance(contents, (bytes, bytearray)):
+        return bytes(contents)
+    if not isinstance(contents, str):
+        contents = contents.read()
+    if isinstance(contents, str):
+        return contents.encode("utf-8")
+    return contents
+
+
+def _content_type(file: File) -> str:
+    if file.content_type is not None:
+        return file.content_type
+    # Discord uses the type to decide how attachments are shown, for example as images in embeds.
+    return guess_type(file.name)[0] or "application/octet-stream"
+
+
+class RequestBody:
+    """A request body that is encoded once and can be sent again on every retry.
+
+    :class:`aiohttp.FormData` can only be sent once, so a request with files would fail if it had to be retried after a rate limit.
+    This encodes the body up front, and :meth:`HTTPClient._request` sends the same bytes on every attempt.
+
+    .. note::
+        :meth:`HTTPClient._request` does this automatically for ``json=``.
+
+    Parameters
+    ----------
+    data:
+        The encoded body.
+    content_type:
+        The ``Content-Type`` header to send with the body.
+
+    Attributes
+    ----------
+    data:
+        The encoded body.
+    content_type:
+        The ``Content-Type`` header to send with the body.
+    """
+
+    __slots__ = ("data", "content_type")
+
+    def __init__(self, data: bytes, content_type: str) -> None:
+        self.data: bytes = data
+        self.content_type: str = content_type
+
+    @classmethod
+    def json(cls, payload: Any) -> RequestBody:
+        """Encode a json body.
+
+        Parameters
+        ----------
+        payload:
+            The object to send as json.
+        """
+        return cls(json_dumps(payload).encode("utf-8"), "application/json")
+
+    @classmethod
+    def multipart(cls, payload: Any, files: Iterable[tuple[str, File]] = ()) -> RequestBody:
+        """Encode a ``multipart/form-data`` body with a ``payload_json`` field and files.
+
+        Files are read once here, so file objects are not read again when the request is retried.
+        The ``Content-Type`` of a file is :attr:`File.content_type`, or guessed from :attr:`File.name`.
+
+        .. note::
+            File objects are read synchronously, which blocks the event loop while reading.
+            Read large files from disk in a executor and pass the :class:`bytes` instead.
+
+        Parameters
+        ----------
+        payload:
+            The object to send in the ``payload_json`` field.
+        files:
+            The field name and the file for every file to upload.
+        """
+        boundary = uuid4().hex
+        parts: list[bytes] = [
+            (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="payload_json"\r\n'
+                "Content-Type: application/json\r\n\r\n"
+            ).encode("utf-8"),
+            json_dumps(payload).encode("utf-8"),
+            b"\r\n",
+        ]
+        for name, file in files:
+            parts.append(
+                (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(file.name)}"\r\n'
+                    f"Content-Type: {_content_type(file)}\r\n\r\n"
+                ).encode("utf-8")
+            )
+            parts.append(_read_contents(file))
+            parts.append(b"\r\n")
+        parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+
+        return cls(b"".join(parts), f"multipart/form-data; boundary={boundary}")
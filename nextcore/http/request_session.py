@@ -35,6 +35,10 @@ class RequestSession:
 
     Parameters
     ----------
+    priority:
+        The request priority.
+    held_back:
+        The share of the rate limit the request can not use, as it is kept free for more important requests.
     unlimited:
         If this request was made when the bucket was unlimited.
 
@@ -46,16 +50,24 @@ class RequestSession:
         If this request was made when the bucket was unlimited.
 
         This exists to make sure that there is no bad state when switching between unlimited and limited.
+    priority:
+        The request priority.
+    held_back:
+        The share of the rate limit the request can not use, as it is kept free for more important requests.
     pending_future:
         The future that when set will execute the request.
+    queued:
+        Whether this is currently in a :class:`~nextcore.common.WaiterQueue`.
     """
 
-    __slots__: Final[tuple[str, ...]] = ("pending_future", "priority", "unlimited")
+    __slots__: Final[tuple[str, ...]] = ("pending_future", "priority", "held_back", "unlimited", "queued")
 
-    def __init__(self, *, priority: int = 0, unlimited: bool = False) -> None:
+    def __init__(self, *, priority: int = 0, held_back: float = 0, unlimited: bool = False) -> None:
         self.pending_future: Future[None] = Future()
         self.priority: int = priority
+        self.held_back: float = held_back
         self.unlimited: bool = unlimited
+        self.queued: bool = False
 
     def __gt__(self, other: RequestSession):
         return self.priority > other.priority
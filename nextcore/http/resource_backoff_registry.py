@@ -0,0 +1,167 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from logging import getLogger
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Final
+
+__all__: Final[tuple[str, ...]] = ("ResourceBackoffRegistry",)
+
+logger = getLogger(__name__)
+
+
+class _ResourceBackoff:
+    __slots__ = ("until", "strikes", "last_strike")
+
+    def __init__(self) -> None:
+        self.until: float = 0
+        self.strikes: float = 0
+        self.last_strike: float = 0
+
+
+class ResourceBackoffRegistry:
+    """Backoff windows for resources that hit a ``shared`` scope rate limit.
+
+    Shared rate limits are per resource (for example a emoji or a busy channel) and used by every bot,
+    so the bucket headers say nothing about when the resource is free again.
+    Every shared ``429`` on a resource adds a strike, and the resource is blocked for ``base_delay * 2 ** (strikes - 1)``
+    seconds (but at least ``retry_after`` and at most ``max_delay``). Strikes halve every ``half_life`` seconds,
+    so resources that stop being contended go back to no delay.
+
+    This is used by :class:`HTTPClient` before a request acquires its bucket.
+
+    Parameters
+    ----------
+    base_delay:
+        How many seconds to block a resource for after the first shared ``429``.
+    max_delay:
+        The longest a resource can be blocked for in seconds, unless Discord asks for longer.
+    half_life:
+        How many seconds it takes for the strikes of a resource to halve.
+    max_entries:
+        How many resources to remember. Expired resources are removed when this is reached.
+
+    Attributes
+    ----------
+    base_delay:
+        How many seconds to block a resource for after the first shared ``429``.
+    max_delay:
+        The longest a resource can be blocked for in seconds, unless Discord asks for longer.
+    half_life:
+        How many seconds it takes for the strikes of a resource to halve.
+    max_entries:
+        How many resources to remember.
+    """
+
+    __slots__ = ("base_delay", "max_delay", "half_life", "max_entries", "_resources")
+
+    def __init__(
+        self, *, base_delay: float = 1, max_delay: float = 60, half_life: float = 30, max_entries: int = 10_000
+    ) -> None:
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.half_life: float = half_life
+        self.max_entries: int = max_entries
+
+        # Internals
+        self._resources: dict[str, _ResourceBackoff] = {}  # Formatted route path -> backoff
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def delay(self, path: str) -> float:
+        """How many seconds to wait before requesting a resource.
+
+        Parameters
+        ----------
+        path:
+            The formatted path of the route. See :attr:`Route.path`
+        """
+        resource = self._resources.get(path)
+        if resource is None:
+            return 0
+        return max(resource.until - monotonic(), 0)
+
+    def strikes(self, path: str) -> float:
+        """The current, decayed, amount of shared ``429`` received on a resource.
+
+        Parameters
+        ----------
+        path:
+            The formatted path of the route. See :attr:`Route.path`
+        """
+        resource = self._resources.get(path)
+        if resource is None:
+            return 0
+        return self._decayed_strikes(resource, monotonic())
+
+    def record(self, path: str, retry_after: float) -> float:
+        """Block a resource after a shared ``429``.
+
+        Parameters
+        ----------
+        path:
+            The formatted path of the route. See :attr:`Route.path`
+        retry_after:
+            The ``retry_after`` of the response.
+
+        Returns
+        -------
+        float
+            How many seconds the resource is blocked for.
+        """
+        now = monotonic()
+        resource = self._resources.get(path)
+        if resource is None:
+            if len(self._resources) >= self.max_entries:
+                self._prune(now)
+            resource = self._resources[path] = _ResourceBackoff()
+
+        resource.strikes = self._decayed_strikes(resource, now) + 1
+        resource.last_strike = now
+
+        delay = max(retry_after, min(self.base_delay * 2 ** (resource.strikes - 1), self.max_delay))
+        resource.until = max(resource.until, now + delay)
+        logger.debug("Blocking shared resource %s for %ss (%.2f strikes)", path, delay, resource.strikes)
+        return delay
+
+    def _decayed_strikes(self, resource: _ResourceBackoff, now: float) -> float:
+        return resource.strikes * 0.5 ** ((now - resource.last_strike) / self.half_life)
+
+    def _prune(self, now: float) -> None:
+        # Forget resources that are not blocked and have mostly decayed back to no strikes.
+        for path in [
+            path
+            for path, resource in self._resources.items()
+            if resource.until <= now and self._decayed_strikes(resource, now) < 0.5
+        ]:
+            del self._resources[path]
+
+        if len(self._resources) >= self.max_entries:
+            # Everything is still contended, forget the ones that were blocked first.
+            for path in list(self._resources)[: len(self._resources) - self.max_entries + 1]:
+                del self._resources[path]
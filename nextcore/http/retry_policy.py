@@ -0,0 +1,134 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+from asyncio import TimeoutError as AsyncioTimeoutError
+from random import uniform
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+from .errors import HTTPRequestStatusError
+
+if TYPE_CHECKING:
+    from typing import Final, Iterable
+
+__all__: Final[tuple[str, ...]] = ("RetryPolicy",)
+
+
+class RetryPolicy:
+    """Which failed requests :class:`HTTPClient` retries, and how long it waits between attempts.
+
+    Only idempotent requests are retried, as a retried ``POST`` could for example send a message twice.
+    Wrappers mark requests that are safe to retry, like :meth:`HTTPClient.create_message` with ``enforce_nonce``.
+
+    The delay before retry ``n`` (starting at 0) is a random time between 0 and ``base_delay * 2 ** n``,
+    capped at ``max_delay``. The randomness stops many requests that failed at once from retrying at the same time.
+
+    Parameters
+    ----------
+    max_retries:
+        How many times to retry a request after it failed.
+    statuses:
+        The response statuses to retry.
+    exceptions:
+        The exceptions to retry.
+    methods:
+        The HTTP methods that are idempotent, and are retried by default.
+    base_delay:
+        The maximum delay in seconds before the first retry.
+    max_delay:
+        The longest delay in seconds before a retry.
+
+    Attributes
+    ----------
+    max_retries:
+        How many times to retry a request after it failed.
+    statuses:
+        The response statuses to retry.
+    exceptions:
+        The exceptions to retry.
+    methods:
+        The HTTP methods that are idempotent, and are retried by default.
+    base_delay:
+        The maximum delay in seconds before the first retry.
+    max_delay:
+        The longest delay in seconds before a retry.
+    """
+
+    __slots__ = ("max_retries", "statuses", "exceptions", "methods", "base_delay", "max_delay")
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        statuses: Iterable[int] = (500, 502, 503, 504),
+        exceptions: tuple[type[Exception], ...] = (ClientConnectionError, AsyncioTimeoutError),
+        methods: Iterable[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        base_delay: float = 0.5,
+        max_delay: float = 10,
+    ) -> None:
+        self.max_retries: int = max_retries
+        self.statuses: frozenset[int] = frozenset(statuses)
+        self.exceptions: tuple[type[Exception], ...] = exceptions
+        self.methods: frozenset[str] = frozenset(methods)
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+
+    def should_retry(self, method: str, error: Exception, retries: int, *, idempotent: bool | None = None) -> bool:
+        """Whether to retry a failed request.
+
+        Parameters
+        ----------
+        method:
+            The HTTP method of the request.
+        error:
+            Why the request failed.
+        retries:
+            How many times the request has been retried already.
+        idempotent:
+            Whether the request is safe to send more than once. If this is :data:`None`, ``methods`` is used.
+        """
+        if retries >= self.max_retries:
+            return False
+        if idempotent is None:
+            idempotent = method in self.methods
+        if not idempotent:
+            return False
+
+        if isinstance(error, HTTPRequestStatusError):
+            return error.status in self.statuses
+        if isinstance(error, ClientResponseError):
+            # For example a 502 from a proxy with a html body instead of json.
+            return error.status in self.statuses
+        return isinstance(error, self.exceptions)
+
+    def delay(self, retries: int) -> float:
+        """How long to wait before retrying a request.
+
+        Parameters
+        ----------
+        retries:
+            How many times the request has been retried already.
+        """
+        return uniform(0, min(self.base_delay * 2**retries, self.max_delay))
@@ -21,16 +21,36 @@
 
 from __future__ import annotations
 
+from string import Formatter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import ClassVar, Final, Literal
 
     from discord_typings import Snowflake
-    from typing_extensions import LiteralString
+    from typing_extensions import LiteralString, TypeAlias
+
+    BucketKey: TypeAlias = "tuple[str, str, str | None, str | None, str | None, str | None]"
 
 __all__: Final[tuple[str, ...]] = ("Route",)
 
+# Compiled paths keyed by the route template. Routes are always created from literal strings, so this stays small.
+_compiled_paths: dict[str, str | None] = {}
+
+
+def _compile_path(path: str) -> str | None:
+    # Turns "/guilds/{guild_id}" into "/guilds/%(guild_id)s" which is a lot faster to format than str.format.
+    # Returns None if the path uses anything that %-formatting can't express, in which case str.format is used.
+    compiled: list[str] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(path):
+        compiled.append(literal.replace("%", "%%"))
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or format_spec or conversion:
+            return None
+        compiled.append(f"%({field_name})s")
+    return "".join(compiled)
+
 
 class Route:
     """Metadata about a discord API route
@@ -68,7 +88,10 @@ class Route:
     bucket:
         The rate limit bucket this fits in.
 
-        This is created from :attr:`Route.guild_id`, :attr:`Route.channel_id`, :attr:`Route.webhook_id`, :attr:`Bucket.method` and :attr:`Route.path`
+        This is a tuple of :attr:`Route.method`, :attr:`Route.route` and the major parameters.
+        The major parameters are converted to :class:`str`, so an ID passed as an :class:`int` or a :class:`str`
+        maps to the same bucket.
+        The method and route strings are shared with the route, so this is cheap to create and store.
     """
 
     __slots__ = ("method", "route", "path", "ignore_global", "bucket")
@@ -99,9 +122,32 @@ class Route:
     ) -> None:
         self.method: str = method
         self.route: str = path
-        self.path: str = path.format(
-            guild_id=guild_id, channel_id=channel_id, webhook_id=webhook_id, webhook_token=webhook_token, **parameters
-        )
+
+        try:
+            compiled_path = _compiled_paths[path]
+        except KeyError:
+            compiled_path = _compiled_paths[path] = _compile_path(path)
+
+        parameters["guild_id"] = guild_id  # type: ignore [assignment]
+        parameters["channel_id"] = channel_id  # type: ignore [assignment]
+        parameters["webhook_id"] = webhook_id  # type: ignore [assignment]
+        parameters["webhook_token"] = webhook_token  # type: ignore [assignment]
+        if compiled_path is None:
+            self.path: str = path.format(**parameters)
+        else:
+            self.path = compiled_path % parameters
         self.ignore_global: bool = ignore_global
 
-        self.bucket: str = f"{guild_id}{channel_id}{webhook_id}{webhook_token}{method}{path}"
+        self.bucket: BucketKey = (
+            method,
+            path,
+            None if guild_id is None else str(guild_id),
+            None if channel_id is None else str(channel_id),
+            None if webhook_id is None else str(webhook_id),
+            webhook_token,
+        )
+
+    @property
+    def guild_id(self) -> str | None:
+        """The guild the route is for, if it has a ``guild_id`` major parameter."""
+        return self.bucket[2]
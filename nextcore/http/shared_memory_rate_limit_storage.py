@@ -0,0 +1,833 @@
+# The MIT License (MIT)
+# Copyright (c) 2021-present nextcore developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+import os
+from asyncio import sleep
+from contextlib import asynccontextmanager
+from functools import partial
+from hashlib import blake2b
+from logging import getLogger
+from mmap import mmap
+from struct import Struct
+from time import monotonic
+from typing import TYPE_CHECKING
+from weakref import ref
+
+from ..common.errors import RateLimitedError
+from .bucket import Bucket
+from .bucket_metadata import BucketMetadata
+from .global_rate_limiter import BaseGlobalRateLimiter
+from .rate_limit_storage import RateLimitStorage
+
+try:
+    import fcntl
+
+    _has_fcntl: bool = True
+except ImportError:
+    _has_fcntl = False
+
+if TYPE_CHECKING:
+    from typing import Any, AsyncIterator, ClassVar, Final, Hashable
+
+logger = getLogger(__name__)
+
+__all__: Final[tuple[str, ...]] = (
+    "SharedMemoryRateLimitStorage",
+    "SharedMemoryBucket",
+    "SharedMemoryBucketMetadata",
+    "SharedMemoryGlobalRateLimiter",
+)
+
+_MAGIC: Final[bytes] = b"NCRL"
+_VERSION: Final[int] = 1
+_MAX_PROBES: Final[int] = 16
+_POLL_INTERVAL: Final[float] = 0.05  # How often to check if a blind request in another process is done.
+
+# magic, version, bucket slots, metadata slots, discord slots, global window end, global used, global limit, global paused until
+_HEADER: Final[Struct] = Struct("<4sIIIIdIId")
+# key, alias, metadata key, remaining, in flight, reset at
+_BUCKET: Final[Struct] = Struct("<QQQiid")
+# key, limit, unlimited
+_METADATA: Final[Struct] = Struct("<Qi?")
+# key, bucket key
+_DISCORD: Final[Struct] = Struct("<QQ")
+_KEY: Final[Struct] = Struct("<Q")
+
+# Results of _SharedMemory.bucket_take
+_GRANTED: Final[int] = 0
+_PROBE: Final[int] = 1
+_UNLIMITED: Final[int] = 2
+_WAIT: Final[int] = 3
+
+
+def _stable_hash(value: Hashable) -> int:
+    # hash() is randomized per process, so it cannot be used for keys shared between processes.
+    digest = blake2b(repr(value).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1  # 0 marks a empty slot
+
+
+def _metadata_key(nextcore_id: Hashable) -> int:
+    # Route.bucket is (method, route, *major parameters) and the metadata is stored by the route.
+    if isinstance(nextcore_id, tuple) and len(nextcore_id) > 1 and isinstance(nextcore_id[1], str):
+        return _stable_hash(nextcore_id[1])
+    if isinstance(nextcore_id, str):
+        index = nextcore_id.find("/")
+        if index != -1:
+            return _stable_hash(nextcore_id[index:])
+    return 0
+
+
+def _reopen_after_fork(memory_ref: ref[_SharedMemory]) -> None:
+    memory = memory_ref()
+    if memory is not None:
+        memory.reopen()
+
+
+class _SharedMemory:
+    """The memory mapped file and the lock protecting it.
+
+    All methods except :meth:`_SharedMemory.reopen` and :meth:`_SharedMemory.close` have to be called while holding the lock.
+    """
+
+    __slots__ = (
+        "path",
+        "bucket_slots",
+        "metadata_slots",
+        "discord_slots",
+        "memory",
+        "_fd",
+        "_metadata_offset",
+        "_discord_offset",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, path: str, bucket_slots: int, metadata_slots: int, discord_slots: int, global_limit: int
+    ) -> None:
+        self.path: str = path
+        self.bucket_slots: int = bucket_slots
+        self.metadata_slots: int = metadata_slots
+        self.discord_slots: int = discord_slots
+
+        self._metadata_offset: int = _HEADER.size + bucket_slots * _BUCKET.size
+        self._discord_offset: int = self._metadata_offset + metadata_slots * _METADATA.size
+        size = self._discord_offset + discord_slots * _DISCORD.size
+
+        self._fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self:
+            if os.fstat(self._fd).st_size == 0:
+                # First one to use the file, set it up.
+                os.ftruncate(self._fd, size)
+                self.memory: mmap = mmap(self._fd, size)
+                _HEADER.pack_into(
+                    self.memory, 0, _MAGIC, _VERSION, bucket_slots, metadata_slots, discord_slots, 0, 0, global_limit, 0
+                )
+            else:
+                self.memory = mmap(self._fd, size)
+                header = _HEADER.unpack_from(self.memory, 0)
+                if header[:5] != (_MAGIC, _VERSION, bucket_slots, metadata_slots, discord_slots):
+                    self.memory.close()
+                    raise ValueError(f"{path} was created with a different layout")
+
+        # flock locks are shared between forked processes, so the child needs its own file descriptor.
+        os.register_at_fork(after_in_child=partial(_reopen_after_fork, ref(self)))
+
+    def __enter__(self) -> None:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *args: Any) -> None:
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def reopen(self) -> None:
+        if self._fd == -1:
+            return  # Closed
+        os.close(self._fd)
+        self._fd = os.open(self.path, os.O_RDWR)
+
+    def close(self) -> None:
+        if self._fd == -1:
+            return
+        self.memory.close()
+        os.close(self._fd)
+        self._fd = -1
+
+    # Buckets
+    def find_bucket(self, key: int, metadata_key: int = 0, *, create: bool = True) -> int | None:
+        """Find the offset of a bucket, following links to other buckets."""
+        offset = self._find_bucket(key, metadata_key, create=create)
+        if offset is None:
+            return None
+
+        alias: int = _KEY.unpack_from(self.memory, offset + 8)[0]
+        if alias == 0:
+            return offset
+
+        linked_offset = self._find_bucket(alias, create=False)
+        if linked_offset is None:
+            # The linked bucket was overwritten, forget about it.
+            _KEY.pack_into(self.memory, offset + 8, 0)
+            return offset
+        return linked_offset
+
+    def _find_bucket(self, key: int, metadata_key: int = 0, *, create: bool) -> int | None:
+        now = monotonic()
+        start = key % self.bucket_slots
+        reusable: int | None = None
+
+        for probe in range(_MAX_PROBES):
+            offset = _HEADER.size + ((start + probe) % self.bucket_slots) * _BUCKET.size
+            slot_key, _, _, _, in_flight, reset_at = _BUCKET.unpack_from(self.memory, offset)
+
+            if slot_key == key:
+                return offset
+            if slot_key == 0:
+                reusable = offset
+                break
+            if reusable is None and in_flight == 0 and reset_at <= now:
+                # Nothing is using this bucket, so it is the same as a new bucket created from metadata.
+                reusable = offset
+
+        if not create:
+            return None
+        if reusable is None:
+            logger.warning("Shared memory bucket table is full, consider increasing bucket_slots")
+            reusable = _HEADER.size + start * _BUCKET.size
+
+        _BUCKET.pack_into(self.memory, reusable, key, 0, metadata_key, -1, 0, 0)
+        return reusable
+
+    def bucket_take(self, offset: int) -> tuple[int, float]:
+        key, alias, metadata_key, remaining, in_flight, reset_at = _BUCKET.unpack_from(self.memory, offset)
+        limit, unlimited = self.metadata_get(metadata_key)
+
+        if unlimited:
+            return _UNLIMITED, 0
+
+        now = monotonic()
+        if reset_at != 0 and now >= reset_at:
+            # Reset, this falls back to the limit from the metadata
+            remaining = -1
+            reset_at = 0
+
+        if remaining == -1 and limit is not None:
+            remaining = limit
+
+        if remaining == -1:
+            # We have no info on rate limits, so we have to do a "blind" request to find out what the rate limits is.
+            if in_flight != 0:
+                return _WAIT, _POLL_INTERVAL
+            _BUCKET.pack_into(self.memory, offset, key, alias, metadata_key, remaining, 1, reset_at)
+            return _PROBE, 0
+
+        if remaining == 0:
+            return _WAIT, reset_at - now if reset_at != 0 else _POLL_INTERVAL
+
+        _BUCKET.pack_into(self.memory, offset, key, alias, metadata_key, remaining - 1, in_flight, reset_at)
+        return _GRANTED, 0
+
+    def bucket_give_back(self, offset: int, status: int, *, failed: bool) -> None:
+        key, alias, metadata_key, remaining, in_flight, reset_at = _BUCKET.unpack_from(self.memory, offset)
+        if status == _PROBE:
+            in_flight = 0
+        elif failed and remaining != -1:
+            # The request failed and will not count towards the rate limit.
+            remaining += 1
+        _BUCKET.pack_into(self.memory, offset, key, alias, metadata_key, remaining, in_flight, reset_at)
+
+    def bucket_update(self, offset: int, remaining: int, reset_after: float) -> None:
+        key, alias, metadata_key, current_remaining, in_flight, reset_at = _BUCKET.unpack_from(self.memory, offset)
+        now = monotonic()
+
+        if reset_at == 0 or now >= reset_at:
+            # New window
+            reset_at = now + reset_after
+        elif current_remaining != -1:
+            # Other processes may have used spots that Discord has not seen yet.
+            remaining = min(remaining, current_remaining)
+
+        _BUCKET.pack_into(self.memory, offset, key, alias, metadata_key, remaining, in_flight, reset_at)
+
+    def bucket_wait(self, offset: int) -> float:
+        _, _, metadata_key, remaining, _, reset_at = _BUCKET.unpack_from(self.memory, offset)
+        now = monotonic()
+        if remaining != 0 or reset_at == 0 or now >= reset_at or self.metadata_get(metadata_key)[1]:
+            return 0
+        return reset_at - now
+
+    def bucket_backoff(self, offset: int, retry_after: float) -> None:
+        key, alias, metadata_key, _, in_flight, reset_at = _BUCKET.unpack_from(self.memory, offset)
+        reset_at = max(reset_at, monotonic() + retry_after)
+        _BUCKET.pack_into(self.memory, offset, key, alias, metadata_key, 0, in_flight, reset_at)
+
+    def bucket_key(self, offset: int) -> int:
+        return _KEY.unpack_from(self.memory, offset)[0]
+
+    def bucket_metadata_key(self, offset: int) -> int:
+        return _KEY.unpack_from(self.memory, offset + 16)[0]
+
+    def link_bucket(self, offset: int, target: int) -> None:
+        if self.bucket_key(offset) != target:
+            _KEY.pack_into(self.memory, offset + 8, target)
+
+    # Metadata
+    def _find_metadata(self, key: int, *, create: bool) -> int | None:
+        start = key % self.metadata_slots
+        for probe in range(_MAX_PROBES):
+            offset = self._metadata_offset + ((start + probe) % self.metadata_slots) * _METADATA.size
+            slot_key: int = _KEY.unpack_from(self.memory, offset)[0]
+            if slot_key == key:
+                return offset
+            if slot_key == 0:
+                if not create:
+                    return None
+                _METADATA.pack_into(self.memory, offset, key, -1, False)
+                return offset
+        if not create:
+            return None
+        logger.warning("Shared memory metadata table is full, consider increasing metadata_slots")
+        offset = self._metadata_offset + start * _METADATA.size
+        _METADATA.pack_into(self.memory, offset, key, -1, False)
+        return offset
+
+    def metadata_exists(self, key: int) -> bool:
+        return self._find_metadata(key, create=False) is not None
+
+    def metadata_get(self, key: int) -> tuple[int | None, bool]:
+        if key == 0:
+            return None, False
+        offset = self._find_metadata(key, create=False)
+        if offset is None:
+            return None, False
+        _, limit, unlimited = _METADATA.unpack_from(self.memory, offset)
+        return (None if limit == -1 else limit), unlimited
+
+    def metadata_set(self, key: int, limit: int | None, unlimited: bool) -> None:
+        if key == 0:
+            return
+        offset = self._find_metadata(key, create=True)
+        _METADATA.pack_into(self.memory, offset, key, -1 if limit is None else limit, unlimited)  # type: ignore [arg-type]
+
+    # Discord bucket hashes
+    def _find_discord(self, key: int, *, create: bool) -> int | None:
+        start = key % self.discord_slots
+        for probe in range(_MAX_PROBES):
+            offset = self._discord_offset + ((start + probe) % self.discord_slots) * _DISCORD.size
+            slot_key: int = _KEY.unpack_from(self.memory, offset)[0]
+            if slot_key == key or (slot_key == 0 and create):
+                return offset
+            if slot_key == 0:
+                return None
+        if not create:
+            return None
+        return self._discord_offset + start * _DISCORD.size
+
+    def discord_get(self, key: int) -> int | None:
+        offset = self._find_discord(key, create=False)
+        if offset is None:
+            return None
+        return _DISCORD.unpack_from(self.memory, offset)[1]
+
+    def discord_set(self, key: int, bucket_key: int) -> None:
+        offset = self._find_discord(key, create=True)
+        _DISCORD.pack_into(self.memory, offset, key, bucket_key)  # type: ignore [arg-type]
+
+    # Global
+    def global_take(self) -> float:
+        """Take a spot in the global rate limit.
+
+        Returns
+        -------
+        float
+            How long to wait before trying again, or ``0`` if a spot was taken.
+        """
+        header = list(_HEADER.unpack_from(self.memory, 0))
+        window_end, used, limit, paused_until = header[5:]
+        now = monotonic()
+
+        if paused_until > now:
+            return paused_until - now
+
+        if now >= window_end:
+            window_end = now + 1
+            used = 0
+
+        if used >= limit:
+            return window_end - now
+
+        header[5:] = window_end, used + 1, limit, paused_until
+        _HEADER.pack_into(self.memory, 0, *header)
+        return 0
+
+    def global_give_back(self) -> None:
+        header = list(_HEADER.unpack_from(self.memory, 0))
+        if header[6] > 0 and monotonic() < header[5]:
+            header[6] -= 1
+            _HEADER.pack_into(self.memory, 0, *header)
+
+    def global_pause(self, retry_after: float) -> None:
+        header = list(_HEADER.unpack_from(self.memory, 0))
+        header[8] = max(header[8], monotonic() + retry_after)
+        _HEADER.pack_into(self.memory, 0, *header)
+
+
+class SharedMemoryBucketMetadata(BucketMetadata):
+    """A :class:`BucketMetadata` stored in a :class:`SharedMemoryRateLimitStorage`.
+
+    .. note::
+        This should not be created manually, it is returned by :class:`SharedMemoryRateLimitStorage` and :class:`SharedMemoryBucket`
+    """
+
+    __slots__ = ("_memory", "_key")
+
+    def __init__(self, memory: _SharedMemory, key: int) -> None:
+        # BucketMetadata.__init__ is not called as the state lives in shared memory.
+        self._memory: _SharedMemory = memory
+        self._key: int = key
+        self.bucket_hash: str | None = None  # Linking is done by the storage.
+        self.min_limit: int | None = None  # Only kept locally.
+
+    @property  # type: ignore [override]
+    def limit(self) -> int | None:
+        with self._memory:
+            return self._memory.metadata_get(self._key)[0]
+
+    @limit.setter
+    def limit(self, limit: int | None) -> None:
+        with self._memory:
+            self._memory.metadata_set(self._key, limit, self._memory.metadata_get(self._key)[1])
+
+    @property  # type: ignore [override]
+    def unlimited(self) -> bool:
+        with self._memory:
+            return self._memory.metadata_get(self._key)[1]
+
+    @unlimited.setter
+    def unlimited(self, unlimited: bool) -> None:
+        with self._memory:
+            self._memory.metadata_set(self._key, self._memory.metadata_get(self._key)[0], unlimited)
+
+
+class SharedMemoryBucket(Bucket):
+    """A :class:`Bucket` stored in a :class:`SharedMemoryRateLimitStorage`.
+
+    Resets are done lazily when the bucket is next used, so no timers are scheduled.
+
+    .. note::
+        Request priority is ignored.
+    .. note::
+        This should not be created manually, it is returned by :class:`SharedMemoryRateLimitStorage`
+    """
+
+    def __init__(self, memory: _SharedMemory, key: int, metadata_key: int, *, discord_key: int = 0) -> None:
+        # Bucket.__init__ is not called as the state lives in shared memory.
+        self._memory: _SharedMemory = memory
+        self._key: int = key
+        self._metadata_key: int = metadata_key
+        self._discord_key: int = discord_key
+
+        if discord_key != 0:
+            # Looking up a Discord bucket hash should not create a bucket for it, as that would prevent linking.
+            with memory:
+                bucket_key = memory.discord_get(discord_key)
+                offset = None if bucket_key is None else memory.find_bucket(bucket_key, create=False)
+                if offset is not None:
+                    self._metadata_key = memory.bucket_metadata_key(offset)
+        self.metadata: BucketMetadata = SharedMemoryBucketMetadata(memory, self._metadata_key)
+
+    def _find(self) -> int:
+        memory = self._memory
+        if self._discord_key == 0:
+            return memory.find_bucket(self._key, self._metadata_key)  # type: ignore [return-value]
+
+        bucket_key = memory.discord_get(self._discord_key)
+        if bucket_key is not None:
+            offset = memory.find_bucket(bucket_key, create=False)
+            if offset is not None:
+                return offset
+
+        # Not used yet, create a bucket for it.
+        offset = memory.find_bucket(self._key)
+        memory.discord_set(self._discord_key, self._key)
+        return offset  # type: ignore [return-value]
+
+    def canonical_key(self) -> int:
+        """The key of the bucket this ends up using after following links."""
+        with self._memory:
+            return self._memory.bucket_key(self._find())
+
+    @asynccontextmanager
+    async def acquire(
+        self, *, priority: int = 0, wait: bool = True, retry: bool = False, held_back: float = 0
+    ) -> AsyncIterator[None]:
+        """Use a spot in the rate limit.
+
+        Parameters
+        ----------
+        priority:
+            .. warning::
+                Request priority currently does nothing.
+        wait:
+            Wait for a spot in the rate limit.
+
+            If this is set to :data:`False`, this will raise :exc:`RateLimitedError` if no spot is available right now.
+        retry:
+            .. warning::
+                This currently does nothing, as there is no queue.
+        held_back:
+            .. warning::
+                This currently does nothing, as there is no queue.
+
+        Raises
+        ------
+        RateLimitedError
+            You are rate limited and ``wait`` was set to :data:`False`
+        """
+        del priority, retry, held_back  # Unused
+        memory = self._memory
+
+        while True:
+            with memory:
+                offset = self._find()
+                status, delay = memory.bucket_take(offset)
+            if status != _WAIT:
+                break
+            if not wait:
+                raise RateLimitedError()
+            await sleep(delay)
+
+        if status == _UNLIMITED:
+            yield
+            return
+
+        try:
+            yield
+        except:
+            with memory:
+                memory.bucket_give_back(offset, status, failed=True)
+            raise
+        with memory:
+            memory.bucket_give_back(offset, status, failed=False)
+
+    async def update(  # type: ignore [override]
+        self, remaining: int | None = None, reset_after: float | None = None, *, unlimited: bool = False
+    ) -> None:
+        if unlimited:
+            # This is stored in the metadata, which is handled by the HTTPClient.
+            return
+        with self._memory:
+            self._memory.bucket_update(self._find(), remaining, reset_after)  # type: ignore [arg-type]
+
+    def estimate_wait(self, *, priority: int = 0) -> float:
+        """Estimate how many seconds a new request would wait for a spot.
+
+        This is a lower bound, as other processes can take spots.
+
+        Parameters
+        ----------
+        priority:
+            .. warning::
+                Request priority currently does nothing.
+        """
+        del priority  # Unused
+        with self._memory:
+            return self._memory.bucket_wait(self._find())
+
+    def backoff(self, retry_after: float) -> None:
+        """Stop letting requests through in any process until ``retry_after`` seconds from now.
+
+        Parameters
+        ----------
+        retry_after:
+            How many seconds to wait before letting requests through again.
+        """
+        with self._memory:
+            self._memory.bucket_backoff(self._find(), retry_after)
+
+    def migrate_to(self, bucket: Bucket) -> None:
+        """Does nothing, linking buckets is done by the storage."""
+        del bucket  # Unused
+
+    @property
+    def dirty(self) -> bool:
+        """Always :data:`False`, as there is no local state."""
+        return False
+
+
+class SharedMemoryGlobalRateLimiter(BaseGlobalRateLimiter):
+    """A global rate-limiter shared through a :class:`SharedMemoryRateLimitStorage`.
+
+    .. note::
+        Request priority is ignored.
+
+    Parameters
+    ----------
+    storage:
+        The storage to share the rate limit through.
+    """
+
+    __slots__ = ("_memory",)
+
+    def __init__(self, storage: SharedMemoryRateLimitStorage) -> None:
+        self._memory: _SharedMemory = storage._memory
+
+    @asynccontextmanager
+    async def acquire(self, *, priority: int = 0, wait: bool = True) -> AsyncIterator[None]:
+        """Use a spot in the rate-limit.
+
+        Parameters
+        ----------
+        priority:
+            .. warning::
+                Request priority currently does nothing.
+        wait:
+            Whether to wait for a spot in the rate limit.
+
+            If this is :data:`False`, this will raise :exc:`RateLimitedError` instead.
+
+        Raises
+        ------
+        RateLimitedError
+            ``wait`` was set to :data:`False` and we are rate limited.
+        """
+        del priority  # Unused
+        while True:
+            with self._memory:
+                delay = self._memory.global_take()
+            if delay == 0:
+                break
+            if not wait:
+                raise RateLimitedError()
+            await sleep(delay)
+
+        try:
+            yield None
+        except:
+            # A exception occured. This will not take from the rate-limit
+            with self._memory:
+                self._memory.global_give_back()
+            raise
+
+    def update(self, retry_after: float) -> None:
+        """Updates the rate-limiter with info from a global scoped 429.
+
+        This pauses the global rate limit for every process.
+
+        Parameters
+        ----------
+        retry_after:
+            The time from the `retry_after` field in the JSON response or the `retry_after` header.
+        """
+        logger.warning("Exceeded global rate-limit! (Retry after: %s)", retry_after)
+        with self._memory:
+            self._memory.global_pause(retry_after)
+
+
+class SharedMemoryRateLimitStorage(RateLimitStorage):
+    """A :class:`RateLimitStorage` that keeps its state in a memory mapped file.
+
+    This allows multiple processes on the same machine using the same token to share rate limits.
+    All processes have to use the same ``path`` and the same amount of slots.
+
+    **Example usage**
+
+    .. code-block:: python3
+
+        http_client = HTTPClient()
+        http_client.rate_limit_storages[authentication.rate_limit_key] = SharedMemoryRateLimitStorage(
+            "/dev/shm/my-bot-rate-limits"
+        )
+
+    .. note::
+        This is only supported on systems with :mod:`fcntl`.
+    .. note::
+        Buckets are created on first use, so :meth:`SharedMemoryRateLimitStorage.get_bucket_by_nextcore_id`
+        and :meth:`SharedMemoryRateLimitStorage.get_bucket_by_discord_id` will never return :data:`None`.
+
+        When the bucket table is full, unused buckets are overwritten.
+    .. note::
+        This is safe to use after forking.
+
+    Parameters
+    ----------
+    path:
+        The file to store the rate limits in.
+    bucket_slots:
+        How many buckets can be stored.
+    metadata_slots:
+        How many routes metadata can be stored for.
+    discord_slots:
+        How many Discord bucket hashes can be stored.
+    global_limit:
+        The amount of requests per second that can be made. This is only used when creating the file.
+
+    Attributes
+    ----------
+    global_rate_limiter:
+        The users per user global rate limit. This is a :class:`SharedMemoryGlobalRateLimiter` by default.
+
+    Raises
+    ------
+    RuntimeError
+        :mod:`fcntl` is not available on this system.
+    ValueError
+        The file was created with a different amount of slots.
+    """
+
+    __slots__ = ("_memory",)
+
+    creates_buckets_on_lookup: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        bucket_slots: int = 65536,
+        metadata_slots: int = 4096,
+        discord_slots: int = 4096,
+        global_limit: int = 50,
+    ) -> None:
+        if not _has_fcntl:
+            raise RuntimeError("SharedMemoryRateLimitStorage requires fcntl which is not available on this system")
+
+        # RateLimitStorage.__init__ is not called as there is no local state to clean up.
+        self._memory: _SharedMemory = _SharedMemory(path, bucket_slots, metadata_slots, discord_slots, global_limit)
+        self.global_rate_limiter: BaseGlobalRateLimiter = SharedMemoryGlobalRateLimiter(self)
+
+    async def get_bucket_by_nextcore_id(self, nextcore_id: Hashable) -> Bucket | None:
+        """Get a rate limit bucket from a nextcore created id.
+
+        Parameters
+        ----------
+        nextcore_id:
+            The nextcore generated bucket id. This can be gotten by using :attr:`Route.bucket`
+        """
+        return SharedMemoryBucket(self._memory, _stable_hash(nextcore_id), _metadata_key(nextcore_id))
+
+    async def store_bucket_by_nextcore_id(self, nextcore_id: Hashable, bucket: Bucket) -> None:
+        """Store a rate limit bucket by nextcore generated id.
+
+        If ``bucket`` was gotten from :meth:`SharedMemoryRateLimitStorage.get_bucket_by_discord_id` and no bucket with that
+        Discord bucket hash exists yet, the bucket stored by ``nextcore_id`` will be linked to the hash instead.
+
+        Parameters
+        ----------
+        nextcore_id:
+            The nextcore generated id of the
+        bucket:
+            The bucket to store.
+
+        Raises
+        ------
+        TypeError
+            ``bucket`` is not a :class:`SharedMemoryBucket`
+        """
+        if not isinstance(bucket, SharedMemoryBucket):
+            raise TypeError("Only SharedMemoryBucket can be stored in a SharedMemoryRateLimitStorage")
+
+        memory = self._memory
+        with memory:
+            offset = memory._find_bucket(_stable_hash(nextcore_id), _metadata_key(nextcore_id), create=True)
+
+            if bucket._discord_key != 0:
+                linked_key = memory.discord_get(bucket._discord_key)
+                if linked_key is None or memory.find_bucket(linked_key, create=False) is None:
+                    # Nothing to link to yet, this bucket now owns the hash.
+                    memory.discord_set(bucket._discord_key, memory.bucket_key(offset))  # type: ignore [arg-type]
+                    return
+            else:
+                linked_key = memory.bucket_key(bucket._find())
+
+            memory.link_bucket(offset, linked_key)  # type: ignore [arg-type]
+
+    async def get_bucket_by_discord_id(self, discord_id: str) -> Bucket | None:
+        """Get a rate limit bucket from the Discord bucket hash.
+
+        This can be obtained via the ``X-Ratelimit-Bucket`` header.
+
+        Parameters
+        ----------
+        discord_id:
+            The Discord bucket hash
+        """
+        return SharedMemoryBucket(
+            self._memory, _stable_hash(("discord", discord_id)), 0, discord_key=_stable_hash(discord_id)
+        )
+
+    async def store_bucket_by_discord_id(self, discord_id: str, bucket: Bucket) -> None:
+        """Store a rate limit bucket by the discord bucket hash.
+
+        This can be obtained via the ``X-Ratelimit-Bucket`` header.
+
+        Parameters
+        ----------
+        discord_id:
+            The Discord bucket hash
+        bucket:
+            The bucket to store.
+
+        Raises
+        ------
+        TypeError
+            ``bucket`` is not a :class:`SharedMemoryBucket`
+        """
+        if not isinstance(bucket, SharedMemoryBucket):
+            raise TypeError("Only SharedMemoryBucket can be stored in a SharedMemoryRateLimitStorage")
+        bucket_key = bucket.canonical_key()
+        with self._memory:
+            self._memory.discord_set(_stable_hash(discord_id), bucket_key)
+
+    async def get_bucket_metadata(self, bucket_route: str) -> BucketMetadata | None:
+        """Get the metadata for a bucket from the route.
+
+        Parameters
+        ----------
+        bucket_route:
+            The bucket route.
+        """
+        key = _stable_hash(bucket_route)
+        with self._memory:
+            if not self._memory.metadata_exists(key):
+                return None
+        return SharedMemoryBucketMetadata(self._memory, key)
+
+    async def store_metadata(self, bucket_route: str, metadata: BucketMetadata) -> None:
+        """Store the metadata for a bucket from the route.
+
+        Parameters
+        ----------
+        bucket_route:
+            The bucket route.
+        metadata:
+            The metadata to store.
+        """
+        with self._memory:
+            self._memory.metadata_set(_stable_hash(bucket_route), metadata.limit, metadata.unlimited)
+
+    async def close(self) -> None:
+        """Unmap the shared memory.
+
+        .. note::
+            This does not delete the file, as other processes may still be using it.
+        """
+        self._memory.close()
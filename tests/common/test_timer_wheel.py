@@ -0,0 +1,64 @@
+from asyncio import get_running_loop, sleep
+
+from pytest import mark
+
+from nextcore.common.timer_wheel import TimerWheel
+
+
+@mark.asyncio
+async def test_runs_callbacks_in_order() -> None:
+    wheel = TimerWheel()
+    called: list[int] = []
+
+    wheel.call_later(0.03, lambda: called.append(3))
+    wheel.call_later(0.01, lambda: called.append(1))
+    wheel.call_later(0.02, lambda: called.append(2))
+    await sleep(0.1)
+
+    assert called == [1, 2, 3]
+
+
+@mark.asyncio
+async def test_never_runs_early() -> None:
+    wheel = TimerWheel(resolution=0.05)
+    loop = get_running_loop()
+    ran_at: list[float] = []
+
+    handle = wheel.call_later(0.01, lambda: ran_at.append(loop.time()))
+    await sleep(0.1)
+
+    assert ran_at, "Callback did not run"
+    assert ran_at[0] >= handle.when(), "Callback ran before it was due"
+
+
+@mark.asyncio
+async def test_batches_same_tick() -> None:
+    wheel = TimerWheel(resolution=0.05)
+    called: list[int] = []
+
+    # Callbacks due at the same time, call_later could cross a tick boundary between calls.
+    when = get_running_loop().time() + 0.01
+    for i in range(100):
+        wheel.call_at(when, lambda i=i: called.append(i))
+    assert len(wheel._ticks) == 1, "Callbacks in the same tick should share a slot"
+    await sleep(0.1)
+
+    assert called == list(range(100))
+
+
+@mark.asyncio
+async def test_cancel() -> None:
+    wheel = TimerWheel()
+    called: list[int] = []
+
+    handle = wheel.call_later(0.01, lambda: called.append(1))
+    handle.cancel()
+    await sleep(0.05)
+
+    assert handle.cancelled
+    assert not called, "Cancelled callback was called"
+
+
+@mark.asyncio
+async def test_shared_per_loop() -> None:
+    assert TimerWheel.for_loop() is TimerWheel.for_loop(), "Wheel was not shared"
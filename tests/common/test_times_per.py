@@ -1,3 +1,6 @@
+import asyncio
+from time import monotonic
+
 from pytest import mark, raises
 
 from nextcore.common.errors import RateLimitedError
@@ -16,7 +19,7 @@ async def test_should_not_sleep():
 
 
 @mark.asyncio
-@match_time(0.1, 0.01)
+@match_time(0.1, 0.02)  # Resets can run up to one timer wheel tick late
 async def test_should_sleep():
     rate_limiter = TimesPer(5, 0.1)
 
@@ -52,3 +55,113 @@ async def test_no_wait():
     with raises(RateLimitedError):
         async with rate_limiter.acquire(wait=False):
             ...
+
+
+@mark.asyncio
+@match_time(0.1, 0.03)
+async def test_sliding_log():
+    rate_limiter = TimesPer(5, 0.1, algorithm="sliding_log")
+
+    for _ in range(10):
+        async with rate_limiter.acquire():
+            ...
+
+
+@mark.asyncio
+@match_time(0.09, 0.03)
+async def test_pacing_spaces_uses():
+    rate_limiter = TimesPer(10, 0.1, algorithm="pacing")
+
+    # One every 0.01 seconds, the first one goes through instantly.
+    for _ in range(10):
+        async with rate_limiter.acquire():
+            ...
+
+
+@mark.asyncio
+@mark.parametrize("algorithm", ["fixed_window", "sliding_log", "pacing"])
+async def test_cancelled_waiter_does_not_use_a_spot(algorithm):
+    rate_limiter = TimesPer(1, 0.05, algorithm=algorithm)
+
+    async def use():
+        async with rate_limiter.acquire():
+            ...
+
+    await use()
+    cancelled = asyncio.create_task(use())
+    waiting = asyncio.create_task(use())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, 0.2)
+    assert len(rate_limiter._pending) == 0
+
+
+def test_unknown_algorithm():
+    with raises(ValueError):
+        TimesPer(1, 1, algorithm="unknown")  # type: ignore [arg-type]
+
+
+@mark.asyncio
+async def test_estimate_wait_fixed_window():
+    times_per = TimesPer(1, 1)
+    assert times_per.estimate_wait() == 0
+
+    async with times_per.acquire():
+        pass
+    assert 0.9 < times_per.estimate_wait() <= 1
+
+    # A request already waiting means a new one has to wait another window
+    waiting = asyncio.create_task(times_per.acquire().__aenter__())
+    await asyncio.sleep(0)
+    assert 1.9 < times_per.estimate_wait() <= 2
+    assert times_per.estimate_wait(priority=-1) <= 1, "Lower priority number should skip the waiting request"
+    waiting.cancel()
+
+
+@mark.asyncio
+async def test_estimate_wait_pacing():
+    times_per = TimesPer(10, 1, algorithm="pacing")
+
+    async with times_per.acquire():
+        pass
+    assert 0.09 < times_per.estimate_wait() <= 0.1
+
+
+@mark.asyncio
+@mark.parametrize("algorithm", ["fixed_window", "sliding_log"])
+async def test_held_back_spots_stay_free(algorithm):
+    rate_limiter = TimesPer(4, 0.2, algorithm=algorithm)
+    started: list[str] = []
+
+    async def use(name: str, priority: int, held_back: float):
+        async with rate_limiter.acquire(priority=priority, held_back=held_back):
+            started.append(name)
+
+    await use("bulk", 1, 0.5)
+    await use("bulk", 1, 0.5)
+    bulk = asyncio.create_task(use("bulk", 1, 0.5))
+    await asyncio.sleep(0)
+    assert started == ["bulk", "bulk"], "The rest of the limit should be held back"
+
+    await asyncio.wait_for(use("critical", 0, 0), 0.05)
+    assert started == ["bulk", "bulk", "critical"], "Held back spots should be usable by more important uses"
+
+    await asyncio.wait_for(bulk, 0.5)
+
+
+@mark.asyncio
+async def test_unused_held_back_spots_are_lent_out():
+    rate_limiter = TimesPer(4, 0.4, lend_held_after=0.5)
+    started: list[float] = []
+
+    async def use():
+        async with rate_limiter.acquire(priority=1, held_back=0.5):
+            started.append(monotonic())
+
+    await use()
+    await use()
+    await asyncio.wait_for(use(), 1)
+
+    # Lent out half way through the window, instead of waiting for the reset.
+    assert 0.15 <= started[-1] - started[0] < 0.35
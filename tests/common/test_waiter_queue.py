@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from nextcore.common import WaiterQueue
+from nextcore.http import RequestSession
+
+
+@mark.asyncio
+async def test_same_priority_is_fifo() -> None:
+    queue = WaiterQueue()
+    sessions = [RequestSession() for _ in range(100)]
+    for session in sessions:
+        queue.push(session)
+
+    assert [queue.pop() for _ in range(100)] == sessions
+
+
+@mark.asyncio
+async def test_priority_order() -> None:
+    queue = WaiterQueue()
+    low = RequestSession(priority=1)
+    high = RequestSession(priority=0)
+    queue.push(low)
+    queue.push(high)
+
+    assert queue.pop() is high
+    assert queue.pop() is low
+
+
+@mark.asyncio
+async def test_push_front() -> None:
+    queue = WaiterQueue()
+    first = RequestSession()
+    retried = RequestSession()
+    lower = RequestSession(priority=-1)
+    queue.push(first)
+    queue.push(retried, front=True)
+    queue.push(lower)
+
+    assert queue.pop() is lower, "Pushing to the front skipped a higher priority session"
+    assert queue.pop() is retried
+    assert queue.pop() is first
+
+
+@mark.asyncio
+async def test_ahead_of() -> None:
+    queue = WaiterQueue()
+    for priority in (0, 1, 1, 2):
+        queue.push(RequestSession(priority=priority))
+    removed = RequestSession(priority=0)
+    queue.push(removed)
+    queue.remove(removed)
+
+    assert queue.ahead_of(-1) == 0
+    assert queue.ahead_of(1) == 3, "Sessions with the same priority are ahead"
+    assert queue.ahead_of(5) == 4
+
+
+@mark.asyncio
+async def test_remove() -> None:
+    queue = WaiterQueue()
+    sessions = [RequestSession() for _ in range(5)]
+    for session in sessions:
+        queue.push(session)
+
+    assert queue.remove(sessions[0])
+    assert not queue.remove(sessions[0]), "Session was removed twice"
+    assert len(queue) == 4
+
+    assert [queue.pop() for _ in range(4)] == sessions[1:]
+    with raises(IndexError):
+        queue.pop()
+
+
+@mark.asyncio
+async def test_priority_aging() -> None:
+    queue = WaiterQueue(priority_aging=1)
+    background = RequestSession(priority=5)
+    urgent = RequestSession(priority=0)
+
+    with patch("nextcore.common.waiter_queue.monotonic", return_value=0):
+        queue.push(background)
+    with patch("nextcore.common.waiter_queue.monotonic", return_value=10):
+        queue.push(urgent)
+
+    assert queue.pop() is background, "Old low priority request was not aged"
+
+
+@mark.asyncio
+async def test_push_front_with_priority_aging() -> None:
+    queue = WaiterQueue(priority_aging=1)
+    first = RequestSession()
+    other = RequestSession(priority=1)
+    retried = RequestSession()
+
+    with patch("nextcore.common.waiter_queue.monotonic", return_value=0):
+        queue.push(first)
+        queue.push(other)
+    with patch("nextcore.common.waiter_queue.monotonic", return_value=10):
+        queue.push(retried, front=True)
+
+    assert queue.pop() is retried, "A retry should keep its place in line with aging"
+    assert queue.pop() is first
+    assert queue.pop() is other
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest_asyncio
+from aiohttp import web
+from pytest import MonkeyPatch
+
+from nextcore.http import Route
+
+if TYPE_CHECKING:
+    from typing import AsyncIterator
+
+    from tests.utils import ServeApp
+
+
+@pytest_asyncio.fixture
+async def serve(monkeypatch: MonkeyPatch) -> AsyncIterator[ServeApp]:
+    """Serve a fake Discord API locally and point :attr:`Route.BASE_URL` at it.
+
+    The server is stopped after the test.
+    """
+    runners: list[web.AppRunner] = []
+
+    async def start(app: web.Application) -> None:
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore [union-attr]
+        monkeypatch.setattr(Route, "BASE_URL", f"http://127.0.0.1:{port}")
+
+    yield start
+
+    for runner in runners:
+        await runner.cleanup()
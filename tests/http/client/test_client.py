@@ -0,0 +1,602 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from io import BytesIO
+from tempfile import mkdtemp
+from time import monotonic, time
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from pytest import mark, raises
+
+from nextcore.http import (
+    BotAuthentication,
+    BucketMetadata,
+    BucketMetadataSnapshot,
+    DeadlineExceededError,
+    File,
+    ForbiddenError,
+    HTTPClient,
+    InternalServerError,
+    InvalidRequestBudgetExceededError,
+    InvalidRequestGuard,
+    NegativeCache,
+    NotFoundError,
+    QoSClass,
+    RateLimitStorageServer,
+    RemoteRateLimitStorage,
+    RequestBody,
+    ResourceBackoffRegistry,
+    RetryPolicy,
+    Route,
+    SharedMemoryRateLimitStorage,
+    UnlimitedGlobalRateLimiter,
+)
+
+if TYPE_CHECKING:
+    from tests.utils import ServeApp
+
+
+class FakeDiscord:
+    """A Discord API where every channel shares one rate limit bucket."""
+
+    def __init__(self, limit: int, per: float) -> None:
+        self.limit: int = limit
+        self.per: float = per
+        self.remaining: int = limit
+        self.reset_at: float = 0
+        self.rate_limited: int = 0
+        self.requests: int = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        del request  # Unused
+        now = time()
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.per
+
+        if self.remaining == 0:
+            self.rate_limited += 1
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": self.reset_at - now, "global": False},
+                status=429,
+                headers={"via": "1.1 google", "X-RateLimit-Scope": "user"},
+            )
+
+        self.remaining -= 1
+        self.requests += 1
+        return web.json_response(
+            {},
+            headers={
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Remaining": str(self.remaining),
+                "X-RateLimit-Reset": str(self.reset_at),
+                "X-RateLimit-Reset-After": str(self.reset_at - now),
+                "X-RateLimit-Bucket": "shared",
+            },
+        )
+
+
+@mark.asyncio
+async def test_shared_bucket_many_channels(serve: ServeApp) -> None:
+    discord = FakeDiscord(50, 0.1)
+    app = web.Application()
+    app.router.add_post("/channels/{channel_id}/messages", discord.handle)
+    await serve(app)
+
+    # Use the bucket reset from Discord, local and remote clocks are the same here.
+    http_client = HTTPClient(trust_local_time=False)
+    await http_client.setup()
+    http_client.rate_limit_storages[None].global_rate_limiter = UnlimitedGlobalRateLimiter()
+
+    try:
+        # Learn the bucket hash
+        route = Route("POST", "/channels/{channel_id}/messages", channel_id=0)
+        await http_client._request(route, None)
+
+        await asyncio.gather(
+            *[
+                http_client._request(Route("POST", "/channels/{channel_id}/messages", channel_id=channel_id), None)
+                for channel_id in range(1, 301)
+            ]
+        )
+    finally:
+        await http_client.close()
+
+    assert discord.requests == 301
+    assert discord.rate_limited == 0
+
+
+async def send_to_cold_buckets(http_client: HTTPClient) -> None:
+    # The bucket hash is not known yet, so the buckets are merged while requests are waiting on them.
+    await asyncio.gather(
+        *[
+            http_client._request(Route("POST", "/channels/{channel_id}/messages", channel_id=channel_id), None)
+            for channel_id in range(10)
+            for _ in range(30)
+        ]
+    )
+
+
+@mark.asyncio
+async def test_shared_bucket_merged_while_waiting(serve: ServeApp) -> None:
+    discord = FakeDiscord(50, 0.1)
+    app = web.Application()
+    app.router.add_post("/channels/{channel_id}/messages", discord.handle)
+    await serve(app)
+
+    http_client = HTTPClient(trust_local_time=False)
+    await http_client.setup()
+    http_client.rate_limit_storages[None].global_rate_limiter = UnlimitedGlobalRateLimiter()
+
+    try:
+        await send_to_cold_buckets(http_client)
+    finally:
+        await http_client.close()
+
+    assert discord.requests == 300
+    assert discord.rate_limited == 0
+
+
+@mark.asyncio
+async def test_remote_shared_bucket_merged_while_waiting(serve: ServeApp) -> None:
+    discord = FakeDiscord(50, 0.1)
+    app = web.Application()
+    app.router.add_post("/channels/{channel_id}/messages", discord.handle)
+    await serve(app)
+
+    server = RateLimitStorageServer()
+    await server.start()
+
+    http_client = HTTPClient(trust_local_time=False)
+    await http_client.setup()
+    storage = RemoteRateLimitStorage("127.0.0.1", server.port)
+    storage.global_rate_limiter = UnlimitedGlobalRateLimiter()
+    http_client.rate_limit_storages[None] = storage
+
+    try:
+        await send_to_cold_buckets(http_client)
+    finally:
+        await http_client.close()
+        await server.close()
+
+    assert discord.requests == 300
+    assert discord.rate_limited == 0
+
+
+@mark.asyncio
+async def test_bucket_metadata_snapshot() -> None:
+    path = os.path.join(mkdtemp(), "buckets.json")
+    BucketMetadataSnapshot({"/users/@me": BucketMetadata(2, bucket_hash="abc")}).save(path)
+
+    http_client = HTTPClient(bucket_metadata_path=path)
+    await http_client.setup()
+
+    storage = http_client.rate_limit_storages[None]
+    bucket = await http_client._get_bucket(Route("GET", "/users/@me"), storage)
+    assert bucket.metadata.limit == 2
+    assert await storage.get_bucket_by_discord_id("abc") is bucket
+
+    # Seeded routes are still there
+    bucket = await http_client._get_bucket(Route("POST", "/channels/{channel_id}/typing", channel_id=1), storage)
+    assert bucket.metadata.limit is not None
+
+    http_client.bucket_metadata_snapshot.set("/gateway", BucketMetadata(unlimited=True))
+    await http_client.close()
+
+    snapshot = BucketMetadataSnapshot.load(path)
+    metadata = snapshot.get("/gateway")
+    assert metadata is not None and metadata.unlimited
+
+
+@mark.asyncio
+async def test_bucket_metadata_snapshot_shared_storage() -> None:
+    path = os.path.join(mkdtemp(), "rate-limits")
+    http_client = HTTPClient(seed_bucket_metadata=False)
+    http_client.bucket_metadata_snapshot.set("/users/@me", BucketMetadata(2))
+    http_client.bucket_metadata_snapshot.set("/gateway", BucketMetadata(3))
+    await http_client.setup()
+
+    storage = SharedMemoryRateLimitStorage(path, bucket_slots=64)
+    await storage.store_metadata("/gateway", BucketMetadata(5))  # Learned by another process
+    try:
+        bucket = await http_client._get_bucket(Route("GET", "/users/@me"), storage)
+        assert bucket.metadata.limit == 2, "Storages that create buckets on lookup should be warm-started too"
+
+        bucket = await http_client._get_bucket(Route("GET", "/gateway"), storage)
+        assert bucket.metadata.limit == 5, "The snapshot should not overwrite metadata that is already stored"
+    finally:
+        await storage.close()
+        await http_client.close()
+
+
+@mark.asyncio
+async def test_invalid_request_guard(serve: ServeApp) -> None:
+    requests = 0
+
+    async def handle(request: web.Request) -> web.Response:
+        del request  # Unused
+        nonlocal requests
+        requests += 1
+        return web.json_response({"code": 50013, "message": "Missing Permissions"}, status=403)
+
+    app = web.Application()
+    app.router.add_post("/channels/{channel_id}/messages", handle)
+    await serve(app)
+
+    guard = InvalidRequestGuard(4, soft_threshold=0.5, hard_threshold=0.5)
+    http_client = HTTPClient(invalid_request_guard=guard)
+    await http_client.setup()
+
+    try:
+        for _ in range(2):
+            with raises(ForbiddenError):
+                await http_client._request(Route("POST", "/channels/{channel_id}/messages", channel_id=1), None)
+        with raises(InvalidRequestBudgetExceededError):
+            await http_client._request(Route("POST", "/channels/{channel_id}/messages", channel_id=1), None)
+    finally:
+        await http_client.close()
+
+    assert requests == 2
+    assert guard.count == 2
+
+
+@mark.asyncio
+async def test_negative_cache(serve: ServeApp) -> None:
+    requests = 0
+
+    async def handle(request: web.Request) -> web.Response:
+        del request  # Unused
+        nonlocal requests
+        requests += 1
+        return web.json_response({"code": 10003, "message": "Unknown Channel"}, status=404)
+
+    app = web.Application()
+    app.router.add_get("/channels/{channel_id}", handle)
+    await serve(app)
+
+    http_client = HTTPClient(negative_cache=NegativeCache())
+    await http_client.setup()
+
+    try:
+        for _ in range(3):
+            with raises(NotFoundError):
+                await http_client._request(Route("GET", "/channels/{channel_id}", channel_id=1), None)
+    finally:
+        await http_client.close()
+
+    assert requests == 1
+
+
+@mark.asyncio
+@mark.parametrize("scope", ["user", "shared", "global"])
+async def test_retries_after_rate_limit(serve: ServeApp, scope: str) -> None:
+    request_times: list[float] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        del request  # Unused
+        request_times.append(time())
+        if len(request_times) == 1:
+            # The reset from the headers is earlier than retry_after, retry_after has to win.
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": 0.2, "global": scope == "global"},
+                status=429,
+                headers={
+                    "via": "1.1 google",
+                    "X-RateLimit-Scope": scope,
+                    "X-RateLimit-Limit": "5",
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(time() + 0.01),
+                    "X-RateLimit-Reset-After": "0.01",
+                    "X-RateLimit-Bucket": "abc",
+                },
+            )
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/users/@me", handle)
+    await serve(app)
+
+    http_client = HTTPClient()
+    await http_client.setup()
+
+    try:
+        await http_client._request(Route("GET", "/users/@me"), None)
+    finally:
+        await http_client.close()
+
+    assert len(request_times) == 2
+    assert request_times[1] - request_times[0] >= 0.2
+    assert http_client.rate_limit_retries == {scope: 1}
+
+
+@mark.asyncio
+async def test_shared_rate_limit_blocks_resource(serve: ServeApp) -> None:
+    request_times: list[float] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        del request  # Unused
+        request_times.append(time())
+        if len(request_times) <= 2:
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": 0.01, "global": False},
+                status=429,
+                headers={"via": "1.1 google", "X-RateLimit-Scope": "shared"},
+            )
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_put("/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me", handle)
+    await serve(app)
+
+    http_client = HTTPClient()
+    http_client.resource_backoffs = ResourceBackoffRegistry(base_delay=0.1)
+    await http_client.setup()
+
+    route = Route(
+        "PUT",
+        "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me",
+        channel_id=1,
+        message_id=2,
+        emoji="x",
+    )
+    try:
+        await http_client._request(route, None)
+    finally:
+        await http_client.close()
+
+    assert len(request_times) == 3
+    # The second shared 429 doubles the backoff
+    assert request_times[1] - request_times[0] >= 0.1
+    assert request_times[2] - request_times[1] >= 0.2
+    assert http_client.rate_limit_retries == {"shared": 2}
+
+
+@mark.asyncio
+async def test_retry_resends_multipart_body(serve: ServeApp) -> None:
+    received: list[tuple[str, bytes]] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        form = await request.post()
+        file = form["file[0]"]
+        assert isinstance(file, web.FileField)
+        received.append((str(form["payload_json"]), file.file.read()))
+        if len(received) == 1:
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": 0.01, "global": False},
+                status=429,
+                headers={"via": "1.1 google", "X-RateLimit-Scope": "user"},
+            )
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_post("/channels/{channel_id}/messages", handle)
+    await serve(app)
+
+    http_client = HTTPClient()
+    await http_client.setup()
+
+    body = RequestBody.multipart({"content": "hi"}, [("file[0]", File("a.txt", BytesIO(b"contents")))])
+    try:
+        await http_client._request(Route("POST", "/channels/{channel_id}/messages", channel_id=1), None, data=body)
+    finally:
+        await http_client.close()
+
+    assert len(received) == 2
+    assert received[0] == received[1]
+    assert received[1][1] == b"contents"
+
+
+async def _start_flaky_server(serve: ServeApp, failures: int) -> list[dict[str, object]]:
+    received: list[dict[str, object]] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        if request.content_type == "multipart/form-data":
+            payload_json = (await request.post())["payload_json"]
+            assert isinstance(payload_json, (bytes, bytearray))  # Not decoded as it is sent as application/json
+            received.append(json.loads(payload_json))
+        else:
+            received.append({})
+        if len(received) <= failures:
+            return web.json_response({"code": 0, "message": "Service Unavailable"}, status=503)
+        return web.json_response({"id": "1"})
+
+    app = web.Application()
+    app.router.add_route("*", "/channels/{channel_id}/messages", handle)
+    await serve(app)
+    return received
+
+
+@mark.asyncio
+async def test_retries_server_errors(serve: ServeApp) -> None:
+    received = await _start_flaky_server(serve, 2)
+    http_client = HTTPClient(retry_policy=RetryPolicy(base_delay=0.01))
+    await http_client.setup()
+
+    try:
+        await http_client._request(Route("GET", "/channels/{channel_id}/messages", channel_id=1), None)
+    finally:
+        await http_client.close()
+
+    assert len(received) == 3
+    assert http_client.request_retries == {"503": 2}
+
+
+@mark.asyncio
+async def test_does_not_retry_non_idempotent(serve: ServeApp) -> None:
+    received = await _start_flaky_server(serve, 1)
+    http_client = HTTPClient(retry_policy=RetryPolicy(base_delay=0.01))
+    await http_client.setup()
+
+    try:
+        with raises(InternalServerError):
+            await http_client._request(Route("POST", "/channels/{channel_id}/messages", channel_id=1), None)
+    finally:
+        await http_client.close()
+
+    assert len(received) == 1
+
+
+@mark.asyncio
+async def test_retries_create_message_with_enforced_nonce(serve: ServeApp) -> None:
+    received = await _start_flaky_server(serve, 1)
+    http_client = HTTPClient(retry_policy=RetryPolicy(base_delay=0.01))
+    await http_client.setup()
+
+    try:
+        await http_client.create_message(BotAuthentication("token"), 1, content="hi", nonce="abc", enforce_nonce=True)
+    finally:
+        await http_client.close()
+
+    assert len(received) == 2
+    assert received[1] == {"content": "hi", "nonce": "abc", "enforce_nonce": True}
+
+
+@mark.asyncio
+async def test_deadline(serve: ServeApp) -> None:
+    async def slow_handle(request: web.Request) -> web.Response:
+        del request  # Unused
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    async def handle(request: web.Request) -> web.Response:
+        return web.json_response(
+            {},
+            headers={
+                "X-RateLimit-Limit": "1",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(time() + 10),
+                "X-RateLimit-Reset-After": "10",
+                "X-RateLimit-Bucket": request.match_info["channel_id"],
+            },
+        )
+
+    app = web.Application()
+    app.router.add_get("/channels/{channel_id}", handle)
+    app.router.add_get("/guilds/{guild_id}", slow_handle)
+    await serve(app)
+
+    http_client = HTTPClient()
+    await http_client.setup()
+    try:
+        route = Route("GET", "/channels/{channel_id}", channel_id=1)
+        await http_client._request(route, None)
+        assert 9 < await http_client.estimate_wait(route, None) <= 10
+
+        # The bucket is used up for 10 seconds, so this is rejected right away.
+        with raises(DeadlineExceededError) as error:
+            await http_client._request(route, None, deadline=monotonic() + 2.5)
+        assert error.value.estimated_wait is not None
+
+        # The wrappers pass it on
+        with raises(DeadlineExceededError):
+            await http_client.get_channel(BotAuthentication("token"), 1, deadline=monotonic() - 1)
+
+        # The response takes too long
+        with raises(DeadlineExceededError) as error:
+            await http_client._request(Route("GET", "/guilds/{guild_id}", guild_id=1), None, deadline=monotonic() + 0.1)
+        assert error.value.estimated_wait is None
+    finally:
+        await http_client.close()
+
+
+@mark.asyncio
+async def test_qos_class(serve: ServeApp) -> None:
+    async def handle(request: web.Request) -> web.Response:
+        del request  # Unused
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/channels/{channel_id}", handle)
+    await serve(app)
+
+    critical = QoSClass("critical", priority=-1, reserved=0.2)
+    http_client = HTTPClient(qos_classes=[critical])
+    await http_client.setup()
+    try:
+        await http_client.get_channel(BotAuthentication("token"), 1, qos=critical)
+
+        assert critical.requests == 1
+        assert critical.max_latency > 0
+        assert http_client._held_back(0) == 0.2, "The class should hold back its share after a request"
+    finally:
+        await http_client.close()
+
+
+@mark.asyncio
+async def test_single_flight(serve: ServeApp) -> None:
+    hits: list[str] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        hits.append(request.method)
+        await asyncio.sleep(0.05)
+        return web.json_response({"id": request.match_info["channel_id"]})
+
+    app = web.Application()
+    app.router.add_get("/channels/{channel_id}", handle)
+    app.router.add_patch("/channels/{channel_id}", handle)
+    await serve(app)
+
+    http_client = HTTPClient(single_flight=True)
+    await http_client.setup()
+    authentication = BotAuthentication("token")
+    try:
+        channels = await asyncio.gather(*(http_client.get_channel(authentication, 1) for _ in range(5)))
+        assert channels == [{"id": "1"}] * 5
+        assert hits == ["GET"], "Identical requests in flight should share one request"
+        assert not http_client._in_flight
+
+        await http_client.get_channel(authentication, 1)
+        assert len(hits) == 2, "Responses should not be cached after the request finished"
+
+        hits.clear()
+        await asyncio.gather(
+            http_client.get_channel(authentication, 1),
+            http_client.get_channel(BotAuthentication("other"), 1),
+            http_client.get_channel(authentication, 2),
+        )
+        assert len(hits) == 3, "Requests with another path or token should not be shared"
+
+        hits.clear()
+        route = Route("PATCH", "/channels/{channel_id}", channel_id=1)
+        await asyncio.gather(*(http_client._request(route, None, json={"name": "a"}) for _ in range(2)))
+        assert hits == ["PATCH", "PATCH"], "Mutating requests should never be shared"
+    finally:
+        await http_client.close()
+
+
+@mark.asyncio
+async def test_single_flight_deadline_per_caller(serve: ServeApp) -> None:
+    hits: list[str] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        hits.append(request.method)
+        await asyncio.sleep(0.1)
+        return web.json_response({"id": request.match_info["channel_id"]})
+
+    app = web.Application()
+    app.router.add_get("/channels/{channel_id}", handle)
+    await serve(app)
+
+    http_client = HTTPClient(single_flight=True)
+    await http_client.setup()
+    route = Route("GET", "/channels/{channel_id}", channel_id=1)
+    try:
+        leader, joiner = await asyncio.gather(
+            http_client._request(route, None, deadline=monotonic() + 0.02),
+            http_client._request(route, None),
+            return_exceptions=True,
+        )
+
+        assert isinstance(leader, DeadlineExceededError)
+        assert not isinstance(joiner, BaseException), "The leader's deadline should not fail the joiner"
+        assert await joiner.json() == {"id": "1"}
+        assert hits == ["GET"]
+
+        hits.clear()
+        await asyncio.gather(http_client._request(route, None), http_client._request(route, None, wait=False))
+        assert len(hits) == 2, "Requests that wait differently should not be shared"
+    finally:
+        await http_client.close()
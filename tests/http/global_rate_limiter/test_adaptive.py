@@ -0,0 +1,59 @@
+from asyncio import sleep
+
+from pytest import mark, raises
+
+from nextcore.common.errors import RateLimitedError
+from nextcore.http.global_rate_limiter import AdaptiveGlobalRateLimiter
+from tests.utils import match_time
+
+
+@mark.asyncio
+async def test_decreases_on_global_rate_limit() -> None:
+    rate_limiter = AdaptiveGlobalRateLimiter(50, min_limit=20)
+
+    rate_limiter.update(0.01)
+    assert rate_limiter.estimated_limit == 25
+
+    # In flight requests that also got a 429 should not lower it further
+    rate_limiter.update(0.01)
+    assert rate_limiter.estimated_limit == 25
+    assert rate_limiter.rate_limited == 2
+
+    await sleep(0.02)
+    rate_limiter.update(0.01)
+    assert rate_limiter.estimated_limit == 20, "Lowered below min_limit"
+
+
+@mark.asyncio
+@match_time(0.1, 0.05)
+async def test_pauses_on_global_rate_limit() -> None:
+    rate_limiter = AdaptiveGlobalRateLimiter(50)
+
+    rate_limiter.update(0.1)
+    with raises(RateLimitedError):
+        async with rate_limiter.acquire(wait=False):
+            ...
+
+    async with rate_limiter.acquire():
+        ...
+
+
+@mark.asyncio
+async def test_increases_when_saturated() -> None:
+    rate_limiter = AdaptiveGlobalRateLimiter(2, max_limit=3, increase_after=0)
+
+    rate_limiter.remaining = 0
+    rate_limiter._reset()
+    assert rate_limiter.estimated_limit == 3
+
+    rate_limiter.remaining = 0
+    rate_limiter._reset()
+    assert rate_limiter.estimated_limit == 3, "Raised above max_limit"
+
+
+@mark.asyncio
+async def test_does_not_increase_when_idle() -> None:
+    rate_limiter = AdaptiveGlobalRateLimiter(2, increase_after=0)
+
+    rate_limiter._reset()
+    assert rate_limiter.estimated_limit == 2, "Raised without using every spot"
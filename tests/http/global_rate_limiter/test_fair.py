@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from asyncio import create_task, gather, sleep
+from typing import TYPE_CHECKING
+
+from pytest import mark, raises
+
+from nextcore.common.errors import RateLimitedError
+from nextcore.http.global_rate_limiter import FairGlobalRateLimiter
+from tests.utils import match_time
+
+if TYPE_CHECKING:
+    from typing import Hashable
+
+
+async def _use_up(rate_limiter: FairGlobalRateLimiter, limit: int) -> None:
+    for _ in range(limit):
+        async with rate_limiter.acquire():
+            ...
+
+
+@mark.asyncio
+@match_time(0, 0.1)
+async def test_with_limit() -> None:
+    rate_limiter = FairGlobalRateLimiter(limit=2)
+
+    await _use_up(rate_limiter, 2)
+    assert rate_limiter.queue_depths() == {}
+
+
+@mark.asyncio
+async def test_round_robin() -> None:
+    rate_limiter = FairGlobalRateLimiter(limit=10)
+    order: list[Hashable] = []
+
+    async def use_rate_limiter(tenant: Hashable) -> None:
+        async with rate_limiter.acquire(tenant=tenant):
+            order.append(tenant)
+
+    await _use_up(rate_limiter, 10)
+    tasks = [create_task(use_rate_limiter(tenant)) for tenant in ("z", "a", "a", "a", "b", "c")]
+    await sleep(0)
+
+    # The first request was let through and is waiting for the reset
+    assert rate_limiter.queue_depths() == {"a": 3, "b": 1, "c": 1}
+    assert rate_limiter.queue_depth("b") == 1
+    assert rate_limiter.queue_depth("d") == 0
+
+    await gather(*tasks)
+    assert order == ["z", "a", "b", "c", "a", "a"]
+    assert rate_limiter.queue_depths() == {}
+
+
+@mark.asyncio
+async def test_weights() -> None:
+    rate_limiter = FairGlobalRateLimiter(limit=10, weights={"a": 2})
+    order: list[Hashable] = []
+
+    async def use_rate_limiter(tenant: Hashable) -> None:
+        async with rate_limiter.acquire(tenant=tenant):
+            order.append(tenant)
+
+    await _use_up(rate_limiter, 10)
+    tasks = [create_task(use_rate_limiter(tenant)) for tenant in ("z", "a", "a", "a", "b", "b")]
+    await gather(*tasks)
+
+    assert order == ["z", "a", "a", "b", "a", "b"]
+
+
+def test_invalid_weight() -> None:
+    with raises(ValueError):
+        FairGlobalRateLimiter(weights={"a": 0})
+
+
+@mark.asyncio
+async def test_no_wait() -> None:
+    rate_limiter = FairGlobalRateLimiter(limit=1)
+
+    await _use_up(rate_limiter, 1)
+    with raises(RateLimitedError):
+        async with rate_limiter.acquire(wait=False):
+            ...
+
+
+@mark.asyncio
+async def test_cancelled_waiter() -> None:
+    rate_limiter = FairGlobalRateLimiter(limit=1)
+
+    async def use_rate_limiter(tenant: Hashable) -> None:
+        async with rate_limiter.acquire(tenant=tenant):
+            ...
+
+    await _use_up(rate_limiter, 1)
+    first = create_task(use_rate_limiter("a"))
+    second = create_task(use_rate_limiter("b"))
+    await sleep(0)
+    assert rate_limiter.queue_depths() == {"b": 1}
+
+    second.cancel()
+    await sleep(0)
+    assert rate_limiter.queue_depths() == {}
+
+    first.cancel()
+    await gather(first, second, return_exceptions=True)
@@ -40,9 +40,9 @@ async def test_exceeds_limit_concurrent() -> None:
     for i in range(9):
         logger.debug("Created task %s", i)
         create_task(use_rate_limiter())
-    await sleep(1)  # No clue why .1 is needed here...
-    pending_requests = rate_limiter._pending.qsize()
+    await sleep(1.05)  # Resets are batched into timer wheel ticks, so they can run slightly after 1 second
+    pending_requests = len(rate_limiter._pending)
     assert pending_requests == 1, f"Expected 1 pending request, got {pending_requests}"
 
     # Cancel the remaining task for a clean output
-    rate_limiter._pending.get_nowait().future.set_result(None)
+    rate_limiter._pending.pop().future.set_result(None)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from time import time
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from pytest import mark, raises
+
+from nextcore.http import BatchExecutor, BatchRequest, HTTPClient, NotFoundError, Route
+
+if TYPE_CHECKING:
+    from typing import AsyncIterator, Iterator
+
+    from tests.utils import ServeApp
+
+
+async def _start_server(serve: ServeApp, concurrency: list[int]) -> None:
+    # Guilds are used up for 0.5 seconds, every channel has its own bucket with spots free.
+    in_flight = [0]
+
+    async def handle(request: web.Request) -> web.Response:
+        limited = "guild_id" in request.match_info
+        channel_id = request.match_info.get("channel_id") or request.match_info["guild_id"]
+        if channel_id == "404":
+            return web.json_response({"message": "Unknown Channel", "code": 10003}, status=404)
+
+        in_flight[0] += 1
+        concurrency.append(in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return web.json_response(
+            {"id": channel_id},
+            headers={
+                "X-RateLimit-Limit": "1" if limited else "100",
+                "X-RateLimit-Remaining": "0" if limited else "99",
+                "X-RateLimit-Reset": str(time() + 0.5),
+                "X-RateLimit-Reset-After": "0.5",
+                "X-RateLimit-Bucket": channel_id,
+            },
+        )
+
+    app = web.Application()
+    app.router.add_delete("/channels/{channel_id}", handle)
+    app.router.add_delete("/guilds/{guild_id}", handle)
+    await serve(app)
+
+
+def _delete_channel(channel_id: int) -> BatchRequest:
+    return BatchRequest(Route("DELETE", "/channels/{channel_id}", channel_id=channel_id), None)
+
+
+def _delete_guild(guild_id: int) -> BatchRequest:
+    return BatchRequest(Route("DELETE", "/guilds/{guild_id}", guild_id=guild_id), None)
+
+
+@mark.asyncio
+async def test_rate_limited_bucket_does_not_block_others(serve: ServeApp) -> None:
+    await _start_server(serve, [])
+    http_client = HTTPClient()
+    await http_client.setup()
+    try:
+        # Use up guild 1
+        async for _ in http_client.batch([_delete_guild(1)]):
+            ...
+
+        requests = [_delete_guild(1), *(_delete_channel(channel_id) for channel_id in range(2, 12))]
+        finished: list[str] = []
+        async for result in http_client.batch(requests, max_in_flight=1):
+            assert result.error is None
+            assert result.response is not None
+            finished.append((await result.response.json())["id"])
+
+        assert len(finished) == len(requests)
+        assert finished[-1] == "1", "Requests for a rate limited bucket should not hold up the others"
+    finally:
+        await http_client.close()
+
+
+@mark.asyncio
+async def test_max_in_flight_and_lazy_reading(serve: ServeApp) -> None:
+    concurrency: list[int] = []
+    await _start_server(serve, concurrency)
+    http_client = HTTPClient()
+    await http_client.setup()
+    read = 0
+
+    async def requests() -> AsyncIterator[BatchRequest]:
+        nonlocal read
+        for channel_id in range(2, 102):
+            read += 1
+            yield _delete_channel(channel_id)
+
+    try:
+        results = http_client.batch(requests(), max_in_flight=5, lookahead=10).__aiter__()
+        await results.__anext__()
+        assert read <= 10 + 1, "Requests should only be read as far as needed"
+
+        count = 1
+        async for _ in results:
+            count += 1
+        assert count == 100
+        assert max(concurrency) <= 5
+    finally:
+        await http_client.close()
+
+
+@mark.asyncio
+async def test_errors_are_returned(serve: ServeApp) -> None:
+    await _start_server(serve, [])
+    http_client = HTTPClient()
+    await http_client.setup()
+
+    def requests() -> Iterator[BatchRequest]:
+        yield _delete_channel(404)
+        yield _delete_channel(2)
+
+    try:
+        results = [result async for result in http_client.batch(requests())]
+
+        errors = [result.error for result in results if result.error is not None]
+        assert len(errors) == 1
+        assert isinstance(errors[0], NotFoundError)
+        assert sum(result.response is not None for result in results) == 1
+    finally:
+        await http_client.close()
+
+
+def test_invalid_max_in_flight() -> None:
+    with raises(ValueError):
+        BatchExecutor(HTTPClient(), [], max_in_flight=0)
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import asyncio
+from time import monotonic
 
 from pytest import mark
 
@@ -101,3 +104,254 @@ async def test_dirty_remaining_used() -> None:
         await bucket.update(0, 1)
 
     assert bucket.dirty, "Bucket was not dirty on a bucket that was used"
+
+
+@mark.asyncio
+@match_time(0.2, 0.05)
+async def test_migrate_pending() -> None:
+    linked = Bucket(BucketMetadata(limit=1))
+    await linked.update(0, 0.1)
+
+    bucket = Bucket(BucketMetadata(limit=1))
+    await bucket.update(0, 1)
+
+    order: list[int] = []
+
+    async def use(priority: int) -> None:
+        async with bucket.acquire(priority=priority):
+            order.append(priority)
+            await bucket.update(0, 0.1)
+
+    tasks = [asyncio.create_task(use(priority)) for priority in (2, 1)]
+    await asyncio.sleep(0)  # Let them queue up
+
+    bucket.migrate_to(linked)
+
+    # They run on the linked bucket's resets (0.1s, 0.2s) instead of the old one (1s).
+    await asyncio.gather(*tasks)
+    assert order == [1, 2]
+    assert not bucket.dirty
+
+
+@mark.asyncio
+@match_time(0.2, 0.05)
+async def test_migrate_reconciles_remaining() -> None:
+    linked = Bucket(BucketMetadata(limit=1))
+    await linked.update(1, 0.2)
+
+    bucket = Bucket(BucketMetadata(limit=1))
+    await bucket.update(0, 0.1)
+
+    bucket.migrate_to(linked)
+
+    # The lowest remaining is used, and the linked bucket keeps its own reset.
+    async with bucket.acquire():
+        ...
+
+
+async def count_blind_requests(bucket: Bucket, in_flight: list[int], max_in_flight: list[int]) -> None:
+    async with bucket.acquire():
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+
+
+@mark.asyncio
+@mark.parametrize(
+    ("metadata", "max_blind_requests", "expected"),
+    [
+        (BucketMetadata(), 1, 1),
+        (BucketMetadata(), 3, 3),
+    ],
+)
+async def test_blind_request_concurrency(metadata: BucketMetadata, max_blind_requests: int, expected: int) -> None:
+    bucket = Bucket(metadata, max_blind_requests=max_blind_requests)
+    in_flight = [0]
+    max_in_flight = [0]
+
+    await asyncio.gather(*[count_blind_requests(bucket, in_flight, max_in_flight) for _ in range(5)])
+
+    assert max_in_flight[0] == expected
+
+
+@mark.asyncio
+async def test_new_bucket_uses_smallest_limit() -> None:
+    bucket = Bucket(BucketMetadata(limit=10, min_limit=2))
+    started = [0]
+    respond = asyncio.Event()
+
+    async def send() -> None:
+        async with bucket.acquire():
+            started[0] += 1
+            await respond.wait()
+            await bucket.update(8, 0.05)
+
+    tasks = [asyncio.create_task(send()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    assert started[0] == 2, "The first window of a new bucket should use the smallest limit seen"
+
+    respond.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert started[0] == 5, "Later windows should use the limit"
+
+
+@mark.asyncio
+async def test_waiters_are_allocated_lazily() -> None:
+    metadata = BucketMetadata(limit=1)
+    bucket = Bucket(metadata)
+
+    assert not hasattr(bucket, "__dict__"), "Bucket should use __slots__"
+
+    async with bucket.acquire():
+        await bucket.update(0, 0.01)
+    assert bucket._pending is None, "Queue was created without contention"
+
+    await asyncio.gather(use_bucket(bucket), use_bucket(bucket))
+    assert bucket._pending is not None, "Queue was not created on contention"
+
+
+@mark.asyncio
+async def test_same_priority_keeps_order() -> None:
+    metadata = BucketMetadata(limit=1)
+    bucket = Bucket(metadata)
+    order: list[int] = []
+
+    async def send(index: int) -> None:
+        async with bucket.acquire():
+            order.append(index)
+            await bucket.update(0, 0.01)
+
+    await asyncio.gather(*[send(index) for index in range(20)])
+
+    assert order == list(range(20)), "Requests with the same priority were reordered"
+
+
+@mark.asyncio
+@match_time(0.1, 0.05)
+async def test_cancelled_waiter_does_not_use_a_spot() -> None:
+    metadata = BucketMetadata(limit=1)
+    bucket = Bucket(metadata)
+
+    async with bucket.acquire():
+        await bucket.update(0, 0.1)
+
+    cancelled = asyncio.create_task(use_bucket(bucket))
+    waiting = asyncio.create_task(use_bucket(bucket))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    # The waiting request should get the spot freed by the reset.
+    await waiting
+    assert bucket._pending is not None and len(bucket._pending) == 0
+
+
+@mark.asyncio
+async def test_cancelled_after_release_passes_on_spot() -> None:
+    metadata = BucketMetadata(limit=1)
+    bucket = Bucket(metadata)
+
+    async with bucket.acquire():
+        await bucket.update(0, 10)
+
+    first = asyncio.create_task(use_bucket(bucket))
+    second = asyncio.create_task(use_bucket(bucket))
+    await asyncio.sleep(0)
+
+    # Reset now, and cancel the first request after it is let through but before it gets to run.
+    assert bucket._reset_handle is not None
+    bucket._reset_handle.cancel()
+    bucket._reset_callback()
+    first.cancel()
+
+    await asyncio.wait_for(second, 1)
+
+
+@mark.asyncio
+@match_time(0.2, 0.05)
+async def test_backoff_extends_reset() -> None:
+    metadata = BucketMetadata(limit=1)
+    bucket = Bucket(metadata)
+
+    async with bucket.acquire():
+        await bucket.update(0, 0.05)
+        bucket.backoff(0.2)
+
+    async with bucket.acquire():
+        ...
+
+
+@mark.asyncio
+async def test_retry_keeps_place_in_line() -> None:
+    metadata = BucketMetadata(limit=1)
+    bucket = Bucket(metadata)
+    order: list[str] = []
+
+    async with bucket.acquire():
+        await bucket.update(0, 0.01)
+
+    async def send(name: str, retry: bool) -> None:
+        async with bucket.acquire(retry=retry):
+            order.append(name)
+            await bucket.update(0, 0.01)
+
+    waiting = asyncio.create_task(send("waiting", False))
+    await asyncio.sleep(0)
+    await asyncio.gather(waiting, send("retry", True))
+
+    assert order == ["retry", "waiting"]
+
+
+@mark.asyncio
+async def test_estimate_wait() -> None:
+    bucket = Bucket(BucketMetadata())
+    assert bucket.estimate_wait() == 0, "Unknown limits should not be estimated"
+
+    bucket = Bucket(BucketMetadata(limit=1))
+    assert bucket.estimate_wait() == 0
+
+    async with bucket.acquire():
+        await bucket.update(0, 1)
+    assert 0.9 < bucket.estimate_wait() <= 1
+
+
+@mark.asyncio
+async def test_held_back_spots_stay_free() -> None:
+    bucket = Bucket(BucketMetadata(limit=4))
+    started: list[str] = []
+
+    async def send(name: str, priority: int, held_back: float) -> None:
+        async with bucket.acquire(priority=priority, held_back=held_back):
+            started.append(name)
+            await bucket.update(4 - len(started), 0.1)
+
+    await send("bulk", 1, 0.5)
+    await send("bulk", 1, 0.5)
+    bulk = asyncio.create_task(send("bulk", 1, 0.5))
+    await asyncio.sleep(0)
+    assert started == ["bulk", "bulk"], "The rest of the limit should be held back"
+
+    await asyncio.wait_for(send("critical", 0, 0), 0.05)
+    assert started == ["bulk", "bulk", "critical"], "Held back spots should be usable by more important requests"
+
+    # The reset lets the waiting request through, as a full window has more spots than are held back.
+    await asyncio.wait_for(bulk, 0.5)
+
+
+@mark.asyncio
+async def test_unused_held_back_spots_are_lent_out() -> None:
+    bucket = Bucket(BucketMetadata(limit=4), lend_held_after=0.5)
+    started: list[float] = []
+
+    async def send() -> None:
+        async with bucket.acquire(priority=1, held_back=0.5):
+            started.append(monotonic())
+            await bucket.update(4 - len(started), 0.4)
+
+    await send()
+    await send()
+    window_started_at = started[0]
+    await asyncio.wait_for(send(), 1)
+
+    # Lent out half way through the window, instead of waiting for the reset.
+    assert 0.15 <= started[-1] - window_started_at < 0.35
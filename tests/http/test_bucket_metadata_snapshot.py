@@ -0,0 +1,56 @@
+import os
+from tempfile import mkdtemp
+
+from pytest import raises
+
+from nextcore.http.bucket_metadata import BucketMetadata
+from nextcore.http.bucket_metadata_snapshot import BucketMetadataSnapshot
+
+
+def test_round_trip() -> None:
+    snapshot = BucketMetadataSnapshot(
+        {
+            "/channels/{channel_id}/messages": BucketMetadata(5, bucket_hash="abc"),
+            "/gateway": BucketMetadata(unlimited=True),
+        }
+    )
+    loaded = BucketMetadataSnapshot.loads(snapshot.dumps())
+
+    metadata = loaded.get("/channels/{channel_id}/messages")
+    assert metadata is not None
+    assert metadata.limit == 5
+    assert metadata.bucket_hash == "abc"
+
+    metadata = loaded.get("/gateway")
+    assert metadata is not None
+    assert metadata.unlimited
+
+    assert loaded.get("/users/@me") is None
+
+
+def test_save_load() -> None:
+    path = os.path.join(mkdtemp(), "buckets.json")
+    BucketMetadataSnapshot.default().save(path)
+
+    loaded = BucketMetadataSnapshot.load(path)
+    assert loaded.metadata.keys() == BucketMetadataSnapshot.default().metadata.keys()
+
+
+def test_get_copies() -> None:
+    snapshot = BucketMetadataSnapshot.default()
+    metadata = snapshot.get("/channels/{channel_id}/messages")
+    assert metadata is not None
+    metadata.limit = 1000
+
+    metadata = snapshot.get("/channels/{channel_id}/messages")
+    assert metadata is not None
+    assert metadata.limit != 1000
+
+
+def test_invalid() -> None:
+    with raises(ValueError):
+        BucketMetadataSnapshot.loads("not json")
+    with raises(ValueError):
+        BucketMetadataSnapshot.loads('{"version":0,"routes":{}}')
+    with raises(ValueError):
+        BucketMetadataSnapshot.loads('{"version":1,"routes":{"/gateway":["5",false,null]}}')
@@ -0,0 +1,59 @@
+from pytest import mark, raises
+
+from nextcore.http import InvalidRequestGuard
+from nextcore.http.errors import InvalidRequestBudgetExceededError
+from tests.utils import match_time
+
+
+@mark.asyncio
+async def test_allows_below_soft_threshold() -> None:
+    guard = InvalidRequestGuard(10, soft_threshold=0.5, hard_threshold=0.9)
+
+    guard.record(4)
+    assert guard.count == 4
+    assert guard.remaining == 6
+    await guard.check(priority=10)
+
+
+@mark.asyncio
+async def test_sheds_low_priority_first() -> None:
+    guard = InvalidRequestGuard(10, soft_threshold=0.5, hard_threshold=0.9, max_delay=0)
+
+    guard.record(6)
+    with raises(InvalidRequestBudgetExceededError):
+        await guard.check(priority=1)
+    await guard.check(priority=0)
+    assert guard.rejected == 1
+
+
+@mark.asyncio
+async def test_rejects_everything_at_hard_threshold() -> None:
+    guard = InvalidRequestGuard(10, soft_threshold=0.5, hard_threshold=0.9)
+
+    guard.record(9)
+    with raises(InvalidRequestBudgetExceededError):
+        await guard.check(priority=-10)
+
+
+@mark.asyncio
+@match_time(0.5, 0.05)
+async def test_throttles_progressively() -> None:
+    guard = InvalidRequestGuard(10, soft_threshold=0.5, hard_threshold=0.9, max_delay=2)
+
+    guard.record(6)  # A quarter of the way from the soft to the hard threshold
+    await guard.check()
+
+
+@mark.asyncio
+async def test_window_expires() -> None:
+    guard = InvalidRequestGuard(10, per=5)
+
+    guard.record(10)
+    guard._window[0][0] -= 10  # Pretend it was recorded 10 seconds ago
+    assert guard.count == 0
+    await guard.check(priority=10)
+
+
+def test_invalid_thresholds() -> None:
+    with raises(ValueError):
+        InvalidRequestGuard(soft_threshold=0.9, hard_threshold=0.5)
@@ -0,0 +1,78 @@
+from pytest import mark, raises
+
+from nextcore.http import NegativeCache, Route
+from nextcore.http.errors import ForbiddenError, NotFoundError
+
+
+def _not_found() -> NotFoundError:
+    return NotFoundError({"code": 10003, "message": "Unknown Channel"}, None, status=404)
+
+
+def test_fails_fast() -> None:
+    cache = NegativeCache()
+    route = Route("GET", "/channels/{channel_id}", channel_id=123)
+
+    cache.check(route, None)
+    cache.add(route, None, _not_found())
+
+    with raises(NotFoundError) as error:
+        cache.check(Route("GET", "/channels/{channel_id}", channel_id=123), None)
+    assert error.value.error_code == 10003
+    assert error.value.status == 404
+    assert cache.hits == 1
+
+    # Other auth keys, methods and paths are not affected
+    cache.check(route, "other token")
+    cache.check(Route("DELETE", "/channels/{channel_id}", channel_id=123), None)
+    cache.check(Route("GET", "/channels/{channel_id}", channel_id=456), None)
+
+
+def test_expires() -> None:
+    cache = NegativeCache(ttl=0)
+    route = Route("GET", "/channels/{channel_id}", channel_id=123)
+
+    cache.add(route, None, _not_found())
+    cache.check(route, None)
+    assert len(cache) == 0
+
+
+def test_max_entries() -> None:
+    cache = NegativeCache(max_entries=2)
+    for channel_id in range(3):
+        cache.add(Route("GET", "/channels/{channel_id}", channel_id=channel_id), None, _not_found())
+
+    assert len(cache) == 2
+    cache.check(Route("GET", "/channels/{channel_id}", channel_id=0), None)
+
+
+def test_invalidate() -> None:
+    cache = NegativeCache()
+    role_route = Route("PATCH", "/guilds/{guild_id}/roles/{role_id}", guild_id=1, role_id=2)
+    cache.add(role_route, None, ForbiddenError({"code": 50013, "message": "Missing Permissions"}, None, status=403))
+    cache.add(Route("GET", "/channels/{channel_id}", channel_id=3), None, _not_found())
+
+    cache.invalidate(2)
+    cache.check(role_route, None)
+    assert len(cache) == 1
+    assert cache._by_snowflake.keys() == {"3"}, "Index of removed entries was not cleaned up"
+
+
+@mark.asyncio
+async def test_on_dispatch() -> None:
+    cache = NegativeCache()
+    role_route = Route("PATCH", "/guilds/{guild_id}/roles/{role_id}", guild_id=1, role_id=2)
+    channel_route = Route("GET", "/channels/{channel_id}", channel_id=3)
+    cache.add(role_route, None, _not_found())
+    cache.add(channel_route, None, _not_found())
+
+    # Busy events can not change access, so they should not flush the cache.
+    await cache.on_dispatch("MESSAGE_CREATE", {"id": "2", "channel_id": "3", "guild_id": "1"})
+    await cache.on_dispatch("TYPING_START", {"channel_id": "3", "guild_id": "1"})
+    assert len(cache) == 2
+
+    await cache.on_dispatch("GUILD_ROLE_UPDATE", {"guild_id": "10", "role": {"id": "2"}})
+    cache.check(role_route, None)
+
+    await cache.on_dispatch("CHANNEL_CREATE", {"id": "3", "guild_id": "10"})
+    cache.check(channel_route, None)
+    assert len(cache) == 0
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from io import StringIO
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from pytest import mark
+
+from nextcore.common import UNDEFINED
+from nextcore.http import BotAuthentication, HTTPClient, Paginator
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tests.utils import ServeApp
+
+
+def _pages(total: int, requested: list[tuple[Any, int]]):
+    # Items are {"id": 1} to {"id": total}, paginated forwards.
+    async def fetch(cursor: Any, limit: int) -> tuple[list[dict[str, int]], int | None]:
+        requested.append((cursor, limit))
+        start = 0 if cursor is UNDEFINED else cursor
+        await asyncio.sleep(0.01)
+        page = [{"id": item_id} for item_id in range(start + 1, min(start + limit, total) + 1)]
+        return page, Paginator.snowflake_cursor(page, limit, forwards=True)
+
+    return fetch
+
+
+@mark.asyncio
+async def test_every_item() -> None:
+    requested: list[tuple[Any, int]] = []
+    items = [item["id"] async for item in Paginator(_pages(25, requested), page_size=10)]
+
+    assert items == list(range(1, 26))
+    assert requested == [(UNDEFINED, 10), (10, 10), (20, 10)]
+
+
+@mark.asyncio
+async def test_max_items() -> None:
+    requested: list[tuple[Any, int]] = []
+    items = [item["id"] async for item in Paginator(_pages(100, requested), page_size=10, max_items=15)]
+
+    assert items == list(range(1, 16))
+    assert requested == [(UNDEFINED, 10), (10, 5)], "The last page should only request the items left"
+
+
+@mark.asyncio
+@mark.parametrize("max_items", [0, -1])
+async def test_no_items(max_items: int) -> None:
+    requested: list[tuple[Any, int]] = []
+    items = [item async for item in Paginator(_pages(100, requested), page_size=10, max_items=max_items)]
+
+    assert items == []
+    assert requested == [], "Nothing should be requested"
+
+
+@mark.asyncio
+async def test_prefetches_next_page() -> None:
+    requested: list[tuple[Any, int]] = []
+    paginator = Paginator(_pages(100, requested), page_size=10).__aiter__()
+
+    await paginator.__anext__()
+    await asyncio.sleep(0)
+    assert len(requested) == 2, "The next page should be requested while the first is used"
+
+    await paginator.aclose()
+
+    requested.clear()
+    paginator = Paginator(_pages(100, requested), page_size=10, prefetch=False).__aiter__()
+    await paginator.__anext__()
+    await asyncio.sleep(0)
+    assert len(requested) == 1
+    await paginator.aclose()
+
+
+@mark.asyncio
+async def test_write_ndjson() -> None:
+    file = StringIO()
+
+    written = await Paginator(_pages(3, []), page_size=2).write_ndjson(file)
+
+    assert written == 3
+    assert [json.loads(line) for line in file.getvalue().splitlines()] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_snowflake_cursor() -> None:
+    page = [{"user": {"id": "3"}}, {"user": {"id": "1"}}, {"user": {"id": "2"}}]
+
+    assert Paginator.snowflake_cursor(page, 3, forwards=True, key="user") == 3
+    assert Paginator.snowflake_cursor(page, 3, forwards=False, key="user") == 1
+    assert Paginator.snowflake_cursor(page, 4, forwards=True, key="user") is None, "A short page is the last page"
+
+
+@mark.asyncio
+async def test_iter_guild_members(serve: ServeApp) -> None:
+    async def handle(request: web.Request) -> web.Response:
+        after = int(request.query["after"]) if "after" in request.query else 0
+        limit = int(request.query["limit"])
+        members = [{"user": {"id": str(user_id)}} for user_id in range(after + 1, min(after + limit, 5) + 1)]
+        return web.json_response(members)
+
+    app = web.Application()
+    app.router.add_get("/guilds/{guild_id}/members", handle)
+    await serve(app)
+
+    http_client = HTTPClient()
+    await http_client.setup()
+    try:
+        members = http_client.iter_guild_members(BotAuthentication("token"), 1, page_size=2)
+        assert [member["user"]["id"] async for member in members] == ["1", "2", "3", "4", "5"]
+    finally:
+        await http_client.close()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pytest import approx, raises
+
+from nextcore.http import HTTPClient, QoSClass
+
+
+def test_invalid_reserved() -> None:
+    with raises(ValueError):
+        QoSClass("critical", reserved=1)
+    with raises(ValueError):
+        QoSClass("critical", reserved=-0.1)
+
+
+def test_record_latency() -> None:
+    qos = QoSClass("bulk")
+    assert qos.average_latency == 0
+
+    qos.record(1)
+    qos.record(3)
+
+    assert qos.requests == 2
+    assert qos.average_latency == approx(2)
+    assert qos.max_latency == approx(3)
+
+
+def test_active() -> None:
+    assert QoSClass("critical").active(100), "The share should be reserved by default"
+
+    qos = QoSClass("critical", idle_after=10)
+    assert not qos.active(100), "A class that never made a request should lend out its share"
+
+    qos.last_request_at = 95
+    assert qos.active(100)
+    assert not qos.active(105)
+
+
+def test_client_rejects_overbooked_classes() -> None:
+    with raises(ValueError):
+        HTTPClient(qos_classes=[QoSClass("a", reserved=0.5), QoSClass("b", reserved=0.5)])
+
+
+def test_client_holds_back_active_classes() -> None:
+    critical = QoSClass("critical", priority=-10, reserved=0.2)
+    moderation = QoSClass("moderation", priority=-5, reserved=0.1, idle_after=60)
+    client = HTTPClient(qos_classes=[moderation, critical])
+
+    assert client.qos_classes == (critical, moderation)
+    assert client._held_back(0) == approx(0.2), "Only classes with idle_after should lend out their share when idle"
+
+    moderation.last_request_at = float("inf")
+    assert client._held_back(0) == approx(0.3)
+    assert client._held_back(-5) == approx(0.2), "A class can use its own share"
+    assert client._held_back(-10) == 0
@@ -1,5 +1,7 @@
-import gc
-import sys
+from __future__ import annotations
+
+import asyncio
+from typing import Hashable
 
 from pytest import mark
 
@@ -7,23 +9,29 @@ from nextcore.http import Bucket, BucketMetadata
 from nextcore.http.rate_limit_storage import RateLimitStorage
 
 
-# Garbage collection
+# Eviction
 @mark.asyncio
-async def test_does_gc_collect_unused_buckets() -> None:
-    storage = RateLimitStorage()
+async def test_evicts_idle_buckets() -> None:
+    storage = RateLimitStorage(bucket_ttl=0)
 
     metadata = BucketMetadata()
     bucket = Bucket(metadata)
 
     await storage.store_bucket_by_nextcore_id(1, bucket)
-    gc.collect()
+    await storage.store_bucket_by_discord_id("1", bucket)
+    del bucket
+    assert storage.evict() == 1, "Bucket was not evicted"
 
-    assert await storage.get_bucket_by_nextcore_id(1) is None, "Bucket was not collected"
+    assert await storage.get_bucket_by_nextcore_id(1) is None, "Bucket was not evicted"
+    assert await storage.get_bucket_by_discord_id("1") is None, "Discord id was not cleaned up"
+    assert storage.evicted_buckets == 1
+
+    await storage.close()
 
 
 @mark.asyncio
-async def test_does_not_collect_dirty_buckets() -> None:
-    storage = RateLimitStorage()
+async def test_does_not_evict_dirty_buckets() -> None:
+    storage = RateLimitStorage(bucket_ttl=0)
 
     metadata = BucketMetadata()
     bucket = Bucket(metadata)
@@ -31,23 +39,42 @@ async def test_does_not_collect_dirty_buckets() -> None:
     await bucket.update(0, 1)
 
     await storage.store_bucket_by_nextcore_id(1, bucket)
-    gc.collect()
+    storage.evict()
 
-    assert await storage.get_bucket_by_nextcore_id(1) is not None, "Bucket should not be collected"
+    assert await storage.get_bucket_by_nextcore_id(1) is not None, "Bucket should not be evicted"
+
+    await storage.close()
 
 
 @mark.asyncio
-async def test_cleans_up_gc_hook() -> None:
-    storage = RateLimitStorage()
+async def test_evicts_least_recently_used() -> None:
+    storage = RateLimitStorage(max_buckets=2, max_metadata=1)
+
+    for nextcore_id in range(3):
+        await storage.store_bucket_by_nextcore_id(nextcore_id, Bucket(BucketMetadata()))
+    await storage.get_bucket_by_nextcore_id(0)
+    await storage.store_metadata("/first", BucketMetadata())
+    await storage.store_metadata("/second", BucketMetadata())
 
-    before_callbacks_length = len(gc.callbacks)
+    assert storage.evict() == 1
+    assert await storage.get_bucket_by_nextcore_id(1) is None, "Least recently used bucket was not evicted"
+    assert await storage.get_bucket_by_nextcore_id(0) is not None, "Recently used bucket was evicted"
+    assert await storage.get_bucket_metadata("/first") is None, "Metadata was not evicted"
+    assert storage.evicted_metadata == 1
 
-    # Run the garbage collector
     await storage.close()
 
-    # Check that the hook was removed
-    print(gc.callbacks)
-    assert len(gc.callbacks) == before_callbacks_length - 1, "Hook was not removed"
+
+@mark.asyncio
+async def test_eviction_timer() -> None:
+    storage = RateLimitStorage(bucket_ttl=0, eviction_interval=0.01)
+
+    await storage.store_bucket_by_nextcore_id(1, Bucket(BucketMetadata()))
+    await asyncio.sleep(0.05)
+
+    assert storage.evicted_buckets == 1, "Eviction did not run"
+
+    await storage.close()
 
 
 # Getting and storing buckets
@@ -75,3 +102,80 @@ async def test_stores_and_get_discord_id() -> None:
 
     await storage.store_bucket_by_discord_id("1", bucket)
     assert await storage.get_bucket_by_discord_id("1") is bucket, "Bucket was not stored"
+
+
+# Synchronous lookups
+def test_stores_and_get_nowait() -> None:
+    storage = RateLimitStorage()
+
+    metadata = BucketMetadata()
+    bucket = Bucket(metadata)
+
+    assert storage.supports_nowait, "The in-memory storage should support nowait lookups"
+
+    storage.store_bucket_by_nextcore_id_nowait(1, bucket)
+    storage.store_bucket_by_discord_id_nowait("1", bucket)
+    storage.store_metadata_nowait("/example", metadata)
+
+    assert storage.get_bucket_by_nextcore_id_nowait(1) is bucket, "Bucket was not stored"
+    assert storage.get_bucket_by_discord_id_nowait("1") is bucket, "Bucket was not stored"
+    assert storage.get_bucket_metadata_nowait("/example") is metadata, "Metadata was not stored"
+
+
+def test_subclass_without_nowait_methods() -> None:
+    class AsyncStorage(RateLimitStorage):
+        async def get_bucket_by_nextcore_id(self, nextcore_id: Hashable) -> Bucket | None:
+            return None
+
+    class NowaitStorage(AsyncStorage):
+        supports_nowait = True
+
+    assert not AsyncStorage.supports_nowait, "Overriding a async method should disable nowait lookups"
+    assert NowaitStorage.supports_nowait, "Explicitly enabling nowait lookups was ignored"
+
+
+@mark.asyncio
+async def test_keeps_metadata_used_by_buckets() -> None:
+    storage = RateLimitStorage(max_metadata=1)
+
+    used = BucketMetadata(limit=5, bucket_hash="abc")
+    await storage.store_metadata("/used", used)
+    await storage.store_bucket_by_nextcore_id(1, Bucket(used))
+    await storage.store_metadata("/unused", BucketMetadata())
+
+    storage.evict()
+    assert await storage.get_bucket_metadata("/used") is used, "Metadata of a stored bucket was evicted"
+    assert await storage.get_bucket_metadata("/unused") is None
+    assert storage.evicted_metadata == 1
+
+    await storage.close()
+
+
+@mark.asyncio
+async def test_metadata_eviction_is_batched() -> None:
+    storage = RateLimitStorage(max_metadata=0, eviction_batch=2)
+
+    for i in range(5):
+        await storage.store_metadata(f"/{i}", BucketMetadata())
+
+    storage.evict()
+    assert storage.evicted_metadata == 2, "Evicted more metadata than eviction_batch"
+
+    await storage.close()
+
+
+@mark.asyncio
+async def test_evicts_metadata_once_buckets_are_gone() -> None:
+    storage = RateLimitStorage(max_metadata=0, bucket_ttl=0)
+
+    metadata = BucketMetadata(limit=5)
+    await storage.store_metadata("/example", metadata)
+    await storage.store_bucket_by_nextcore_id(1, Bucket(metadata))
+    # Linking replaces the bucket with one using other metadata
+    await storage.store_bucket_by_nextcore_id(2, Bucket(metadata))
+    await storage.store_bucket_by_nextcore_id(2, Bucket(BucketMetadata()))
+
+    storage.evict()
+    assert await storage.get_bucket_metadata("/example") is None, "Metadata should be evicted with its buckets"
+
+    await storage.close()
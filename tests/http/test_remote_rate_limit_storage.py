@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+from pytest import mark
+
+from nextcore.http import BucketMetadata, RateLimitStorageServer, RemoteRateLimitStorage
+from tests.utils import match_time
+
+
+@mark.asyncio
+@match_time(0.2, 0.1)
+async def test_buckets_are_shared() -> None:
+    server = RateLimitStorageServer()
+    await server.start()
+
+    workers = [RemoteRateLimitStorage("127.0.0.1", server.port) for _ in range(2)]
+    try:
+        await workers[0].store_metadata("/example", BucketMetadata(limit=1))
+
+        for i in range(3):
+            storage = workers[i % 2]
+            bucket = await storage.get_bucket_by_nextcore_id("GET/example")
+            assert bucket is not None
+
+            async with bucket.acquire():
+                await bucket.update(0, 0.1)
+    finally:
+        for storage in workers:
+            await storage.close()
+        await server.close()
+
+
+@mark.asyncio
+@match_time(1, 0.15)
+async def test_global_rate_limit_is_shared() -> None:
+    server = RateLimitStorageServer(global_limit=2)
+    await server.start()
+
+    workers = [RemoteRateLimitStorage("127.0.0.1", server.port, lease_size=1) for _ in range(2)]
+    try:
+        for i in range(4):
+            async with workers[i % 2].global_rate_limiter.acquire():
+                ...
+    finally:
+        for storage in workers:
+            await storage.close()
+        await server.close()
+
+
+@mark.asyncio
+@match_time(0.2, 0.1)
+async def test_links_buckets_by_discord_id() -> None:
+    server = RateLimitStorageServer()
+    await server.start()
+
+    first = RemoteRateLimitStorage("127.0.0.1", server.port)
+    second = RemoteRateLimitStorage("127.0.0.1", server.port)
+    try:
+        # Mirrors what HTTPClient._update_bucket does
+        bucket = await first.get_bucket_by_nextcore_id("GET/first")
+        assert bucket is not None
+        async with bucket.acquire():
+            await bucket.update(0, 0.2)
+            linked_bucket = await first.get_bucket_by_discord_id("hash")
+            assert linked_bucket is not None
+            await first.store_bucket_by_nextcore_id("GET/first", linked_bucket)
+
+        linked_bucket = await second.get_bucket_by_discord_id("hash")
+        assert linked_bucket is not None
+        await second.store_bucket_by_nextcore_id("GET/second", linked_bucket)
+
+        # This should now wait for the first bucket to reset
+        bucket = await second.get_bucket_by_nextcore_id("GET/second")
+        assert bucket is not None
+        async with bucket.acquire():
+            ...
+    finally:
+        await first.close()
+        await second.close()
+        await server.close()
+
+
+@mark.asyncio
+async def test_malformed_messages_keep_the_connection() -> None:
+    server = RateLimitStorageServer()
+    await server.start()
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    try:
+        writer.write(b'{"op": "hello", "namespace": "test"}\n')
+        writer.write(b'{"op": "acquire", "id": 1, "bucket": ["nextcore", "a", null], "priority": 0, "wait": true}\n')
+        writer.write(b"not json\n")
+        writer.write(b'{"op": "acquire", "id": 2}\n')
+        writer.write(b'{"op": "update", "bucket": ["nextcore", "a", null]}\n')
+        writer.write(b'{"op": "get_metadata", "id": 3, "route": "/example"}\n')
+        await writer.drain()
+
+        replies = [json.loads(await asyncio.wait_for(reader.readline(), 1)) for _ in range(4)]
+        assert {"id": None, "error": "invalid_message"} in replies
+        assert {"id": 2, "error": "invalid_message"} in replies
+        assert {"id": 3, "result": None} in replies, "The connection should be usable after a malformed message"
+        assert any(reply["id"] == 1 and "result" in reply for reply in replies)
+    finally:
+        writer.close()
+        await server.close()
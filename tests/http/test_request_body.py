@@ -0,0 +1,47 @@
+from io import BytesIO, StringIO
+
+from nextcore.http import File, RequestBody
+
+
+def test_json() -> None:
+    body = RequestBody.json({"content": "hi"})
+
+    assert body.content_type == "application/json"
+    assert body.data.replace(b" ", b"") == b'{"content":"hi"}'
+
+
+def test_multipart_reads_files_once() -> None:
+    stream = BytesIO(b"binary")
+    body = RequestBody.multipart(
+        {"content": "hi"},
+        [
+            ("file[0]", File("a.txt", stream)),
+            ("file[1]", File('b"c.txt', StringIO("text"))),
+            ("file[2]", File("d", b"x")),
+        ],
+    )
+
+    boundary = body.content_type.split("boundary=")[1]
+    assert body.content_type.startswith("multipart/form-data")
+    assert body.data.endswith(f"--{boundary}--\r\n".encode())
+    assert body.data.count(f"--{boundary}\r\n".encode()) == 4
+    assert b'name="payload_json"' in body.data
+    assert b'name="file[0]"; filename="a.txt"\r\nContent-Type: text/plain\r\n\r\nbinary\r\n' in body.data
+    assert b'filename="b%22c.txt"' in body.data
+    assert b"\r\n\r\ntext\r\n" in body.data
+    assert stream.read() == b"", "The file was not read"
+
+
+def test_multipart_content_types() -> None:
+    body = RequestBody.multipart(
+        {},
+        [
+            ("file[0]", File("cat.png", b"png")),
+            ("file[1]", File("unknown", b"x")),
+            ("file[2]", File("cat.png", b"webp", content_type="image/webp")),
+        ],
+    )
+
+    assert b'filename="cat.png"\r\nContent-Type: image/png\r\n\r\npng' in body.data
+    assert b'filename="unknown"\r\nContent-Type: application/octet-stream\r\n' in body.data
+    assert b"Content-Type: image/webp\r\n\r\nwebp" in body.data
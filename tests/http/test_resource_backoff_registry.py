@@ -0,0 +1,41 @@
+from pytest import approx
+
+from nextcore.http import ResourceBackoffRegistry
+
+
+def test_unknown_resource_has_no_delay() -> None:
+    registry = ResourceBackoffRegistry()
+
+    assert registry.delay("/channels/1") == 0
+    assert registry.strikes("/channels/1") == 0
+    assert not registry
+
+
+def test_backoff_grows_with_strikes() -> None:
+    registry = ResourceBackoffRegistry(base_delay=1, max_delay=3)
+
+    assert registry.record("/channels/1", 0.1) == approx(1)
+    assert registry.record("/channels/1", 0.1) == approx(2, rel=0.01)
+    assert registry.record("/channels/1", 0.1) == approx(3), "max_delay was not respected"
+    assert registry.record("/channels/1", 10) == 10, "retry_after was not respected"
+    assert registry.delay("/channels/1") == approx(10, rel=0.01)
+    assert registry.delay("/channels/2") == 0
+
+
+def test_strikes_decay() -> None:
+    registry = ResourceBackoffRegistry(half_life=10)
+
+    registry.record("/channels/1", 0)
+    registry._resources["/channels/1"].last_strike -= 10  # Pretend it was one half life ago
+
+    assert registry.strikes("/channels/1") == approx(0.5, rel=0.01)
+
+
+def test_max_entries() -> None:
+    registry = ResourceBackoffRegistry(max_entries=2)
+
+    for channel_id in range(3):
+        registry.record(f"/channels/{channel_id}", 1)
+
+    assert len(registry) == 2
+    assert registry.delay("/channels/0") == 0, "The oldest resource was not forgotten"
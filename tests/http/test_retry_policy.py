@@ -0,0 +1,51 @@
+from asyncio import TimeoutError as AsyncioTimeoutError
+from unittest.mock import Mock
+
+from aiohttp import ClientConnectionError
+from pytest import mark
+
+from nextcore.http import RetryPolicy
+from nextcore.http.errors import BadRequestError, InternalServerError
+
+
+def _status_error(error_type: type, status: int) -> Exception:
+    return error_type({"code": 0, "message": "Error"}, Mock(status=status))  # type: ignore [no-any-return]
+
+
+@mark.parametrize(
+    ("error", "expected"),
+    [
+        (_status_error(InternalServerError, 503), True),
+        (_status_error(InternalServerError, 501), False),
+        (_status_error(BadRequestError, 400), False),
+        (ClientConnectionError(), True),
+        (AsyncioTimeoutError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_retries_errors(error: Exception, expected: bool) -> None:
+    assert RetryPolicy().should_retry("GET", error, 0) is expected
+
+
+def test_only_idempotent_requests() -> None:
+    policy = RetryPolicy()
+    error = ClientConnectionError()
+
+    assert not policy.should_retry("POST", error, 0)
+    assert policy.should_retry("POST", error, 0, idempotent=True)
+    assert not policy.should_retry("GET", error, 0, idempotent=False)
+
+
+def test_retry_budget() -> None:
+    policy = RetryPolicy(max_retries=2)
+    error = ClientConnectionError()
+
+    assert policy.should_retry("GET", error, 1)
+    assert not policy.should_retry("GET", error, 2)
+
+
+def test_delay_is_capped() -> None:
+    policy = RetryPolicy(base_delay=1, max_delay=3)
+
+    for retries in range(10):
+        assert 0 <= policy.delay(retries) <= min(2**retries, 3)
@@ -20,3 +20,41 @@ def test_major_params():
     r2 = Route("GET", "/example/{guild_id}", guild_id=4)
 
     assert r1.bucket != r2.bucket, "Ignored major params"
+
+
+def test_path_formatting():
+    route = Route("GET", "/channels/{channel_id}/messages/{message_id}", channel_id=1, message_id=2)
+
+    assert route.path == "/channels/1/messages/2", "Path was not formatted"
+    assert route.route == "/channels/{channel_id}/messages/{message_id}", "Route template was changed"
+
+
+def test_path_formatting_escapes():
+    route = Route("GET", "/example/{{literal}}/100%/{value}", value="a b")
+
+    assert route.path == "/example/{literal}/100%/a b", "Path was formatted differently than str.format"
+
+
+def test_path_formatting_fallback():
+    route = Route("GET", "/example/{value!r}", value="a")  # type: ignore [arg-type]
+
+    assert route.path == "/example/'a'", "Path was formatted differently than str.format"
+
+
+def test_bucket_shares_route_strings():
+    route = Route("POST", "/webhooks/{webhook_id}/{webhook_token}", webhook_id=1, webhook_token="token")
+
+    assert route.bucket == ("POST", "/webhooks/{webhook_id}/{webhook_token}", None, None, "1", "token")
+    assert route.bucket[1] is route.route, "Bucket should reference the route template, not a copy"
+
+
+def test_major_params_int_and_str():
+    r1 = Route("GET", "/channels/{channel_id}", channel_id=1)
+    r2 = Route("GET", "/channels/{channel_id}", channel_id="1")
+
+    assert r1.bucket == r2.bucket, "An int and a str ID should map to the same bucket"
+
+
+def test_guild_id():
+    assert Route("GET", "/guilds/{guild_id}", guild_id=1).guild_id == "1"
+    assert Route("GET", "/channels/{channel_id}", channel_id=1).guild_id is None
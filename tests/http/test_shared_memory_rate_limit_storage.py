@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+from tempfile import mkdtemp
+
+from pytest import mark, raises
+
+from nextcore.common.errors import RateLimitedError
+from nextcore.http import BucketMetadata, SharedMemoryRateLimitStorage
+from tests.utils import match_time
+
+
+def temporary_path() -> str:
+    return os.path.join(mkdtemp(), "rate-limits")
+
+
+@mark.asyncio
+@match_time(0.2, 0.1)
+async def test_buckets_are_shared() -> None:
+    path = temporary_path()
+    workers = [SharedMemoryRateLimitStorage(path, bucket_slots=64) for _ in range(2)]
+    await workers[0].store_metadata("/example", BucketMetadata(limit=1))
+
+    for i in range(3):
+        storage = workers[i % 2]
+        bucket = await storage.get_bucket_by_nextcore_id("GET/example")
+        assert bucket is not None
+
+        async with bucket.acquire():
+            await bucket.update(0, 0.1)
+
+    for storage in workers:
+        await storage.close()
+
+
+@mark.asyncio
+@match_time(1, 0.15)
+async def test_global_rate_limit_is_shared() -> None:
+    path = temporary_path()
+    workers = [SharedMemoryRateLimitStorage(path, global_limit=2) for _ in range(2)]
+
+    for i in range(4):
+        async with workers[i % 2].global_rate_limiter.acquire():
+            ...
+
+    for storage in workers:
+        await storage.close()
+
+
+@mark.asyncio
+@match_time(0.2, 0.1)
+async def test_links_buckets_by_discord_id() -> None:
+    path = temporary_path()
+    first = SharedMemoryRateLimitStorage(path)
+    second = SharedMemoryRateLimitStorage(path)
+
+    # Mirrors what HTTPClient._update_bucket does
+    bucket = await first.get_bucket_by_nextcore_id("GET/first")
+    assert bucket is not None
+    async with bucket.acquire():
+        await bucket.update(0, 0.2)
+        linked_bucket = await first.get_bucket_by_discord_id("hash")
+        assert linked_bucket is not None
+        await first.store_bucket_by_nextcore_id("GET/first", linked_bucket)
+
+    linked_bucket = await second.get_bucket_by_discord_id("hash")
+    assert linked_bucket is not None
+    await second.store_bucket_by_nextcore_id("GET/second", linked_bucket)
+
+    # This should now wait for the first bucket to reset
+    bucket = await second.get_bucket_by_nextcore_id("GET/second")
+    assert bucket is not None
+    async with bucket.acquire():
+        ...
+
+    await first.close()
+    await second.close()
+
+
+def test_layout_mismatch(tmp_path: Path) -> None:
+    path = str(tmp_path / "rate-limits")
+    SharedMemoryRateLimitStorage(path, bucket_slots=64)
+
+    with raises(ValueError):
+        SharedMemoryRateLimitStorage(path, bucket_slots=128)
+
+
+@mark.skipif(sys.platform == "win32", reason="Requires fork")
+@mark.asyncio
+async def test_shared_after_fork(tmp_path: Path) -> None:
+    storage = SharedMemoryRateLimitStorage(str(tmp_path / "rate-limits"), global_limit=2)
+
+    async def use_global() -> None:
+        for _ in range(2):
+            async with storage.global_rate_limiter.acquire(wait=False):
+                ...
+
+    pid = os.fork()
+    if pid == 0:
+        # Child, use up the global rate limit
+        try:
+            asyncio.new_event_loop().run_until_complete(use_global())
+        finally:
+            os._exit(0)
+
+    os.waitpid(pid, 0)
+
+    with raises(RateLimitedError):
+        async with storage.global_rate_limiter.acquire(wait=False):
+            ...
+    await storage.close()
@@ -5,12 +5,16 @@ from time import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Callable
+    from typing import Any, Awaitable, Callable
 
-    from typing_extensions import ParamSpec
+    from aiohttp import web
+    from typing_extensions import ParamSpec, TypeAlias
 
     P = ParamSpec("P")
 
+    # The serve fixture from conftest.py
+    ServeApp: TypeAlias = Callable[[web.Application], Awaitable[None]]
+
 
 def match_time(estimated: float, max_offset: float):
     """Errror if the estimated time is off"""